@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# Copyright (C) Free Software Foundation, Inc. All rights reserved.
+# Licensed under the AGPL-3.0-only License. See LICENSE in the project root
+# for license information.
+
+"""
+Benchmark String.is_in_contain against the per-row check_is_in_contain path.
+
+Usage: PYTHONPATH=. python benchmarks/is_in_contain.py [rows]
+"""
+
+import random
+import string
+import sys
+from timeit import default_timer
+
+import pandas as pd
+
+from datasae.string import String
+
+
+def row_by_row(keywords: list, data: pd.Series) -> list:
+    """Evaluate every row with the scalar check_is_in_contain method."""
+    return [
+        bool(String.check_is_in_contain(keywords, str_data)[0])
+        for str_data in data
+    ]
+
+
+def main(rows: int = 20000):
+    """Print the timings of both paths for growing keyword lists."""
+    random.seed(0)
+    words = [
+        ''.join(random.choices(string.ascii_lowercase, k=random.randint(4, 9)))
+        for _ in range(20000)
+    ]
+    data = pd.Series(
+        [' '.join(random.choices(words, k=8)) for _ in range(rows)]
+    )
+    dataFrame = pd.DataFrame({'column': data})
+
+    print(f'{"keywords":>8} {"row by row":>12} {"is_in_contain":>14}')
+
+    for size in (1, 10, 64, 100, 1000, 3000):
+        keywords = [word[1:] for word in random.sample(words, size)]
+
+        start = default_timer()
+        expected = row_by_row(keywords, data)
+        row_by_row_time = default_timer() - start
+
+        start = default_timer()
+        result = String(dataFrame).is_in_contain(keywords, 'column')
+        is_in_contain_time = default_timer() - start
+
+        assert result['valid'] == sum(expected)
+        assert set(result['warning']) == {
+            index for index, valid in enumerate(expected) if not valid
+        }
+        print(
+            f'{size:>8} {row_by_row_time:>11.3f}s',
+            f'{is_in_contain_time:>13.3f}s'
+        )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
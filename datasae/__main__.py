@@ -16,6 +16,8 @@ The "checker" command takes the following arguments:
 - config_name: Optional. The name of the specific configuration to use.
 - yaml_display: Optional. A flag to determine whether to display the results
     in YAML format or JSON format.
+- jobs: Optional. The number of threads that run the data sources and their
+    checkers concurrently.
 
 The "checker" command uses the Config class from the "converter" module to
 load the configuration file and retrieve the checker results. It then prints
@@ -27,7 +29,7 @@ arguments.
 
 Example usage:
 datasae data.json --yaml-display --config-name some_config_name
-datasae data.yaml --json-display
+datasae data.yaml --json-display --jobs 8
 """
 
 import json
@@ -59,7 +61,14 @@ def checker(
         bool,
         Option('--yaml-display/--json-display')
     ] = True,
-    save_to_file_path: str = None
+    save_to_file_path: str = None,
+    jobs: Annotated[
+        int,
+        Option(
+            help='The number of threads that run the data sources and their '
+            'checkers concurrently'
+        )
+    ] = None
 ):
     """
     Checker command.
@@ -69,8 +78,8 @@ def checker(
     """
     config: Config = Config(file_path)
     result: list[dict] | dict = (
-        config(config_name).checker
-        if config_name else config.checker
+        config(config_name).check(jobs)
+        if config_name else config.check(jobs)
     )
 
     if yaml_display:
@@ -6,10 +6,12 @@
 
 """Library data quality for boolean type."""
 
+from __future__ import annotations
+
+import numpy as np
 import pandas as pd
 
-from .exception import InvalidDataTypeWarning
-from .utils import Basic, create_warning_data, WarningDataMessage
+from .utils import Basic
 
 
 class WarningDataDetailMessage:
@@ -30,6 +32,8 @@ class WarningDataDetailMessage:
 class Boolean(Basic):
     """Data Quality class for boolean type."""
 
+    data_type: type = bool
+
     def __init__(self, dataFrame: pd.DataFrame):
         """
         Instance initialitzation of the Integer class.
@@ -69,6 +73,31 @@ class Boolean(Basic):
 
         return valid, invalid, warning_data
 
+    @staticmethod
+    def dtype_type_mask(data: pd.Series) -> bool | np.ndarray | None:
+        """
+        dtype_type_mask method.
+
+        Decides from the dtype which values of a column are booleans.
+
+        Args:
+            data (pd.Series): The column to be checked.
+
+        Returns:
+            bool | np.ndarray | None: True if every value is a boolean, False
+                if none is, a boolean mask if only missing values are not, or
+                None if the values have to be inspected.
+        """
+        if pd.api.types.is_extension_array_dtype(data.dtype):
+            if pd.api.types.is_bool_dtype(data.dtype):
+                return data.notna().to_numpy()
+        elif pd.api.types.is_bool_dtype(data.dtype):
+            return True
+        elif data.dtype.kind in 'iufcmM':
+            return False
+
+        return None
+
     def is_bool(self, column: str) -> dict:
         """
         Checker method for boolean type data.
@@ -84,36 +113,19 @@ class Boolean(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, bool_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(bool_data, (bool)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_bool(
-                    bool_data
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                # if warning_data != {}:
-                #     warning[index] = InvalidDataValueWarning(
-                #         warning_data
-                #     ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    bool_data,
-                    WarningDataDetailMessage.BOOLEAN_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        data: pd.Series = self.dataFrame[column]
+
+        if self.is_typed(column):
+            # The dtype already guarantees every value is a boolean.
+            return self.response(len(data), 0, {})
+
+        return self.mask_response(
+            data,
+            self.type_mask(column),
+            np.ones(len(data), dtype=bool),
+            None,
+            WarningDataDetailMessage.BOOLEAN_DATA_TYPE
+        )
 
     @staticmethod
     def check_is_in(bool_data, is_in: list):
@@ -167,33 +179,12 @@ class Boolean(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, bool_data in enumerate(self.dataFrame[column]):
-            try:
-                if bool_data not in is_in:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_is_in(
-                    bool_data, is_in
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                # if warning_data != {}:
-                #     warning[index] = InvalidDataValueWarning(
-                #         warning_data
-                #     ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    bool_data,
-                    WarningDataDetailMessage.DEFINED_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        data: pd.Series = self.dataFrame[column]
+
+        return self.mask_response(
+            data,
+            data.isin(is_in).to_numpy(),
+            np.ones(len(data), dtype=bool),
+            None,
+            WarningDataDetailMessage.DEFINED_DATA_TYPE
+        )
@@ -12,220 +12,1801 @@ data source configurations from a JSON or YAML file.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+import asyncio
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait
+)
+from contextlib import ExitStack, nullcontext
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
 from enum import Enum
+import inspect
 from io import BytesIO, StringIO
 import logging
 import json
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from pydoc import locate
-from typing import Any, Callable
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar
 import warnings
 
 import pandas as pd
 import yaml
 
+try:
+    import pyarrow as pa
+except ModuleNotFoundError:  # pragma: no cover
+    pa = None  # pragma: no cover
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # pragma: no cover
+
 from ..boolean import Boolean
+from ..exception import DataSourceError
 from ..float import Float
 from ..integer import Integer
 from ..string import String
 from ..timestamp import Timestamp
+from ..utils import (
+    apply_warning_options,
+    Basic,
+    ChunkedResult,
+    locate_type,
+    rule_arguments,
+    WARNING_OPTIONS
+)
+
+# The maximum number of loaded DataFrames a run keeps for reuse by other
+# checkers, see `LoadCache`.
+LOAD_CACHE_SIZE: int = 8
+
+# Below this many rows the rules of a checker run in the calling process,
+# where the overhead of a process pool would dominate, see `ColumnPool`.
+PROCESS_MIN_ROWS: int = 100_000
+
+
+@lru_cache(maxsize=None)
+def accepts_projection(data_source_class: type) -> bool:
+    """
+    Check if a data source accepts the `projection` of a checker.
+
+    Only a parameter named `projection` counts: a data source that merely
+    forwards `**kwargs`, e.g. to its connection, might not understand it.
+    Custom data sources without one keep loading every column.
+
+    Args:
+        data_source_class (type): The class of the data source.
+
+    Returns:
+        bool: True if `projection` can be passed to the data source.
+    """
+    return 'projection' in inspect.signature(
+        data_source_class.__call__
+    ).parameters
+
+
+def raise_errors(errors: dict[str, Exception], results: dict):
+    """
+    Raise the errors of the data sources of a concurrent run, if any.
+
+    A single failed data source raises its own exception, so callers catch
+    the same exception types as when the data sources run one after
+    another. Several failed data sources raise a `DataSourceError`.
+
+    Args:
+        errors (dict[str, Exception]): The error of every failed data source
+            by name.
+        results (dict): The results of the other data sources by name.
+
+    Raises:
+        Exception: The error of the only failed data source.
+        DataSourceError: If several data sources failed, with the errors and
+            the results of the other data sources.
+    """
+    if len(errors) == 1:
+        raise next(iter(errors.values()))
+
+    if errors:
+        raise DataSourceError(errors, results) from next(
+            iter(errors.values())
+        )
+
+
+class CaseInsensitiveEnum(str, Enum):
+    """
+    A case-insensitive enumeration class.
+
+    A case-insensitive enumeration class that allows for case-insensitive
+    comparison of enum values and provides a case-insensitive lookup of enum
+    members.
+    """
+
+    def __eq__(self, __value: str) -> bool:
+        """
+        __eq__ methods.
+
+        Overrides the __eq__ method to perform case-insensitive comparison of
+        enum values.
+
+        Args:
+            __value (str): The value to compare with the enum value.
+
+        Returns:
+            bool: True if the values are equal (case-insensitive), False
+                otherwise.
+        """
+        return super().__eq__(__value.lower() if __value else __value)
+
+    @classmethod
+    def _missing_(cls, value: str) -> CaseInsensitiveEnum:
+        """
+        _missing_ method.
+
+        Overrides the _missing_ method to perform case-insensitive lookup of
+            enum members.
+
+        Args:
+            value (str): The value to lookup in the enum members.
+
+        Returns:
+            CaseInsensitiveEnum: The enum member with the matching value (case-
+                insensitive).
+        """
+        value = value.lower() if value else value
+
+        for member in cls:
+            if member.value.lower() == value:
+                return member
+
+
+class FileType(CaseInsensitiveEnum):
+    """
+    FileType enumeration.
+
+    Represents different types of file formats with case-insensitive
+    comparison and lookup of enum values.
+    """
+
+    CSV = '.csv'
+    JSON = '.json'
+    PARQUET = '.parquet'
+    SQL = '.sql'
+    YAML = '.yaml'
+    YML = '.yml'
+    XLSX = '.xlsx'
+
+
+@dataclass(repr=False)
+class DataSource:
+    """
+    DataSource class.
+
+    A class that converts data of different file types into a Pandas DataFrame.
+    """
+
+    name: str
+    file_path: str
+
+    @property
+    def checker(self) -> list[dict]:
+        """
+        Checker is instance's attribute.
+
+        Creates a list of checker result based on the configuration provided
+        in the checker section of the data source's configuration file. The
+        warnings of every rule can be limited with the `WARNING_OPTIONS`, set
+        on the data source, on a checker or on a rule. Only the configured
+        columns are loaded and checkers that read the same target load it
+        once, see `CheckerPlan.share`. The checkers are compiled
+        on every access, see `Config.compile` to reuse them.
+        """
+        return self.check()
+
+    def check(
+        self,
+        max_workers: int = None,
+        max_processes: int = None,
+        process_min_rows: int = PROCESS_MIN_ROWS
+    ) -> list[dict]:
+        """
+        Check method.
+
+        Creates a list of checker result like `checker`, optionally running
+            the checkers concurrently.
+
+        Args:
+            max_workers (int, optional): The number of threads that run the
+                checkers concurrently. Defaults to None, which runs them one
+                after another.
+            max_processes (int, optional): The number of worker processes
+                that run the rules of the columns, see `ColumnPool`. Defaults
+                to None, which runs them in this process.
+            process_min_rows (int, optional): Data with fewer rows is checked
+                in this process even with `max_processes`. Defaults to
+                PROCESS_MIN_ROWS.
+
+        Returns:
+            list[dict]: The result of every checker in configuration order.
+        """
+        source: SourcePlan = self.compile().sources[self.name]
+
+        with ColumnPool(
+            max_processes, process_min_rows
+        ) if max_processes and max_processes > 1 else nullcontext() as pool:
+            return source(max_workers=max_workers, pool=pool)
+
+    async def acheck(
+        self,
+        executor: Executor = None,
+        max_processes: int = None,
+        process_min_rows: int = PROCESS_MIN_ROWS
+    ) -> list[dict]:
+        """
+        Acheck method.
+
+        Creates a list of checker result like `checker` on the running event
+            loop, see `Plan.acall`.
+
+        Args:
+            executor (Executor, optional): Runs the rules of the checkers.
+                Defaults to None, which is the default executor of the loop.
+            max_processes (int, optional): The number of worker processes
+                that run the rules of the columns, see `ColumnPool`. Defaults
+                to None, which runs them in the executor.
+            process_min_rows (int, optional): Data with fewer rows is checked
+                in the executor even with `max_processes`. Defaults to
+                PROCESS_MIN_ROWS.
+
+        Returns:
+            list[dict]: The result of every checker in configuration order.
+        """
+        return (await self.compile().acall(
+            executor=executor,
+            max_processes=max_processes,
+            process_min_rows=process_min_rows
+        ))[self.name]
+
+    async def acheck_as_completed(
+        self,
+        executor: Executor = None,
+        max_processes: int = None,
+        process_min_rows: int = PROCESS_MIN_ROWS
+    ) -> AsyncIterator[tuple[int, dict]]:
+        """
+        Acheck_as_completed method.
+
+        Yields the result of every checker as soon as it is complete, see
+            `Plan.as_completed`. A failing checker is raised after the
+            results of the others are yielded.
+
+        Args:
+            executor (Executor, optional): Runs the rules of the checkers.
+                Defaults to None, which is the default executor of the loop.
+            max_processes (int, optional): The number of worker processes
+                that run the rules of the columns, see `ColumnPool`. Defaults
+                to None, which runs them in the executor.
+            process_min_rows (int, optional): Data with fewer rows is checked
+                in the executor even with `max_processes`. Defaults to
+                PROCESS_MIN_ROWS.
+
+        Yields:
+            tuple[int, dict]: The position of the checker in the
+                configuration and its result.
+        """
+        async for _, index, result in self.compile().as_completed(
+            executor=executor,
+            max_processes=max_processes,
+            process_min_rows=process_min_rows
+        ):
+            yield index, result
+
+    def compile(self) -> Plan:
+        """
+        Compile method.
+
+        Compiles the checkers of the data source into a reusable plan, see
+            `Config.compile`.
+
+        Returns:
+            Plan: The compiled data source, run it to check it.
+        """
+        config: dict = Config.config(self.file_path)[self.name]
+
+        return Plan(MappingProxyType({
+            self.name: SourcePlan(self, tuple(CheckerPlan.share([
+                (self, CheckerPlan.compile(checker, config))
+                for checker in config.get('checker', [])
+            ])))
+        }))
+
+    @property
+    def connection(self) -> dict:
+        """
+        Return connection to data source.
+
+        Returns:
+            dict: Key-value parameters for connection to datasource.
+        """
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in DataSource.__annotations__.keys()
+        }
+
+    def __call__(
+        self,
+        file_type: FileType,
+        data: bytes | str,
+        *args,
+        projection: list[str] = None,
+        **kwargs
+    ) -> pd.DataFrame | bytes:
+        """
+        __call__ method.
+
+        Converter from various file type into Pandas DataFrame.
+
+        Args:
+            file_type (FileType): _description_
+            data (bytes | str): Data's bytes or sql query needed convert to
+                dataframe.
+            projection (list[str], optional): The only columns to read, as
+                `usecols` of CSV and Excel files or `columns` of Parquet
+                files, unless those are given. Defaults to None, which reads
+                every column.
+
+        Returns:
+            DataFrame | bytes: Pandas DataFrame or bytes if file type not
+                support.
+        """
+        kwargs = self.project(file_type, projection, kwargs)
+
+        if file_type in list(FileType):
+            func: Callable = None
+
+            if file_type is FileType.CSV:
+                func = pd.read_csv
+            elif file_type is FileType.JSON:
+                func = pd.read_json
+            elif file_type is FileType.PARQUET:
+                func = pd.read_parquet
+            elif file_type is FileType.SQL:
+                func = pd.read_sql_query
+            elif file_type is FileType.XLSX:
+                func = pd.read_excel
+
+            if func:
+                with warnings.catch_warnings(record=True):
+                    warnings.simplefilter('always')
+                    if file_type is FileType.SQL:
+                        data = func(data, self.connection, *args, **kwargs)
+                    else:
+                        data = func(
+                            StringIO(data.decode())
+                            if file_type in (FileType.CSV, FileType.JSON)
+                            else BytesIO(data),
+                            *args,
+                            **kwargs
+                        )
+
+        return data
+
+    @staticmethod
+    def project(
+        file_type: FileType, projection: list[str], kwargs: dict
+    ) -> dict:
+        """
+        Project method.
+
+        Pushes a projection down to the reader of a file type, as `usecols`
+            of CSV and Excel files or `columns` of Parquet files, unless those
+            are given.
+
+        Args:
+            file_type (FileType): The file type.
+            projection (list[str]): The only columns to read, or None to read
+                every column.
+            kwargs (dict): The keyword arguments of the reader.
+
+        Returns:
+            dict: The keyword arguments of the reader with the projection.
+        """
+        kwargs = dict(kwargs)
+
+        if projection:
+            if file_type in (FileType.CSV, FileType.XLSX):
+                kwargs.setdefault('usecols', set(projection).__contains__)
+            elif file_type is FileType.PARQUET:
+                kwargs.setdefault('columns', list(projection))
+
+        return kwargs
+
+    def chunks(
+        self, chunksize: int, *args, **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Chunks method.
+
+        Streams data in consecutive chunks of rows, see
+            `CheckerPlan.check_chunks`. Here the data is loaded at once, like
+            calling the data source, and split; data sources that can read
+            in chunks override it, see `Local.chunks` and `Sql.chunks`.
+
+        Args:
+            chunksize (int): The number of rows of every chunk.
+            *args: The positional arguments of the data source.
+            **kwargs: The keyword arguments of the data source.
+
+        Yields:
+            pd.DataFrame: The chunks of the data.
+        """
+        data: pd.DataFrame = self(*args, **kwargs)
+
+        for start in range(0, len(data), chunksize):
+            yield data.iloc[start:start + chunksize]
+
+    async def aload(self, *args, **kwargs) -> pd.DataFrame | bytes:
+        """
+        Aload method.
+
+        Loads data like calling the data source, without blocking the event
+            loop: in a thread of the default executor of the loop. Data
+            sources with an asyncio client override it, see `Sql.aload`.
+
+        Args:
+            *args: The positional arguments of the data source.
+            **kwargs: The keyword arguments of the data source.
+
+        Returns:
+            DataFrame | bytes: The loaded data.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(self, *args, **kwargs)
+        )
+
+
+class LoadCache:
+    """
+    LoadCache class.
+
+    The data loaded during one run, by data source connection and load
+    arguments, so checkers that read the same file, object, sheet or query
+    load it once.
+
+    Memory: with the `uses` of every key, known from a compiled plan, only
+    data that a later checker needs is kept, and it is released as soon as
+    its last checker got it. Besides, at most `max_size` loaded DataFrames
+    stay referenced, the least recently used is released first. A
+    `max_size` of 0 disables the cache.
+
+    Attributes:
+        max_size (int): The maximum number of loaded DataFrames to keep.
+    """
+
+    def __init__(
+        self, max_size: int = LOAD_CACHE_SIZE, uses: Mapping = None
+    ):
+        """
+        __init__ method.
+
+        Initializes an empty cache.
+
+        Args:
+            max_size (int, optional): The maximum number of loaded DataFrames
+                to keep. Defaults to LOAD_CACHE_SIZE.
+            uses (Mapping, optional): The number of checkers of the run that
+                load each key, see `Plan.load_counts`. A key it does not
+                count is loaded once. Defaults to None, which keeps every
+                load until the run ends.
+        """
+        self.max_size = max_size
+        self.__uses: Counter[str] = None if uses is None else Counter(uses)
+        self.__data: OrderedDict[str, pd.DataFrame] = OrderedDict()
+        self.__lock: Lock = Lock()
+        self.__loading: dict[str, Lock] = {}
+        self.__tasks: dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def key(data_source: DataSource, loader: Mapping) -> str:
+        """
+        Key method.
+
+        Identifies a load by the type and connection properties of the data
+            source and the load arguments, but not by the data source name.
+
+        Args:
+            data_source (DataSource): The data source.
+            loader (Mapping): The keyword arguments of the load.
+
+        Returns:
+            str: The key of the load.
+        """
+        return json.dumps(
+            [
+                f'{type(data_source).__module__}.'
+                f'{type(data_source).__qualname__}',
+                DataSource.connection.fget(data_source),
+                dict(loader)
+            ],
+            sort_keys=True,
+            default=repr
+        )
+
+    def __call__(
+        self, data_source: DataSource, loader: Mapping
+    ) -> pd.DataFrame | bytes:
+        """
+        __call__ method.
+
+        Loads data from a data source, or returns it if it is already loaded.
+            It is thread-safe: a thread that needs data another thread is
+            loading waits for it instead of loading it again.
+
+        Args:
+            data_source (DataSource): The data source.
+            loader (Mapping): The keyword arguments of the load.
+
+        Returns:
+            DataFrame | bytes: The loaded data.
+        """
+        key: str = self.key(data_source, loader)
+
+        with self.__lock:
+            loading: Lock = self.__loading.setdefault(key, Lock())
+
+        with loading:
+            with self.__lock:
+                self.__use(key)
+
+                if key in self.__data:
+                    return self.__get(key)
+
+            data: pd.DataFrame | bytes = data_source(**loader)
+
+            with self.__lock:
+                self.__put(key, data)
+                self.__loading.pop(key, None)
+
+        return data
+
+    async def aload(
+        self, data_source: DataSource, loader: Mapping
+    ) -> pd.DataFrame | bytes:
+        """
+        Aload method.
+
+        Loads data from a data source on the running event loop, see
+            `DataSource.aload`, or returns it if it is already loaded. A
+            coroutine that needs data another one is loading awaits the same
+            load instead of loading it again.
+
+        Args:
+            data_source (DataSource): The data source.
+            loader (Mapping): The keyword arguments of the load.
+
+        Returns:
+            DataFrame | bytes: The loaded data.
+        """
+        key: str = self.key(data_source, loader)
+
+        with self.__lock:
+            self.__use(key)
+
+            if key in self.__data:
+                return self.__get(key)
+
+            task: asyncio.Future = self.__tasks.get(key)
+
+            if task is None:
+                task = self.__tasks[key] = asyncio.ensure_future(
+                    data_source.aload(**loader)
+                )
+
+        try:
+            data: pd.DataFrame | bytes = await task
+        except BaseException:
+            with self.__lock:
+                if self.__tasks.get(key) is task:
+                    del self.__tasks[key]
+
+            raise
+
+        with self.__lock:
+            if self.__tasks.get(key) is task:
+                del self.__tasks[key]
+                self.__put(key, data)
+
+        return data
+
+    def __use(self, key: str):
+        """
+        __use method.
+
+        Counts one use of a key, with the lock held.
+
+        Args:
+            key (str): The key of the load.
+        """
+        if self.__uses is not None:
+            self.__uses[key] -= 1
+
+    def __needed(self, key: str) -> bool:
+        """
+        __needed method.
+
+        Args:
+            key (str): The key of the load.
+
+        Returns:
+            bool: True if a later use of the key needs its data.
+        """
+        return self.__uses is None or self.__uses[key] > 0
+
+    def __get(self, key: str) -> pd.DataFrame | bytes:
+        """
+        __get method.
+
+        Returns loaded data, with the lock held, and releases it if no later
+            use needs it.
+
+        Args:
+            key (str): The key of the load.
+
+        Returns:
+            DataFrame | bytes: The loaded data.
+        """
+        if self.__needed(key):
+            self.__data.move_to_end(key)
+
+            return self.__data[key]
+
+        return self.__data.pop(key)
+
+    def __put(self, key: str, data: pd.DataFrame | bytes):
+        """
+        __put method.
+
+        Keeps loaded data, with the lock held, if a later use needs it.
+
+        Args:
+            key (str): The key of the load.
+            data (DataFrame | bytes): The loaded data.
+        """
+        if self.max_size > 0 and self.__needed(key):
+            self.__data[key] = data
+
+            while len(self.__data) > self.max_size:
+                self.__data.popitem(last=False)
+
+    def __len__(self) -> int:
+        """
+        __len__ method.
+
+        Returns:
+            int: The number of loaded DataFrames kept.
+        """
+        return len(self.__data)
+
+
+@dataclass(frozen=True)
+class RulePlan:
+    """
+    RulePlan class.
+
+    A rule of a checker class compiled from its configuration: the rule
+    method is resolved and its parameters normalized once.
+
+    Attributes:
+        name (str): The name of the rule method.
+        params (Any): The parameters of the rule as configured.
+        method (Any): The rule method as defined on the checker class, bound
+            to the checker instance of every run.
+        args (tuple): The positional arguments of the rule.
+        kwargs (MappingProxyType): The keyword arguments of the rule.
+        warning_options (MappingProxyType): The `WARNING_OPTIONS` of the rule,
+            merged with the ones of its checker and data source.
+    """
+
+    name: str
+    params: Any
+    method: Any
+    args: tuple
+    kwargs: MappingProxyType
+    warning_options: MappingProxyType
+
+    @classmethod
+    def compile(
+        cls,
+        checker_class: type,
+        name: str,
+        params: Any,
+        warning_options: dict
+    ) -> RulePlan:
+        """
+        Compile method.
+
+        Resolves a rule method and normalizes its parameters.
+
+        Args:
+            checker_class (type): The checker class of the rule.
+            name (str): The name of the rule method.
+            params (Any): The parameters of the rule, see `rule_arguments`.
+            warning_options (dict): The `WARNING_OPTIONS` of the checker.
+
+        Returns:
+            RulePlan: The compiled rule.
+        """
+        args, kwargs, rule_warning_options = rule_arguments(params)
+
+        return cls(
+            name,
+            params,
+            inspect.getattr_static(checker_class, name),
+            args,
+            MappingProxyType(kwargs),
+            MappingProxyType({**warning_options, **rule_warning_options})
+        )
+
+    def __call__(self, check_data: Any, column: str) -> dict:
+        """
+        __call__ method.
+
+        Runs the rule on a column.
+
+        Args:
+            check_data (Any): The instance of the checker class.
+            column (str): The name of the column in the DataFrame to check.
+
+        Returns:
+            dict: The `params` and the `result` of the rule.
+        """
+        return self.response(self.run(check_data, column))
+
+    def run(self, check_data: Any, column: str) -> Any:
+        """
+        Run method.
+
+        Runs the rule on a column, without the warning options.
+
+        Args:
+            check_data (Any): The instance of the checker class.
+            column (str): The name of the column in the DataFrame to check.
+
+        Returns:
+            Any: The result of the rule method.
+        """
+        return self.method.__get__(check_data, type(check_data))(
+            *self.args, column=column, **self.kwargs
+        )
+
+    def response(self, result: Any) -> dict:
+        """
+        Response method.
+
+        Applies the warning options to the result of the rule.
+
+        Args:
+            result (Any): The result of the rule method, see `run`.
+
+        Returns:
+            dict: The `params` and the `result` of the rule.
+        """
+        return dict(
+            params=deepcopy(self.params),
+            result=apply_warning_options(result, **self.warning_options)
+        )
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """
+    ColumnPlan class.
+
+    The rules of one data type of a column, run as one evaluation.
+
+    Attributes:
+        column (str): The name of the column.
+        data_type (str): The data type as configured.
+        checker_class (type): The resolved checker class of the data type.
+        rules (tuple[RulePlan]): The compiled rules.
+    """
+
+    column: str
+    data_type: str
+    checker_class: type
+    rules: tuple
+
+    @classmethod
+    def compile(
+        cls, column: str, data_type: str, rules: dict, warning_options: dict
+    ) -> ColumnPlan:
+        """
+        Compile method.
+
+        Resolves the checker class of a data type and compiles its rules.
+
+        Args:
+            column (str): The name of the column.
+            data_type (str): The name of a checker class of this package, or
+                the full path of a custom checker class.
+            rules (dict): Rule method names mapped to their parameters.
+            warning_options (dict): The `WARNING_OPTIONS` of the checker.
+
+        Returns:
+            ColumnPlan: The compiled rules of the column.
+        """
+        try:
+            checker_class: Any = {
+                'boolean': Boolean,
+                'float': Float,
+                'integer': Integer,
+                'string': String,
+                'timestamp': Timestamp
+            }.get(data_type.lower()) or locate_type(data_type)
+        except ModuleNotFoundError:  # pragma: no cover
+            logging.error(
+                'Please run this on your terminal:'
+            )  # pragma: no cover
+            logging.error(
+                "pip install 'DataSae[converter]'"
+            )  # pragma: no cover
+            raise  # pragma: no cover
+
+        return cls(column, data_type, checker_class, tuple(
+            RulePlan.compile(checker_class, name, params, warning_options)
+            for name, params in rules.items()
+        ))
+
+    def __call__(self, data: pd.DataFrame) -> dict:
+        """
+        __call__ method.
+
+        Runs the rules on the column of a DataFrame. For a `Basic` checker the
+            state shared by the rules is released afterwards.
+
+        Args:
+            data (pd.DataFrame): The data of the checker.
+
+        Returns:
+            dict: Rule method names mapped to their `params` and `result`.
+        """
+        return {
+            rule.name: rule.response(result)
+            for rule, result in zip(self.rules, self.run(data))
+        }
+
+    def run(self, data: pd.DataFrame) -> list:
+        """
+        Run method.
+
+        Runs the rules on the column of a DataFrame, without the warning
+            options. For a `Basic` checker the rules share the state of the
+            column, see `Basic.shared_state`, which is released afterwards.
+
+        Args:
+            data (pd.DataFrame): The data of the checker.
+
+        Returns:
+            list: The result of every rule method, in order.
+        """
+        check_data: Any = self.checker_class(data)
+
+        with check_data.shared_state(self.column) if isinstance(
+            check_data, Basic
+        ) else nullcontext():
+            return [rule.run(check_data, self.column) for rule in self.rules]
+
+    @property
+    def is_basic(self) -> bool:
+        """
+        Is_basic is instance's attribute.
+
+        True if the checker class inherits from `Basic`, whose rules return
+        results with `valid`, `invalid` and `warning`.
+        """
+        return isinstance(self.checker_class, type) and issubclass(
+            self.checker_class, Basic
+        )
+
+    def __reduce__(self) -> tuple:
+        """
+        __reduce__ method.
+
+        Pickles the rules by name, so a worker process compiles them again
+            instead of pickling the resolved rule methods.
+
+        Returns:
+            tuple: The function that restores the plan and its arguments.
+        """
+        return ColumnPlan.restore, (
+            self.column,
+            self.data_type,
+            self.checker_class,
+            tuple(
+                (rule.name, rule.params, dict(rule.warning_options))
+                for rule in self.rules
+            )
+        )
+
+    @classmethod
+    def restore(
+        cls,
+        column: str,
+        data_type: str,
+        checker_class: type,
+        rules: tuple[tuple[str, Any, dict]]
+    ) -> ColumnPlan:
+        """
+        Restore method.
+
+        Compiles a pickled plan again.
+
+        Args:
+            column (str): The name of the column.
+            data_type (str): The data type as configured.
+            checker_class (type): The checker class of the data type.
+            rules (tuple[tuple[str, Any, dict]]): The name, parameters and
+                warning options of every rule.
+
+        Returns:
+            ColumnPlan: The compiled rules of the column.
+        """
+        return cls(column, data_type, checker_class, tuple(
+            RulePlan.compile(checker_class, *rule) for rule in rules
+        ))
+
+
+def share_column(data: pd.Series) -> tuple[SharedMemory, int] | None:
+    """
+    Write a column to shared memory as an Arrow IPC stream.
+
+    Only columns that come back from Arrow exactly as they are shared:
+    columns of a non-object dtype, and object columns of strings and None.
+    Other object columns, e.g. of mixed data types, can not.
+
+    Args:
+        data (pd.Series): The column.
+
+    Returns:
+        tuple[SharedMemory, int] | None: The shared memory and the size of the
+            stream in it, or None if the column can not be shared.
+    """
+    if pa is None:
+        return None  # pragma: no cover
+
+    try:
+        if pd.api.types.is_object_dtype(data.dtype):
+            table: pa.Table = pa.table({'column': pa.array(
+                data, type=pa.large_string(), from_pandas=False
+            )})
+        else:
+            table: pa.Table = pa.Table.from_pandas(
+                data.to_frame('column'), preserve_index=False
+            )
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+    sink: pa.MockOutputStream = pa.MockOutputStream()
+
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    size: int = sink.size()
+    memory: SharedMemory = SharedMemory(create=True, size=size)
+    buffer: memoryview = memory.buf[:size]
+
+    try:
+        with pa.ipc.new_stream(
+            pa.FixedSizeBufferWriter(pa.py_buffer(buffer)), table.schema
+        ) as writer:
+            writer.write_table(table)
+
+        # No Arrow buffer may still refer to the shared memory when it is
+        # closed.
+        del writer
+    finally:
+        buffer.release()
+
+    return memory, size
+
+
+def check_shared_column(column_plan: ColumnPlan, name: str, size: int) -> dict:
+    """
+    Run the rules of a column shared by `share_column`, in a worker process.
+
+    Args:
+        column_plan (ColumnPlan): The rules of the column.
+        name (str): The name of the shared memory.
+        size (int): The size of the stream in the shared memory.
+
+    Returns:
+        dict: Rule method names mapped to their `params` and `result`.
+    """
+    memory: SharedMemory = SharedMemory(name)
+    buffer: memoryview = memory.buf[:size]
+
+    try:
+        # Copied, so no Arrow buffer still refers to the shared memory.
+        data: pd.DataFrame = pa.ipc.open_stream(
+            pa.py_buffer(buffer)
+        ).read_pandas().copy()
+    finally:
+        buffer.release()
+        memory.close()
+
+    data.columns = [column_plan.column]
+
+    return column_plan(data)
+
+
+class ColumnPool:
+    """
+    ColumnPool class.
+
+    A process pool that runs the rules of the columns of a checker, so they
+    use every core. The columns are passed to the worker processes through
+    shared memory as Arrow IPC streams, see `share_column`; the rules of
+    columns that can not be shared, or of checker classes that do not
+    inherit from `Basic`, run in the calling process.
+
+    Attributes:
+        min_rows (int): Data with fewer rows is checked in the calling
+            process, where the overhead of the pool would dominate.
+        executor (ProcessPoolExecutor): The worker processes.
+    """
+
+    def __init__(self, max_processes: int, min_rows: int = PROCESS_MIN_ROWS):
+        """
+        __init__ method.
+
+        Starts the process pool.
+
+        Args:
+            max_processes (int): The number of worker processes.
+            min_rows (int, optional): Data with fewer rows is checked in the
+                calling process. Defaults to PROCESS_MIN_ROWS.
+        """
+        self.min_rows = min_rows
+        self.executor = ProcessPoolExecutor(
+            max_processes, mp_context=get_context('spawn')
+        )
+
+    def __enter__(self) -> ColumnPool:
+        """
+        __enter__ method.
+
+        Returns:
+            ColumnPool: The pool.
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        __exit__ method.
+
+        Shuts the process pool down.
+        """
+        self.executor.shutdown()
+
+    def __call__(self, columns: tuple, data: pd.DataFrame) -> list[dict]:
+        """
+        __call__ method.
 
+        Runs the rules of every column, in the worker processes when the data
+            is large enough. If a column fails, the columns not started yet
+            are cancelled, and the shared memory is released after the
+            running ones finished.
 
-class CaseInsensitiveEnum(str, Enum):
+        Args:
+            columns (tuple[ColumnPlan]): The rules of every column.
+            data (pd.DataFrame): The data of the checker.
+
+        Returns:
+            list[dict]: The result of every column plan, in order.
+        """
+        if len(data) < self.min_rows:
+            return [column_plan(data) for column_plan in columns]
+
+        memories: dict[str, tuple[SharedMemory, int] | None] = {}
+        futures: list[Future] = []
+
+        try:
+            runs: list[Callable[[], dict]] = []
+
+            for column_plan in columns:
+                if column_plan.is_basic and isinstance(
+                    data.get(column_plan.column), pd.Series
+                ):
+                    if column_plan.column not in memories:
+                        memories[column_plan.column] = share_column(
+                            data[column_plan.column]
+                        )
+
+                    shared: tuple[SharedMemory, int] | None = memories[
+                        column_plan.column
+                    ]
+
+                    if shared:
+                        futures.append(self.executor.submit(
+                            check_shared_column,
+                            column_plan,
+                            shared[0].name,
+                            shared[1]
+                        ))
+                        runs.append(futures[-1].result)
+                        continue
+
+                runs.append(partial(column_plan, data))
+
+            return [run() for run in runs]
+        finally:
+            # After a failed column, workers may still read the shared memory
+            # of the others: it is only released once none of them can.
+            for future in futures:
+                future.cancel()
+
+            wait(futures)
+
+            for shared in memories.values():
+                if shared:
+                    shared[0].close()
+                    shared[0].unlink()
+
+
+@dataclass(frozen=True)
+class CheckerPlan:
     """
-    A case-insensitive enumeration class.
+    CheckerPlan class.
 
-    A case-insensitive enumeration class that allows for case-insensitive
-    comparison of enum values and provides a case-insensitive lookup of enum
-    members.
+    A checker of a data source compiled from its configuration.
+
+    Attributes:
+        config (MappingProxyType): The checker as configured.
+        loader (MappingProxyType): The keyword arguments that load the data
+            of the checker from the data source.
+        columns (tuple[ColumnPlan]): The compiled rules of every column.
+        projection (tuple[str]): The columns to load, pushed down to the
+            data source unless the loader sets its own `projection`, see
+            `CheckerPlan.share`.
+        chunksize (int): The number of rows of every chunk the data is
+            streamed in, see `CheckerPlan.check_chunks`, or None to load it
+            at once.
     """
 
-    def __eq__(self, __value: str) -> bool:
+    config: MappingProxyType
+    loader: MappingProxyType
+    columns: tuple
+    projection: tuple
+    chunksize: int = None
+
+    @classmethod
+    def compile(cls, checker: dict, data_source: dict) -> CheckerPlan:
         """
-        __eq__ methods.
+        Compile method.
 
-        Overrides the __eq__ method to perform case-insensitive comparison of
-        enum values.
+        Compiles a checker. The `WARNING_OPTIONS` of the checker override the
+            ones of its data source.
 
         Args:
-            __value (str): The value to compare with the enum value.
+            checker (dict): The checker as configured.
+            data_source (dict): The data source as configured.
+
+        Raises:
+            ValueError: If the checker has a `chunksize` and a checker class
+                that does not inherit from `Basic`, whose results can not be
+                merged.
 
         Returns:
-            bool: True if the values are equal (case-insensitive), False
-                otherwise.
+            CheckerPlan: The compiled checker.
         """
-        return super().__eq__(__value.lower() if __value else __value)
+        warning_options: dict = {
+            key: checker.get(key, data_source.get(key))
+            for key in WARNING_OPTIONS
+        }
+        warning_options.update({
+            key: bool(warning_options[key])
+            for key in WARNING_OPTIONS
+            if key != 'max_warnings'
+        })
+
+        columns: tuple[ColumnPlan] = tuple(
+            ColumnPlan.compile(column_name, data_type, rules, warning_options)
+            for column_name, data_type_list in checker['column'].items()
+            for data_type, rules in data_type_list.items()
+        )
+
+        if checker.get('chunksize'):
+            for column_plan in columns:
+                if not column_plan.is_basic:
+                    raise ValueError(
+                        f"Checker class '{column_plan.data_type}' of column "
+                        f"'{column_plan.column}' can not check in chunks."
+                    )
+
+        return cls(
+            MappingProxyType(deepcopy(checker)),
+            MappingProxyType({
+                key: value
+                for key, value in checker.items()
+                if key not in ('column', 'chunksize')
+                and key not in WARNING_OPTIONS
+            }),
+            columns,
+            tuple(checker['column']),
+            checker.get('chunksize')
+        )
 
-    @classmethod
-    def _missing_(cls, value: str) -> CaseInsensitiveEnum:
+    @staticmethod
+    def share(
+        checkers: list[tuple[DataSource, CheckerPlan]]
+    ) -> list[CheckerPlan]:
         """
-        _missing_ method.
+        Share method.
 
-        Overrides the _missing_ method to perform case-insensitive lookup of
-            enum members.
+        Gives the checkers that load the same target the union of their
+            projections, so the target is loaded once with every column they
+            need, see `LoadCache`.
 
         Args:
-            value (str): The value to lookup in the enum members.
+            checkers (list[tuple[DataSource, CheckerPlan]]): The checkers and
+                their data sources.
 
         Returns:
-            CaseInsensitiveEnum: The enum member with the matching value (case-
-                insensitive).
+            list[CheckerPlan]: The checkers with shared projections.
         """
-        value = value.lower() if value else value
+        keys: list[str] = [
+            LoadCache.key(data_source, checker.loader)
+            for data_source, checker in checkers
+        ]
+        projections: dict[str, dict] = {}
+
+        for key, (_, checker) in zip(keys, checkers):
+            projections.setdefault(key, {}).update(
+                dict.fromkeys(checker.projection)
+            )
+
+        return [
+            replace(checker, projection=tuple(projections[key]))
+            for key, (_, checker) in zip(keys, checkers)
+        ]
 
-        for member in cls:
-            if member.value.lower() == value:
-                return member
+    def __call__(
+        self,
+        data_source: DataSource,
+        loads: LoadCache = None,
+        pool: ColumnPool = None
+    ) -> dict:
+        """
+        __call__ method.
 
+        Loads the configured columns of the checker and runs every rule on
+            them. With a `chunksize` the data is streamed instead, see
+            `check_chunks`.
 
-class FileType(CaseInsensitiveEnum):
-    """
-    FileType enumeration.
+        Args:
+            data_source (DataSource): The data source of the checker.
+            loads (LoadCache, optional): The data already loaded in this
+                run. Defaults to None, which loads the data.
+            pool (ColumnPool, optional): Runs the rules of the columns in
+                worker processes. Defaults to None, which runs them in this
+                process.
 
-    Represents different types of file formats with case-insensitive
-    comparison and lookup of enum values.
-    """
+        Returns:
+            dict: The checker as configured, with the `params` and `result`
+                of every rule in its `column`.
+        """
+        if self.chunksize:
+            return self.check_chunks(data_source.chunks(
+                self.chunksize, **self.arguments(data_source)
+            ))
+
+        return self.check((
+            LoadCache(0) if loads is None else loads
+        )(data_source, self.arguments(data_source)), pool)
+
+    async def acall(
+        self,
+        data_source: DataSource,
+        loads: LoadCache,
+        pool: ColumnPool = None,
+        executor: Executor = None
+    ) -> dict:
+        """
+        Acall method.
 
-    CSV = '.csv'
-    JSON = '.json'
-    PARQUET = '.parquet'
-    SQL = '.sql'
-    YAML = '.yaml'
-    YML = '.yml'
-    XLSX = '.xlsx'
+        Loads the configured columns of the checker without blocking the
+            event loop, see `LoadCache.aload`, and runs every rule on them in
+            an executor.
 
+        Args:
+            data_source (DataSource): The data source of the checker.
+            loads (LoadCache): The data already loaded in this run.
+            pool (ColumnPool, optional): Runs the rules of the columns in
+                worker processes. Defaults to None, which runs them in the
+                executor.
+            executor (Executor, optional): Runs the rules. Defaults to None,
+                which is the default executor of the loop.
 
-@dataclass(repr=False)
-class DataSource:
+        Returns:
+            dict: The checker as configured, with the `params` and `result`
+                of every rule in its `column`.
+        """
+        if self.chunksize:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, self, data_source
+            )
+
+        data: pd.DataFrame = await loads.aload(
+            data_source, self.arguments(data_source)
+        )
+
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, self.check, data, pool
+        )
+
+    def arguments(self, data_source: DataSource) -> Mapping:
+        """
+        Arguments method.
+
+        Pushes the projection of the checker down to the data source, unless
+            the loader sets its own `projection` or the data source does not
+            accept one, see `accepts_projection`.
+
+        Args:
+            data_source (DataSource): The data source of the checker.
+
+        Returns:
+            Mapping: The keyword arguments that load the data of the checker.
+        """
+        if 'projection' not in self.loader and accepts_projection(
+            type(data_source)
+        ):
+            return {**self.loader, 'projection': list(self.projection)}
+
+        return self.loader
+
+    def check(self, data: pd.DataFrame, pool: ColumnPool = None) -> dict:
+        """
+        Check method.
+
+        Runs every rule on the loaded data of the checker.
+
+        Args:
+            data (pd.DataFrame): The loaded data of the checker.
+            pool (ColumnPool, optional): Runs the rules of the columns in
+                worker processes. Defaults to None, which runs them in this
+                process.
+
+        Returns:
+            dict: The checker as configured, with the `params` and `result`
+                of every rule in its `column`.
+        """
+        column: dict = {}
+
+        for column_plan, result in zip(self.columns, (
+            [column_plan(data) for column_plan in self.columns]
+            if pool is None else pool(self.columns, data)
+        )):
+            column.setdefault(column_plan.column, {})[
+                column_plan.data_type
+            ] = result
+
+        return self.response(column)
+
+    def check_chunks(self, chunks: Iterable[pd.DataFrame]) -> dict:
+        """
+        Check_chunks method.
+
+        Runs every rule on every chunk of the data of the checker, and merges
+            their results as if the rules ran on the whole data at once, see
+            `ChunkedResult`. Only one chunk is loaded at a time.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): The consecutive chunks of the
+                data of the checker, see `DataSource.chunks`.
+
+        Returns:
+            dict: The checker as configured, with the `params` and `result`
+                of every rule in its `column`.
+        """
+        results: list[list[ChunkedResult]] = [
+            [
+                ChunkedResult(
+                    rule.warning_options.get('max_warnings'),
+                    rule.warning_options.get('sample_warnings'),
+                    rule.warning_options.get('group_warnings')
+                )
+                for rule in column_plan.rules
+            ]
+            for column_plan in self.columns
+        ]
+
+        for data in chunks:
+            for column_plan, column_results in zip(self.columns, results):
+                for result, chunk_result in zip(
+                    column_results, column_plan.run(data)
+                ):
+                    result.add(chunk_result, len(data))
+
+        column: dict = {}
+
+        for column_plan, column_results in zip(self.columns, results):
+            column.setdefault(column_plan.column, {})[
+                column_plan.data_type
+            ] = {
+                rule.name: rule.response(result())
+                for rule, result in zip(column_plan.rules, column_results)
+            }
+
+        return self.response(column)
+
+    def response(self, column: dict) -> dict:
+        """
+        Response method.
+
+        Args:
+            column (dict): The results of every column.
+
+        Returns:
+            dict: The checker as configured, with the `params` and `result`
+                of every rule in its `column`.
+        """
+        return {
+            key: column if key == 'column' else deepcopy(value)
+            for key, value in self.config.items()
+        }
+
+
+@dataclass(frozen=True)
+class SourcePlan:
     """
-    DataSource class.
+    SourcePlan class.
 
-    A class that converts data of different file types into a Pandas DataFrame.
+    A data source compiled from its configuration.
+
+    Attributes:
+        data_source (DataSource): The resolved data source.
+        checkers (tuple[CheckerPlan]): The compiled checkers.
     """
 
-    name: str
-    file_path: str
+    data_source: DataSource
+    checkers: tuple
+
+    def __call__(
+        self,
+        loads: LoadCache = None,
+        max_workers: int = None,
+        pool: ColumnPool = None
+    ) -> list[dict]:
+        """
+        __call__ method.
+
+        Runs every checker of the data source, loading every distinct target
+            once.
+
+        Args:
+            loads (LoadCache, optional): The data already loaded in this run.
+                Defaults to None, which starts a new `LoadCache`.
+            max_workers (int, optional): The number of threads that run the
+                checkers concurrently. Defaults to None, which runs them one
+                after another.
+            pool (ColumnPool, optional): Runs the rules of the columns in
+                worker processes. Defaults to None, which runs them in this
+                process.
+
+        Returns:
+            list[dict]: The result of every checker in configuration order,
+                see `DataSource.checker`.
+        """
+        loads = LoadCache(uses=self.load_counts) if loads is None else loads
+
+        if max_workers and max_workers > 1:
+            with ThreadPoolExecutor(max_workers) as executor:
+                return self.submit(loads, executor, pool)()
+
+        return [
+            checker(self.data_source, loads, pool) for checker in self.checkers
+        ]
+
+    def submit(
+        self, loads: LoadCache, executor: Executor, pool: ColumnPool = None
+    ) -> Callable[[], list[dict]]:
+        """
+        Submit method.
+
+        Schedules every checker of the data source on an executor.
+
+        Args:
+            loads (LoadCache): The data already loaded in this run.
+            executor (Executor): Runs the checkers concurrently.
+            pool (ColumnPool, optional): Runs the rules of the columns in
+                worker processes. Defaults to None, which runs them in the
+                threads of the executor.
+
+        Returns:
+            Callable[[], list[dict]]: Function that waits for the checkers
+                and returns their results in configuration order.
+        """
+        futures: list[Future] = [
+            executor.submit(checker, self.data_source, loads, pool)
+            for checker in self.checkers
+        ]
+
+        return lambda: [future.result() for future in futures]
 
     @property
-    def checker(self) -> list[dict]:
+    def load_counts(self) -> Counter[str]:
         """
-        Checker is instance's attribute.
+        Load_counts is instance's attribute.
 
-        Creates a list of checker result based on the configuration provided
-        in the checker section of the data source's configuration file.
+        The number of checkers that load each key, see `LoadCache.key`.
+        Checkers with a `chunksize` stream their data and do not count.
         """
-        checker_list: list[dict] = Config.config(
-            self.file_path
-        )[self.name].get('checker', [])
+        return Counter(
+            LoadCache.key(
+                self.data_source, checker.arguments(self.data_source)
+            )
+            for checker in self.checkers
+            if not checker.chunksize
+        )
 
-        for checker in checker_list:
-            data: pd.DataFrame = self(**{
-                key: value
-                for key, value in checker.items()
-                if key != 'column'
-            })
-
-            for column_name, data_type_list in checker['column'].items():
-                for data_type, rules in data_type_list.items():
-                    try:
-                        check_data: Any = {
-                            'boolean': Boolean,
-                            'float': Float,
-                            'integer': Integer,
-                            'string': String,
-                            'timestamp': Timestamp
-                        }.get(
-                            data_type.lower(),
-                            locate(data_type)
-                        )(data)
-                    except ModuleNotFoundError:  # pragma: no cover
-                        logging.error(
-                            'Please run this on your terminal:'
-                        )  # pragma: no cover
-                        logging.error(
-                            "pip install 'DataSae[converter]'"
-                        )  # pragma: no cover
-                        raise  # pragma: no cover
-
-                    for method_name, params in rules.items():
-                        method = getattr(check_data, method_name)
-                        rules[method_name] = dict(
-                            params=params,
-                            result=method(**params, column=column_name)
-                            if isinstance(params, dict)
-                            else method(
-                                *(
-                                    params
-                                    if isinstance(params, list)
-                                    else ([params] if params else [])
-                                ),
-                                column=column_name
-                            )
-                        )
 
-        return checker_list
+@dataclass(frozen=True)
+class Plan:
+    """
+    Plan class.
+
+    A configuration file compiled once into data sources, checker classes,
+    rule methods and normalized parameters, see `Config.compile`. Running it
+    again neither parses the file nor resolves anything.
+
+    Attributes:
+        sources (MappingProxyType): Data source names mapped to their
+            `SourcePlan`.
+    """
+
+    sources: MappingProxyType
 
     @property
-    def connection(self) -> dict:
+    def load_counts(self) -> Counter[str]:
         """
-        Return connection to data source.
+        Load_counts is instance's attribute.
 
-        Returns:
-            dict: Key-value parameters for connection to datasource.
+        The number of checkers of every data source that load each key, see
+        `SourcePlan.load_counts`.
         """
-        return {
-            key: value
-            for key, value in self.__dict__.items()
-            if key not in DataSource.__annotations__.keys()
-        }
+        return sum(
+            (source.load_counts for source in self.sources.values()),
+            Counter()
+        )
 
     def __call__(
-        self, file_type: FileType, data: bytes | str, *args, **kwargs
-    ) -> pd.DataFrame | bytes:
+        self,
+        max_loads: int = LOAD_CACHE_SIZE,
+        max_workers: int = None,
+        max_processes: int = None,
+        process_min_rows: int = PROCESS_MIN_ROWS
+    ) -> dict[str, list[dict]]:
         """
         __call__ method.
 
-        Converter from various file type into Pandas DataFrame.
+        Runs every checker of every data source. Data sources with the same
+            connection share the loaded data, see `LoadCache`. One after
+            another, the first data source that fails stops the run. With
+            `max_workers` a data source that fails does not stop the others,
+            see `raise_errors`.
 
         Args:
-            file_type (FileType): _description_
-            data (bytes | str): Data's bytes or sql query needed convert to
-                dataframe.
+            max_loads (int, optional): The maximum number of loaded DataFrames
+                kept for reuse during the run. Defaults to LOAD_CACHE_SIZE.
+            max_workers (int, optional): The number of threads that run the
+                checkers of every data source concurrently, which overlaps
+                their I/O. Defaults to None, which runs them one after
+                another.
+            max_processes (int, optional): The number of worker processes
+                that run the rules of the columns, see `ColumnPool`. Defaults
+                to None, which runs them in this process.
+            process_min_rows (int, optional): Data with fewer rows is checked
+                in this process even with `max_processes`. Defaults to
+                PROCESS_MIN_ROWS.
+
+        Raises:
+            Exception: The error of the data source that failed.
+            DataSourceError: If several data sources failed with
+                `max_workers`, with the errors and the results of the other
+                data sources.
 
         Returns:
-            DataFrame | bytes: Pandas DataFrame or bytes if file type not
-                support.
+            dict[str, list[dict]]: The result of every checker by data source
+                name in configuration order, see `Config.checker`.
         """
-        if file_type in list(FileType):
-            func: Callable = None
+        loads: LoadCache = LoadCache(max_loads, self.load_counts)
+        results: dict[str, list[dict]] = {}
+        errors: dict[str, Exception] = {}
+
+        with ExitStack() as stack:
+            pool: ColumnPool = stack.enter_context(
+                ColumnPool(max_processes, process_min_rows)
+            ) if max_processes and max_processes > 1 else None
+
+            if not (max_workers and max_workers > 1):
+                return {
+                    name: source(loads, pool=pool)
+                    for name, source in self.sources.items()
+                }
+
+            executor: Executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers)
+            )
+            runs: dict[str, Callable[[], list[dict]]] = {
+                name: source.submit(loads, executor, pool)
+                for name, source in self.sources.items()
+            }
 
-            if file_type is FileType.CSV:
-                func = pd.read_csv
-            elif file_type is FileType.JSON:
-                func = pd.read_json
-            elif file_type is FileType.PARQUET:
-                func = pd.read_parquet
-            elif file_type is FileType.SQL:
-                func = pd.read_sql_query
-            elif file_type is FileType.XLSX:
-                func = pd.read_excel
+            for name, run in runs.items():
+                try:
+                    results[name] = run()
+                except Exception as error:
+                    errors[name] = error
 
-            if func:
-                with warnings.catch_warnings(record=True):
-                    warnings.simplefilter('always')
-                    if file_type is FileType.SQL:
-                        data = func(data, self.connection, *args, **kwargs)
-                    else:
-                        data = func(
-                            StringIO(data.decode())
-                            if file_type in (FileType.CSV, FileType.JSON)
-                            else BytesIO(data),
-                            *args,
-                            **kwargs
-                        )
+        raise_errors(errors, results)
 
-        return data
+        return results
+
+    async def acall(
+        self,
+        max_loads: int = LOAD_CACHE_SIZE,
+        executor: Executor = None,
+        max_processes: int = None,
+        process_min_rows: int = PROCESS_MIN_ROWS
+    ) -> dict[str, list[dict]]:
+        """
+        Acall method.
+
+        Runs every checker of every data source like calling the plan, on the
+            running event loop: the loads of every checker overlap, and the
+            rules run in an executor, see `Plan.as_completed`.
+
+        Args:
+            max_loads (int, optional): The maximum number of loaded DataFrames
+                kept for reuse during the run. Defaults to LOAD_CACHE_SIZE.
+            executor (Executor, optional): Runs the rules of the checkers.
+                Defaults to None, which is the default executor of the loop.
+            max_processes (int, optional): The number of worker processes
+                that run the rules of the columns, see `ColumnPool`. Defaults
+                to None, which runs them in the executor.
+            process_min_rows (int, optional): Data with fewer rows is checked
+                in the executor even with `max_processes`. Defaults to
+                PROCESS_MIN_ROWS.
+
+        Raises:
+            Exception: The error of the only data source that failed.
+            DataSourceError: If several data sources failed, with the errors
+                and the results of the other data sources, see
+                `raise_errors`.
+
+        Returns:
+            dict[str, list[dict]]: The result of every checker by data source
+                name in configuration order, see `Config.checker`.
+        """
+        results: dict[str, list[dict]] = {
+            name: [None] * len(source.checkers)
+            for name, source in self.sources.items()
+        }
+
+        async for name, index, result in self.as_completed(
+            max_loads, executor, max_processes, process_min_rows
+        ):
+            results[name][index] = result
+
+        return results
+
+    async def as_completed(
+        self,
+        max_loads: int = LOAD_CACHE_SIZE,
+        executor: Executor = None,
+        max_processes: int = None,
+        process_min_rows: int = PROCESS_MIN_ROWS
+    ) -> AsyncIterator[tuple[str, int, dict]]:
+        """
+        As_completed method.
+
+        Runs every checker of every data source on the running event loop and
+            yields every result as soon as it is complete. The data sources
+            load their data without blocking the loop, see
+            `DataSource.aload`, so the I/O of all of them overlaps. Leaving
+            the loop early cancels the remaining checkers.
+
+        Args:
+            max_loads (int, optional): The maximum number of loaded DataFrames
+                kept for reuse during the run. Defaults to LOAD_CACHE_SIZE.
+            executor (Executor, optional): Runs the rules of the checkers.
+                Defaults to None, which is the default executor of the loop.
+            max_processes (int, optional): The number of worker processes
+                that run the rules of the columns, see `ColumnPool`. Defaults
+                to None, which runs them in the executor.
+            process_min_rows (int, optional): Data with fewer rows is checked
+                in the executor even with `max_processes`. Defaults to
+                PROCESS_MIN_ROWS.
+
+        Raises:
+            Exception: The error of the only data source that failed, after
+                the results of every other checker are yielded.
+            DataSourceError: If several data sources failed, likewise, with
+                the errors and the results of the other data sources, see
+                `raise_errors`.
+
+        Yields:
+            tuple[str, int, dict]: The name of the data source, the position
+                of the checker in its configuration and the checker result.
+        """
+        loads: LoadCache = LoadCache(max_loads, self.load_counts)
+        results: dict[str, list[dict]] = {
+            name: [None] * len(source.checkers)
+            for name, source in self.sources.items()
+        }
+        failures: dict[str, dict[int, Exception]] = {}
+
+        with ExitStack() as stack:
+            pool: ColumnPool = stack.enter_context(
+                ColumnPool(max_processes, process_min_rows)
+            ) if max_processes and max_processes > 1 else None
+            tasks: dict[asyncio.Future, tuple[str, int]] = {
+                asyncio.ensure_future(checker.acall(
+                    source.data_source, loads, pool, executor
+                )): (name, index)
+                for name, source in self.sources.items()
+                for index, checker in enumerate(source.checkers)
+            }
+            positions: dict[asyncio.Future, int] = {
+                task: position for position, task in enumerate(tasks)
+            }
+            pending: set[asyncio.Future] = set(tasks)
+
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+
+                    for task in sorted(done, key=positions.get):
+                        name, index = tasks[task]
+
+                        if task.exception():
+                            failures.setdefault(name, {})[
+                                index
+                            ] = task.exception()
+                            continue
+
+                        results[name][index] = task.result()
+
+                        yield name, index, task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        errors: dict[str, Exception] = {
+            name: failures[name][min(failures[name])]
+            for name in self.sources
+            if name in failures
+        }
+
+        raise_errors(errors, {
+            name: result
+            for name, result in results.items()
+            if name not in errors
+        })
 
 
 @dataclass
@@ -244,6 +1825,9 @@ class Config:
     Attributes:
         __file (str): The source path of the file.
         __file_type (str): The type of the file.
+        __cache (dict[Path, tuple[tuple[int, int], dict]]): Parsed files
+            by resolved path, with the modification time and size they were
+            parsed at.
 
     Methods:
         __call__(name):
@@ -251,21 +1835,33 @@ class Config:
     """
 
     file_path: str
+    __cache: ClassVar[dict[Path, tuple[tuple[int, int], dict]]] = {}
 
     @staticmethod
     def config(file_path: str) -> dict:
         """
         Config.config static method.
 
-        Reads a file and returns its contents as a dictionary.
+        Reads a file and returns its contents as a dictionary. The file is
+            parsed once per modification: the contents are cached by path
+            and reparsed only when the modification time or size of the file
+            changes.
 
         Args:
             file_path (str): Source path of your .json or .yaml file.
 
         Returns:
-            dict: The contents of the file as a dictionary.
+            dict: The contents of the file as a dictionary, a copy the caller
+                is free to modify.
         """
-        file: Path = Path(file_path)
+        file: Path = Path(file_path).resolve()
+        stat: Any = file.stat()
+        version: tuple[int, int] = stat.st_mtime_ns, stat.st_size
+        cached: tuple[tuple[int, int], dict] = Config.__cache.get(file)
+
+        if cached and cached[0] == version:
+            return deepcopy(cached[1])
+
         file_type: FileType = FileType(file.suffix)
         data: dict = {}
 
@@ -273,9 +1869,11 @@ class Config:
             if file_type is FileType.JSON:
                 data = json.loads(file_obj.read())
             elif file_type in (FileType.YAML, FileType.YML):
-                data = yaml.safe_load(file_obj)
+                data = yaml.load(file_obj, Loader=SafeLoader)
 
-        return data
+        Config.__cache[file] = version, data
+
+        return deepcopy(data)
 
     def __call__(self, name: str) -> DataSource:
         """
@@ -296,7 +1894,7 @@ class Config:
                 for key, value in Config.config(
                     self.file_path
                 ).get(name, {}).items()
-                if key != 'checker'
+                if key != 'checker' and key not in WARNING_OPTIONS
             }
         }
         data_source_type: str = data_source.pop('type')
@@ -358,7 +1956,7 @@ class Config:
                 # Dynamic instantiation from string name of a class in
                 # dynamically imported module?
                 # https://stackoverflow.com/questions/4821104/dynamic-instantiation-from-string-name-of-a-class-in-dynamically-imported-module
-                data_source_type = locate(data_source_type)
+                data_source_type = locate_type(data_source_type)
             except ModuleNotFoundError:  # pragma: no cover
                 logging.error(
                     'Please run this on your terminal:'
@@ -370,6 +1968,44 @@ class Config:
 
         return data_source_type(**data_source)
 
+    def compile(self) -> Plan:
+        """
+        Compile method.
+
+        Compiles the configuration file into a reusable plan: data sources,
+            checker classes, rule methods and parameters are resolved once.
+
+        Returns:
+            Plan: The compiled configuration, run it to check every data
+                source.
+        """
+        config: dict = self.config(self.file_path)
+        data_sources: dict[str, DataSource] = {
+            name: self(name) for name in config.keys()
+        }
+        names: list[str] = []
+        checkers: list[tuple[DataSource, CheckerPlan]] = []
+
+        for name, data_source in config.items():
+            for checker in data_source.get('checker', []):
+                names.append(name)
+                checkers.append((
+                    data_sources[name],
+                    CheckerPlan.compile(checker, data_source)
+                ))
+
+        source_checkers: dict[str, list[CheckerPlan]] = {
+            name: [] for name in config.keys()
+        }
+
+        for name, checker in zip(names, CheckerPlan.share(checkers)):
+            source_checkers[name].append(checker)
+
+        return Plan(MappingProxyType({
+            name: SourcePlan(data_sources[name], tuple(plans))
+            for name, plans in source_checkers.items()
+        }))
+
     @property
     def checker(self) -> dict[str, list[dict]]:
         """
@@ -378,7 +2014,116 @@ class Config:
         Creates all of checker result based on the configuration provided
         in the checker section of the data source's configuration file.
         """
-        return {
-            name: self(name).checker
-            for name in self.config(self.file_path).keys()
-        }
+        return self.check()
+
+    def check(
+        self,
+        max_workers: int = None,
+        max_processes: int = None,
+        process_min_rows: int = PROCESS_MIN_ROWS
+    ) -> dict[str, list[dict]]:
+        """
+        Check method.
+
+        Creates all of checker result like `checker`, optionally running the
+            data sources and their checkers concurrently, see `Plan`.
+
+        Args:
+            max_workers (int, optional): The number of threads that run the
+                checkers concurrently. Defaults to None, which runs them one
+                after another.
+            max_processes (int, optional): The number of worker processes
+                that run the rules of the columns, see `ColumnPool`. Defaults
+                to None, which runs them in this process.
+            process_min_rows (int, optional): Data with fewer rows is checked
+                in this process even with `max_processes`. Defaults to
+                PROCESS_MIN_ROWS.
+
+        Raises:
+            Exception: The error of the data source that failed.
+            DataSourceError: If several data sources failed with
+                `max_workers`.
+
+        Returns:
+            dict[str, list[dict]]: The result of every checker by data source
+                name in configuration order.
+        """
+        return self.compile()(
+            max_workers=max_workers,
+            max_processes=max_processes,
+            process_min_rows=process_min_rows
+        )
+
+    async def acheck(
+        self,
+        executor: Executor = None,
+        max_processes: int = None,
+        process_min_rows: int = PROCESS_MIN_ROWS
+    ) -> dict[str, list[dict]]:
+        """
+        Acheck method.
+
+        Creates all of checker result like `checker` on the running event
+            loop, so the I/O of every data source overlaps, see `Plan.acall`.
+
+        Args:
+            executor (Executor, optional): Runs the rules of the checkers.
+                Defaults to None, which is the default executor of the loop.
+            max_processes (int, optional): The number of worker processes
+                that run the rules of the columns, see `ColumnPool`. Defaults
+                to None, which runs them in the executor.
+            process_min_rows (int, optional): Data with fewer rows is checked
+                in the executor even with `max_processes`. Defaults to
+                PROCESS_MIN_ROWS.
+
+        Raises:
+            Exception: The error of the only data source that failed.
+            DataSourceError: If several data sources failed.
+
+        Returns:
+            dict[str, list[dict]]: The result of every checker by data source
+                name in configuration order.
+        """
+        return await self.compile().acall(
+            executor=executor,
+            max_processes=max_processes,
+            process_min_rows=process_min_rows
+        )
+
+    async def acheck_as_completed(
+        self,
+        executor: Executor = None,
+        max_processes: int = None,
+        process_min_rows: int = PROCESS_MIN_ROWS
+    ) -> AsyncIterator[tuple[str, int, dict]]:
+        """
+        Acheck_as_completed method.
+
+        Yields the result of every checker as soon as it is complete, see
+            `Plan.as_completed`.
+
+        Args:
+            executor (Executor, optional): Runs the rules of the checkers.
+                Defaults to None, which is the default executor of the loop.
+            max_processes (int, optional): The number of worker processes
+                that run the rules of the columns, see `ColumnPool`. Defaults
+                to None, which runs them in the executor.
+            process_min_rows (int, optional): Data with fewer rows is checked
+                in the executor even with `max_processes`. Defaults to
+                PROCESS_MIN_ROWS.
+
+        Raises:
+            Exception: The error of the only data source that failed, after
+                the results of every other checker are yielded.
+            DataSourceError: If several data sources failed, likewise.
+
+        Yields:
+            tuple[str, int, dict]: The name of the data source, the position
+                of the checker in its configuration and the checker result.
+        """
+        async for item in self.compile().as_completed(
+            executor=executor,
+            max_processes=max_processes,
+            process_min_rows=process_min_rows
+        ):
+            yield item
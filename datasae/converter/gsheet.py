@@ -44,7 +44,10 @@ class GSheet(DataSource):
         )
 
     def __call__(
-        self, sheet_name: str, gsheet_id: str = None
+        self,
+        sheet_name: str,
+        gsheet_id: str = None,
+        projection: list[str] = None
     ) -> DataFrame:
         """
         __call__ method.
@@ -55,6 +58,8 @@ class GSheet(DataSource):
         Args:
             sheet_name (str): The name a sheet will get data.
             gsheet_id (str, optional): The ID of the Google Spreadsheet.
+            projection (list[str], optional): The only fields of the records
+                to convert. Defaults to None, which converts every field.
 
         Returns:
             DataFrame: A Pandas DataFrame.
@@ -68,5 +73,12 @@ class GSheet(DataSource):
                 else self.gsheet_id
             ).worksheet(sheet_name)
 
+        records: list[dict] = data.get_all_records()
+
         # default index 0 jadi kolom
-        return DataFrame(data.get_all_records())
+        return DataFrame(
+            records,
+            columns=[
+                key for key in records[0].keys() if key in projection
+            ] if projection and records else None
+        )
@@ -7,13 +7,20 @@
 """local library."""
 
 from __future__ import annotations
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
 
-from pandas import DataFrame
+from pandas import DataFrame, read_csv, read_json
 
 from . import DataSource, FileType
 
+try:
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:  # pragma: no cover
+    pq = None  # pragma: no cover
+
 
 @dataclass(repr=False)
 class Local(DataSource):
@@ -24,7 +31,7 @@ class Local(DataSource):
     """
 
     def __call__(
-        self, file_path: str, **kwargs
+        self, file_path: str, projection: list[str] = None, **kwargs
     ) -> DataFrame | bytes:
         """
         __call__ method.
@@ -34,6 +41,8 @@ class Local(DataSource):
 
         Args:
             file_path (str): The file path in the local computer.
+            projection (list[str], optional): The only columns to read, see
+                `DataSource.__call__`. Defaults to None.
             **kwargs: Additional keyword arguments.
 
         Keyword Args:
@@ -56,7 +65,62 @@ class Local(DataSource):
             data: DataFrame | bytes = super().__call__(
                 FileType(Path(file_path).suffix),
                 response.read(),
+                projection=projection,
                 **kwargs
             )
 
         return data
+
+    def chunks(
+        self,
+        chunksize: int,
+        file_path: str,
+        projection: list[str] = None,
+        **kwargs
+    ) -> Iterator[DataFrame]:
+        """
+        Chunks method.
+
+        Streams a file in consecutive chunks of rows without reading it at
+        once: CSV files, JSON files with `lines: true` (NDJSON), and Parquet
+        files by record batches. Other files are read at once and split, see
+        `DataSource.chunks`.
+
+        Args:
+            chunksize (int): The number of rows of every chunk.
+            file_path (str): The file path in the local computer.
+            projection (list[str], optional): The only columns to read.
+                Defaults to None, which reads every column.
+            **kwargs: Additional keyword arguments.
+
+        Yields:
+            DataFrame: The chunks of the file.
+        """
+        file_type: FileType = FileType(Path(file_path).suffix)
+
+        if file_type is FileType.CSV or (
+            file_type is FileType.JSON and kwargs.get('lines')
+        ):
+            read: Callable = read_csv if file_type is FileType.CSV else (
+                read_json
+            )
+
+            with read(
+                file_path,
+                chunksize=chunksize,
+                **self.project(file_type, projection, kwargs)
+            ) as reader:
+                yield from reader
+        elif file_type is FileType.PARQUET and pq is not None:
+            with pq.ParquetFile(file_path) as parquet_file:
+                for batch in parquet_file.iter_batches(
+                    chunksize,
+                    columns=self.project(
+                        file_type, projection, kwargs
+                    ).get('columns')
+                ):
+                    yield batch.to_pandas()
+        else:
+            yield from super().chunks(
+                chunksize, file_path, projection=projection, **kwargs
+            )
@@ -48,7 +48,12 @@ class S3(DataSource):
         })
 
     def __call__(
-        self, object_name: str, bucket_name: str = None, *args, **kwargs
+        self,
+        object_name: str,
+        bucket_name: str = None,
+        *args,
+        projection: list[str] = None,
+        **kwargs
     ) -> DataFrame | bytes:
         """
         __call__ method.
@@ -60,6 +65,8 @@ class S3(DataSource):
             object_name (str): The object name in the bucket.
             bucket_name (str, optional): The name of the S3 bucket.
             *args: Additional positional arguments.
+            projection (list[str], optional): The only columns to read, see
+                `DataSource.__call__`. Defaults to None.
             **kwargs: Additional keyword arguments.
 
         Keyword Args:
@@ -108,6 +115,7 @@ class S3(DataSource):
                 'sheet': FileType.XLSX
             }.get(response.headers.get('Content-Type')),
             response.data,
+            projection=projection,
             **{
                 key: value
                 for key, value in kwargs.items()
@@ -7,14 +7,25 @@
 """sql library."""
 
 from __future__ import annotations
+from collections.abc import Iterator
 from dataclasses import dataclass
 import os
+import re
+from typing import Callable
 
-from pandas import DataFrame
+from pandas import DataFrame, read_sql_query
 from sqlalchemy import create_engine, Engine, URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from . import DataSource, FileType
 
+# A SELECT statement after any leading comments, with no `;` left once the
+# trailing ones are stripped, so a single one: the only queries that can be
+# wrapped in a subquery on every database, see `Sql.select`.
+PLAIN_SELECT: re.Pattern = re.compile(
+    r'(?:\s|--[^\n]*|/\*.*?\*/)*select\b(?!.*;)', re.IGNORECASE | re.DOTALL
+)
+
 
 @dataclass(repr=False)
 class Sql(DataSource):
@@ -49,7 +60,9 @@ class Sql(DataSource):
             URL.create(**super().connection)
         )
 
-    def __call__(self, query: str, *args, **kwargs) -> DataFrame:
+    def __call__(
+        self, query: str, *args, projection: list[str] = None, **kwargs
+    ) -> DataFrame:
         """
         __call__ method.
 
@@ -59,13 +72,130 @@ class Sql(DataSource):
         Args:
             query (str): Sql query.
             *args: Additional positional arguments.
+            projection (list[str], optional): The only columns to select, see
+                `Sql.select`. Defaults to None, which selects every column of
+                the query.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            DataFrame: A Pandas DataFrame.
+        """
+        return super().__call__(
+            FileType.SQL, self.select(query, projection), *args, **kwargs
+        )
+
+    def chunks(
+        self,
+        chunksize: int,
+        query: str,
+        *args,
+        projection: list[str] = None,
+        **kwargs
+    ) -> Iterator[DataFrame]:
+        """
+        Chunks method.
+
+        Streams the result set of the defined sql query in consecutive
+            chunks of rows, on a connection with server side cursors, so the
+            whole result is never fetched at once.
+
+        Args:
+            chunksize (int): The number of rows of every chunk.
+            query (str): Sql query.
+            *args: Additional positional arguments.
+            projection (list[str], optional): The only columns to select, see
+                `Sql.select`. Defaults to None, which selects every column of
+                the query.
+            **kwargs: Additional keyword arguments.
+
+        Yields:
+            DataFrame: The chunks of the result set.
+        """
+        with self.connection.connect() as connection:
+            yield from read_sql_query(
+                self.select(query, projection),
+                connection.execution_options(stream_results=True),
+                *args,
+                chunksize=chunksize,
+                **kwargs
+            )
+
+    async def aload(
+        self, query: str, *args, projection: list[str] = None, **kwargs
+    ) -> DataFrame:
+        """
+        Aload method.
+
+        Converts the data from the defined sql query into a Pandas DataFrame
+            without blocking the event loop. With the `drivername` of an
+            asyncio driver, e.g. `postgresql+asyncpg` or `mysql+aiomysql`,
+            the query runs on an async SQLAlchemy engine, otherwise in a
+            thread, see `DataSource.aload`.
+
+        Args:
+            query (str): Sql query.
+            *args: Additional positional arguments.
+            projection (list[str], optional): The only columns to select, see
+                `Sql.select`. Defaults to None, which selects every column of
+                the query.
             **kwargs: Additional keyword arguments.
 
         Returns:
             DataFrame: A Pandas DataFrame.
         """
+        url: URL = URL.create(**super().connection)
+
+        if not url.get_dialect().is_async:
+            return await super().aload(
+                query, *args, projection=projection, **kwargs
+            )
+
+        query = self.select(query, projection)
+        engine: AsyncEngine = create_async_engine(url)
+
+        try:
+            async with engine.connect() as connection:
+                return await connection.run_sync(
+                    lambda sync_connection: read_sql_query(
+                        query, sync_connection, *args, **kwargs
+                    )
+                )
+        finally:
+            await engine.dispose()
+
+    def select(self, query: str, projection: list[str] = None) -> str:
+        """
+        Select method.
+
+        Reads the query from a .sql file if it is a path, and wraps it in a
+            subquery that selects the projection if it is a single plain
+            SELECT statement. Any other query, e.g. with a WITH clause, or
+            not a SELECT at all, like EXEC or SHOW, runs as is and every
+            column of it is loaded.
+
+        Args:
+            query (str): Sql query or the path of a .sql file.
+            projection (list[str], optional): The only columns to select.
+                Defaults to None, which selects every column of the query.
+
+        Returns:
+            str: The query to run.
+        """
         if os.path.isfile(query):
             with open(query) as file:
                 query = file.read()
 
-        return super().__call__(FileType.SQL, query, *args, **kwargs)
+        statement: str = query.strip().rstrip(';')
+
+        if projection and PLAIN_SELECT.match(statement):
+            quote: Callable[[str], str] = URL.create(
+                **super().connection
+            ).get_dialect()().identifier_preparer.quote
+            # On lines of its own, a trailing line comment of the statement
+            # can not comment out the end of the subquery.
+            query = (
+                f"SELECT {', '.join(map(quote, projection))} "
+                f"FROM (\n{statement}\n) AS projection"
+            )
+
+        return query
@@ -58,3 +58,17 @@ class InvalidDataValueWarning(Exception):
         message = warning_data
         super().__init__(message)
         self.message = message
+
+
+class DataSourceError(Exception):
+    """Exception class that is raised when checking data sources failed."""
+
+    def __init__(self, errors, results):
+        """__init__ method."""
+        self.errors = errors
+        self.results = results
+        message = 'Checking failed for data source ' + ', '.join(
+            f"'{name}' ({error!r})" for name, error in errors.items()
+        ) + '.'
+        super().__init__(message)
+        self.message = message
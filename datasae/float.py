@@ -6,10 +6,13 @@
 
 """Float library."""
 
+from __future__ import annotations
+from typing import Callable
+
+import numpy as np
 import pandas as pd
 
-from .exception import InvalidDataTypeWarning, InvalidDataValueWarning
-from .utils import Basic, create_warning_data, WarningDataMessage
+from .utils import Basic, create_warning_data, isin, summarize_values
 
 
 class WarningDataDetailMessage:
@@ -19,7 +22,15 @@ class WarningDataDetailMessage:
 
 
 class Float(Basic):
-    """Float class."""
+    """
+    Float class.
+
+    NaN is a float, so it never counts as an invalid data type. Instead every
+    rule reports NaN as an invalid value, including `not_in`, because NaN can
+    not be meaningfully compared with any limit or listed value.
+    """
+
+    data_type: type = float
 
     def __init__(self, dataFrame: pd.DataFrame):
         """
@@ -270,7 +281,7 @@ class Float(Basic):
         check_not_in method.
 
         Check if a given float value is not present in a specified
-            list of values.
+            list of values. NaN is always invalid, like in `not_in`.
 
         Args:
             float_data (float): The float value to be checked.
@@ -288,7 +299,7 @@ class Float(Basic):
         invalid = 0
         warning_data = {}
 
-        if float_data not in value:
+        if float_data == float_data and float_data not in value:
             valid = 1
         else:
             invalid = 1
@@ -298,7 +309,86 @@ class Float(Basic):
 
         return valid, invalid, warning_data
 
-    def equal_to(self, value: float, column: str) -> dict:
+    @staticmethod
+    def dtype_type_mask(data: pd.Series) -> bool | np.ndarray | None:
+        """
+        dtype_type_mask method.
+
+        Decides from the dtype which values of a column are floats.
+
+        Args:
+            data (pd.Series): The column to be checked.
+
+        Returns:
+            bool | np.ndarray | None: True if every value is a float, False if
+                none is, a boolean mask if only missing values are not, or
+                None if the values have to be inspected.
+        """
+        if pd.api.types.is_extension_array_dtype(data.dtype):
+            if pd.api.types.is_float_dtype(data.dtype):
+                return data.notna().to_numpy()
+        elif pd.api.types.is_float_dtype(data.dtype):
+            return True
+        elif pd.api.types.is_integer_dtype(
+            data.dtype
+        ) or pd.api.types.is_bool_dtype(data.dtype):
+            return False
+
+        return None
+
+    def evaluate(
+        self,
+        column: str,
+        condition: Callable[[np.ndarray], np.ndarray],
+        detail_message: str
+    ) -> dict:
+        """
+        Evaluate method.
+
+        Applies a vectorized condition to every float value of a column in
+            one pass over a float64 array and builds the data quality result.
+            NaN values are always reported as invalid values.
+
+        Args:
+            column (str): The name of the column in the DataFrame to check.
+            condition (Callable[[np.ndarray], np.ndarray]): Function that
+                receives the float values and returns a boolean mask, True
+                where the value is valid.
+            detail_message (str): Warning detail message for invalid values.
+
+        Returns:
+            dict: A dictionary containing the result of the data quality check,
+                including the number of valid and invalid values,
+                and any warning messages.
+        """
+        data: pd.Series = self.dataFrame[column]
+        type_mask: np.ndarray = self.type_mask(column)
+        value_mask: np.ndarray = np.zeros(len(data), dtype=bool)
+
+        if type_mask.any():
+            float_data: np.ndarray = self.cache(
+                column,
+                'values',
+                lambda: (
+                    data.to_numpy()
+                    if type_mask.all() else data.to_numpy()[type_mask]
+                ).astype(np.float64, copy=False)
+            )
+            value_mask[type_mask] = condition(float_data) & self.cache(
+                column, 'not_nan', lambda: ~np.isnan(float_data)
+            )
+
+        return self.mask_response(
+            data,
+            type_mask,
+            value_mask,
+            detail_message,
+            WarningDataDetailMessage.FLOAT_DATA_TYPE
+        )
+
+    def equal_to(
+        self, value: float, column: str, tolerance: float = 0.
+    ) -> dict:
         """
         equal_to method.
 
@@ -308,42 +398,30 @@ class Float(Basic):
         Args:
             value (float): The value to compare the column values against.
             column (str): The name of the column in the DataFrame to check.
+            tolerance (float, optional): The maximum absolute difference
+                between a column value and `value` that still counts as
+                equal. Defaults to 0.
 
         Returns:
             dict: A dictionary containing the result of the data quality check,
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, float_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(float_data, (float)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_equal(
-                    float_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    float_data,
-                    WarningDataDetailMessage.FLOAT_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        def condition(float_data: np.ndarray) -> np.ndarray:
+            mask: np.ndarray = float_data == value
+
+            if tolerance:
+                with np.errstate(invalid='ignore'):
+                    mask |= np.abs(float_data - value) <= tolerance
+
+            return mask
+
+        return self.evaluate(
+            column,
+            condition,
+            f"Value should be equal to {value}"
+            + (f" with tolerance {tolerance}" if tolerance else "")
+        )
 
     def less_than(self, value: float, column: str) -> dict:
         """
@@ -361,34 +439,11 @@ class Float(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, float_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(float_data, (float)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = self.check_less_than(
-                    float_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    float_data,
-                    WarningDataDetailMessage.FLOAT_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda float_data: float_data < value,
+            f"Value should be less than {value}"
+        )
 
     def less_than_equal(self, value: float, column: str) -> dict:
         """
@@ -406,35 +461,11 @@ class Float(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, float_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(float_data, (float)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = (
-                    self.check_less_than_equal(float_data, value)
-                    )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    float_data,
-                    WarningDataDetailMessage.FLOAT_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda float_data: float_data <= value,
+            f"Value should be less than equal {value}"
+        )
 
     def greater_than(self, value: float, column: str) -> dict:
         """
@@ -452,35 +483,11 @@ class Float(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, float_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(float_data, (float)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = self.check_greater_than(
-                    float_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    float_data,
-                    WarningDataDetailMessage.FLOAT_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda float_data: float_data > value,
+            f"Value should be greater than {value}"
+        )
 
     def greater_than_equal(self, value: float, column: str) -> dict:
         """
@@ -498,38 +505,11 @@ class Float(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, float_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(float_data, (float)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_greater_than_equal(float_data, value)
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    float_data,
-                    WarningDataDetailMessage.FLOAT_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda float_data: float_data >= value,
+            f"Value should be greater than equal {value}"
+        )
 
     def in_range(
         self, lower_limit: float, upper_limit: float, column: str
@@ -550,35 +530,13 @@ class Float(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, float_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(float_data, (float)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = self.check_in_range(
-                    float_data, lower_limit, upper_limit
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    float_data,
-                    WarningDataDetailMessage.FLOAT_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda float_data: (float_data >= lower_limit)
+            & (float_data <= upper_limit),
+            "Value should be in the range of "
+            f"{lower_limit} and {upper_limit}"
+        )
 
     def is_in(self, value: list, column: str) -> dict:
         """
@@ -596,36 +554,11 @@ class Float(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, float_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(float_data, (float)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_is_in(
-                    float_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    float_data,
-                    WarningDataDetailMessage.FLOAT_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda float_data: isin(float_data, value),
+            f"Value should be in {summarize_values(value)}"
+        )
 
     def not_in(self, value: list, column: str) -> dict:
         """
@@ -643,32 +576,8 @@ class Float(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, float_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(float_data, (float)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = self.check_not_in(
-                    float_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    float_data,
-                    WarningDataDetailMessage.FLOAT_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda float_data: ~isin(float_data, value),
+            f"Value should be not in {summarize_values(value)}"
+        )
@@ -6,10 +6,13 @@
 
 """Integer library."""
 
+from __future__ import annotations
+from typing import Callable
+
+import numpy as np
 import pandas as pd
 
-from .exception import InvalidDataTypeWarning, InvalidDataValueWarning
-from .utils import Basic, create_warning_data, WarningDataMessage
+from .utils import Basic, create_warning_data, isin, summarize_values
 
 
 class WarningDataDetailMessage:
@@ -18,9 +21,15 @@ class WarningDataDetailMessage:
     INTEGER_DATA_TYPE: str = "Value must be of integer data type"
 
 
+# 10 ** 1 up to 10 ** 19, the largest power of ten that fits in uint64.
+POWERS_OF_TEN: np.ndarray = 10 ** np.arange(1, 20, dtype=np.uint64)
+
+
 class Integer(Basic):
     """Integer class."""
 
+    data_type: type = int
+
     def __init__(self, dataFrame: pd.DataFrame):
         """
         __init__ method.
@@ -331,6 +340,160 @@ class Integer(Basic):
 
         return valid, invalid, warning_data
 
+    @staticmethod
+    def dtype_type_mask(data: pd.Series) -> bool | np.ndarray | None:
+        """
+        dtype_type_mask method.
+
+        Decides from the dtype which values of a column are integers.
+
+        Args:
+            data (pd.Series): The column to be checked.
+
+        Returns:
+            bool | np.ndarray | None: True if every value is an integer,
+                False if none is, a boolean mask if only missing values are
+                not, or None if the values have to be inspected.
+        """
+        if pd.api.types.is_extension_array_dtype(data.dtype):
+            if pd.api.types.is_integer_dtype(
+                data.dtype
+            ) or pd.api.types.is_bool_dtype(data.dtype):
+                return data.notna().to_numpy()
+        elif pd.api.types.is_integer_dtype(
+            data.dtype
+        ) or pd.api.types.is_bool_dtype(data.dtype):
+            return True
+        elif pd.api.types.is_float_dtype(data.dtype):
+            return False
+
+        return None
+
+    @staticmethod
+    def as_comparable(integer_data: np.ndarray) -> np.ndarray:
+        """
+        as_comparable method.
+
+        Returns integer values that compare exactly with any Python integer.
+            A bool array is viewed, without a copy, as uint8, because numpy
+            raises OverflowError when it compares bools with an integer
+            beyond the int64 range, where integer arrays simply compare.
+
+        Args:
+            integer_data (np.ndarray): The integer values.
+
+        Returns:
+            np.ndarray: The integer values, ready for comparisons.
+        """
+        if integer_data.dtype.kind == 'b':
+            return integer_data.view(np.uint8)
+
+        return integer_data
+
+    @staticmethod
+    def digit_count(integer_data: np.ndarray) -> np.ndarray:
+        """
+        digit_count method.
+
+        Counts the decimal digits of every integer without converting it to a
+            string. A negative integer counts its minus sign as one more
+            character, so the length of an integer is the length of
+            `str(integer_data)`. Booleans keep their string length too, 4 for
+            True and 5 for False.
+
+        Args:
+            integer_data (np.ndarray): The integer values.
+
+        Returns:
+            np.ndarray: The length of every integer value.
+        """
+        if integer_data.dtype.kind == 'b':
+            return np.where(integer_data, len(str(True)), len(str(False)))
+
+        if integer_data.dtype == object:
+            boolean: np.ndarray = np.fromiter(
+                (
+                    isinstance(value, (bool, np.bool_))
+                    for value in integer_data
+                ),
+                dtype=bool,
+                count=len(integer_data)
+            )
+
+            if boolean.any():
+                digits: np.ndarray = np.zeros(len(integer_data), dtype=int)
+                digits[boolean] = Integer.digit_count(
+                    integer_data[boolean].astype(bool)
+                )
+                digits[~boolean] = Integer.digit_count(
+                    integer_data[~boolean]
+                )
+                return digits
+
+        if integer_data.dtype.kind == 'u':
+            magnitude: np.ndarray = integer_data.astype(np.uint64, copy=False)
+            sign: np.ndarray | int = 0
+        else:
+            try:
+                integer_data = np.asarray(integer_data, dtype=np.int64)
+            except OverflowError:
+                # Python integers beyond int64 have no fixed width kernel.
+                return pd.Series(integer_data, dtype=object).map(
+                    lambda value: len(str(int(value)))
+                ).to_numpy()
+
+            magnitude: np.ndarray = np.abs(integer_data).view(np.uint64)
+            sign: np.ndarray | int = integer_data < 0
+
+        return 1 + np.searchsorted(
+            POWERS_OF_TEN, magnitude, side='right'
+        ) + sign
+
+    def evaluate(
+        self,
+        column: str,
+        condition: Callable[[np.ndarray], np.ndarray],
+        detail_message: str
+    ) -> dict:
+        """
+        Evaluate method.
+
+        Applies a vectorized condition to every integer value of a column in
+            one pass and builds the data quality result.
+
+        Args:
+            column (str): The name of the column in the DataFrame to check.
+            condition (Callable[[np.ndarray], np.ndarray]): Function that
+                receives the integer values and returns a boolean mask, True
+                where the value is valid.
+            detail_message (str): Warning detail message for invalid values.
+
+        Returns:
+            dict: A dictionary containing the result of the data quality check,
+                including the number of valid and invalid values,
+                and any warning messages.
+        """
+        data: pd.Series = self.dataFrame[column]
+        type_mask: np.ndarray = self.type_mask(column)
+        value_mask: np.ndarray = np.zeros(len(data), dtype=bool)
+
+        if type_mask.any():
+            integer_data: np.ndarray = self.cache(
+                column,
+                'values',
+                lambda: data.to_numpy()
+                if type_mask.all() else data.to_numpy()[type_mask]
+            )
+            value_mask[type_mask] = condition(integer_data)
+
+        return self.mask_response(
+            data,
+            type_mask,
+            value_mask,
+            detail_message,
+            WarningDataDetailMessage.INTEGER_DATA_TYPE
+        )
+
     def equal_to(self, value: int, column: str) -> dict:
         """
         equal_to method.
@@ -347,36 +510,11 @@ class Integer(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, integer_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(integer_data, (int)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_equal(
-                    integer_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    integer_data,
-                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda integer_data: self.as_comparable(integer_data) == value,
+            f"Value should be equal to {value}"
+        )
 
     def less_than(self, value: int, column: str) -> dict:
         """
@@ -394,36 +532,11 @@ class Integer(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, integer_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(integer_data, (int)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_less_than(
-                    integer_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    integer_data,
-                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda integer_data: self.as_comparable(integer_data) < value,
+            f"Value should be less than {value}"
+        )
 
     def less_than_equal(self, value: int, column: str) -> dict:
         """
@@ -441,38 +554,11 @@ class Integer(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, integer_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(integer_data, (int)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_less_than_equal(integer_data, value)
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    integer_data,
-                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda integer_data: self.as_comparable(integer_data) <= value,
+            f"Value should be less than equal {value}"
+        )
 
     def greater_than(self, value: int, column: str) -> dict:
         """
@@ -490,36 +576,11 @@ class Integer(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, integer_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(integer_data, (int)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_greater_than(
-                    integer_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    integer_data,
-                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda integer_data: self.as_comparable(integer_data) > value,
+            f"Value should be greater than {value}"
+        )
 
     def greater_than_equal(self, value: int, column: str) -> dict:
         """
@@ -537,38 +598,11 @@ class Integer(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, integer_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(integer_data, (int)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_greater_than_equal(integer_data, value)
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    integer_data,
-                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda integer_data: self.as_comparable(integer_data) >= value,
+            f"Value should be greater than equal {value}"
+        )
 
     def in_range(
         self, lower_limit: int, upper_limit: int, column: str
@@ -589,36 +623,14 @@ class Integer(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, integer_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(integer_data, (int)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_in_range(
-                    integer_data, lower_limit, upper_limit
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    integer_data,
-                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda integer_data: (
+                self.as_comparable(integer_data) >= lower_limit
+            ) & (self.as_comparable(integer_data) <= upper_limit),
+            "Value should be in the range of "
+            f"{lower_limit} and {upper_limit}"
+        )
 
     def is_in(self, value: list, column: str) -> dict:
         """
@@ -636,36 +648,11 @@ class Integer(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, integer_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(integer_data, (int)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_is_in(
-                    integer_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    integer_data,
-                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda integer_data: isin(integer_data, value),
+            f"Value should be in {summarize_values(value)}"
+        )
 
     def not_in(self, value: list, column: str) -> dict:
         """
@@ -683,36 +670,11 @@ class Integer(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, integer_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(integer_data, (int)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_not_in(
-                    integer_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    integer_data,
-                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda integer_data: ~isin(integer_data, value),
+            f"Value should be not in {summarize_values(value)}"
+        )
 
     def length(self, value: int, column: str) -> dict:
         """
@@ -731,33 +693,8 @@ class Integer(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, integer_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(integer_data, (int)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_length(
-                    integer_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    integer_data,
-                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda integer_data: self.digit_count(integer_data) == value,
+            f"Value should have a length of {value}"
+        )
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+
+# Copyright (C) Free Software Foundation, Inc. All rights reserved.
+# Licensed under the AGPL-3.0-only License. See LICENSE in the project root
+# for license information.
+
+"""
+Kernel library.
+
+Scalar rule kernels for validating records one at a time, e.g. inline in a
+stream consumer. A `RecordChecker` is compiled once from the same `column`
+configuration as `DataSource.checker`; checking a record then returns a
+status code and allocates nothing when the record is valid.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from functools import partial
+import operator
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+
+from .boolean import Boolean
+from .float import Float
+from .integer import Integer
+from .string import AHO_CORASICK_MIN_PATTERNS, String
+from .timestamp import Timestamp
+from .utils import (
+    AhoCorasick,
+    compile_regex,
+    locate_type,
+    rule_arguments
+)
+
+VALID: int = 0
+INVALID_VALUE: int = 1
+INVALID_DATA_TYPE: int = 2
+
+
+def in_range(lower_limit: Any, upper_limit: Any) -> Callable[[Any], bool]:
+    """
+    Compile the in_range rule.
+
+    Args:
+        lower_limit (Any): The lower limit, inclusive.
+        upper_limit (Any): The upper limit, inclusive.
+
+    Returns:
+        Callable[[Any], bool]: The predicate of the rule.
+    """
+    return lambda data: lower_limit <= data <= upper_limit
+
+
+def is_in(value: list) -> Callable[[Any], bool]:
+    """
+    Compile the is_in rule.
+
+    Args:
+        value (list): The list of values.
+
+    Returns:
+        Callable[[Any], bool]: The predicate of the rule.
+    """
+    return frozenset(value).__contains__
+
+
+def not_in(value: list) -> Callable[[Any], bool]:
+    """
+    Compile the not_in rule.
+
+    Args:
+        value (list): The list of values.
+
+    Returns:
+        Callable[[Any], bool]: The predicate of the rule.
+    """
+    lookup: frozenset = frozenset(value)
+
+    return lambda data: data not in lookup
+
+
+def length(value: int) -> Callable[[int], bool]:
+    """
+    Compile the Integer length rule.
+
+    The digits are counted arithmetically with the sign rule of
+    `Integer.digit_count`: a minus sign counts as one more character, and a
+    boolean keeps the length of its string, 4 for True and 5 for False.
+
+    Args:
+        value (int): The expected length.
+
+    Returns:
+        Callable[[int], bool]: The predicate of the rule.
+    """
+    def bounds(digits: int) -> tuple[int, int]:
+        if digits < 1:
+            return 0, 0
+
+        return (10 ** (digits - 1) if digits > 1 else 0), 10 ** digits
+
+    positive: tuple[int, int] = bounds(value)
+    negative: tuple[int, int] = bounds(value - 1)
+
+    def predicate(data: int) -> bool:
+        if isinstance(data, bool):
+            return len(str(data)) == value
+
+        return (
+            positive[0] <= data < positive[1]
+            if data >= 0
+            else negative[0] <= -data < negative[1]
+        )
+
+    return predicate
+
+
+def float_equal_to(
+    value: float, tolerance: float = 0.
+) -> Callable[[float], bool]:
+    """
+    Compile the Float equal_to rule.
+
+    Args:
+        value (float): The expected value.
+        tolerance (float, optional): The absolute tolerance. Defaults to 0.
+
+    Returns:
+        Callable[[float], bool]: The predicate of the rule.
+    """
+    return lambda data: data == value or abs(data - value) <= tolerance
+
+
+def is_in_contain(str_is_in_contain: list) -> Callable[[str], bool]:
+    """
+    Compile the String is_in_contain rule.
+
+    Args:
+        str_is_in_contain (list): The substrings.
+
+    Returns:
+        Callable[[str], bool]: The predicate of the rule.
+    """
+    patterns: tuple = tuple(str_is_in_contain)
+
+    if len(patterns) > AHO_CORASICK_MIN_PATTERNS:
+        return AhoCorasick(patterns).search
+
+    def contains(data: str) -> bool:
+        for pattern in patterns:
+            if pattern in data:
+                return True
+
+        return False
+
+    return contains
+
+
+def special_char_contain(char: str) -> Callable[[str], bool]:
+    """
+    Compile the String special_char_contain rule.
+
+    Like `String.special_char_contain`, strings are never invalid for a
+    character that is not a special character.
+
+    Args:
+        char (str): The special character.
+
+    Returns:
+        Callable[[str], bool]: The predicate of the rule.
+    """
+    if char not in """[!"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~""":
+        return lambda data: True
+
+    return lambda data: char in data
+
+
+def not_nan(
+    compile_rule: Callable[..., Callable[[float], bool]]
+) -> Callable[..., Callable[[float], bool]]:
+    """
+    Make a Float rule fail for NaN, which is never a valid value, see Float.
+
+    Args:
+        compile_rule (Callable[..., Callable[[float], bool]]): Function that
+            compiles the rule.
+
+    Returns:
+        Callable[..., Callable[[float], bool]]: Function that compiles the
+            rule failing for NaN.
+    """
+    def compile_not_nan(*args: Any, **kwargs: Any) -> Callable[[float], bool]:
+        predicate: Callable[[float], bool] = compile_rule(*args, **kwargs)
+
+        return lambda data: data == data and predicate(data)
+
+    return compile_not_nan
+
+
+def timestamp(
+    compile_rule: Callable[..., Callable[[datetime], bool]]
+) -> Callable[..., Callable[[datetime], bool]]:
+    """
+    Convert the parameters of a Timestamp rule to timestamps.
+
+    Args:
+        compile_rule (Callable[..., Callable[[datetime], bool]]): Function
+            that compiles the rule from timestamps.
+
+    Returns:
+        Callable[..., Callable[[datetime], bool]]: Function that compiles the
+            rule from timestamps or their string representation, converted
+            like `Timestamp.to_timestamp` does for a column.
+    """
+    return lambda *args, **kwargs: compile_rule(
+        *map(Timestamp.to_timestamp, args),
+        **{
+            key: Timestamp.to_timestamp(value)
+            for key, value in kwargs.items()
+        }
+    )
+
+
+COMPARISON_RULES: dict[str, Callable[..., Callable[[Any], bool]]] = {
+    'equal_to': lambda value: partial(operator.eq, value),
+    'less_than': lambda value: partial(operator.gt, value),
+    'less_than_equal': lambda value: partial(operator.ge, value),
+    'greater_than': lambda value: partial(operator.lt, value),
+    'greater_than_equal': lambda value: partial(operator.le, value),
+    'in_range': in_range,
+    'is_in': is_in,
+    'not_in': not_in
+}
+
+# Rules of a checker class, each compiled from the same parameters as the
+# rule method of the class.
+KERNELS: dict[type, dict[str, Callable[..., Callable[[Any], bool]]]] = {
+    Boolean: {
+        'is_bool': lambda: None,
+        'is_in': is_in
+    },
+    Float: {
+        **COMPARISON_RULES,
+        'equal_to': float_equal_to,
+        'not_in': not_nan(not_in)
+    },
+    Integer: {
+        **COMPARISON_RULES,
+        'length': length
+    },
+    String: {
+        'exact': lambda str_exact: partial(operator.eq, str_exact),
+        'is_in_contain': is_in_contain,
+        'is_in_exact': is_in,
+        'contain': lambda str_contain: lambda data: str_contain in data,
+        'not_contain': lambda str_not_contain: (
+            lambda data: str_not_contain not in data
+        ),
+        'regex_contain': lambda regex_data: (
+            lambda data: compile_regex(regex_data).search(data) is not None
+        ),
+        'special_char_contain': special_char_contain,
+        'is_uppercase': lambda: str.isupper,
+        'is_lowercase': lambda: str.islower,
+        'is_capitalize_first_word': lambda: (
+            lambda data: data.strip()[:1].isupper()
+        ),
+        'is_capitalize_all_word': lambda: str.istitle
+    },
+    Timestamp: {
+        rule: timestamp(compile_rule)
+        for rule, compile_rule in COMPARISON_RULES.items()
+    }
+}
+
+
+# Rules that check any value, regardless of the data type of the class.
+UNTYPED_RULES: set[tuple[type, str]] = {(Boolean, 'is_in')}
+
+
+class Kernel:
+    """
+    Kernel class.
+
+    One rule compiled for one column. Calling it with a value returns
+    `VALID`, `INVALID_VALUE` or `INVALID_DATA_TYPE`.
+
+    Attributes:
+        column (str): The name of the column.
+        rule (str): The name of the rule method.
+        params (Any): The parameters of the rule from the configuration.
+        data_type (type): The Python type the value is expected to have.
+        predicate (Callable[[Any], bool]): Function that returns True if a
+            value of the expected type passes the rule, or None if the rule
+            only checks the data type.
+        failure (int): The status of a value that fails the predicate.
+    """
+
+    __slots__ = (
+        'column', 'rule', 'params', 'data_type', 'predicate', 'failure'
+    )
+
+    def __init__(
+        self,
+        column: str,
+        rule: str,
+        params: Any,
+        data_type: type,
+        predicate: Callable[[Any], bool],
+        failure: int = INVALID_VALUE
+    ):
+        """
+        __init__ method.
+
+        Initializes an instance of the Kernel class.
+
+        Args:
+            column (str): The name of the column.
+            rule (str): The name of the rule method.
+            params (Any): The parameters of the rule from the configuration.
+            data_type (type): The Python type the value is expected to have.
+            predicate (Callable[[Any], bool]): Function that returns True if
+                a value of the expected type passes the rule, or None if the
+                rule only checks the data type.
+            failure (int, optional): The status of a value that fails the
+                predicate. Defaults to INVALID_VALUE.
+        """
+        self.column = column
+        self.rule = rule
+        self.params = params
+        self.data_type = data_type
+        self.predicate = predicate
+        self.failure = failure
+
+    def __call__(self, value: Any) -> int:
+        """
+        __call__ method.
+
+        Checks one value.
+
+        Args:
+            value (Any): The value to be checked.
+
+        Returns:
+            int: The status code of the value.
+        """
+        if not isinstance(value, self.data_type):
+            return INVALID_DATA_TYPE
+
+        if self.predicate is None:
+            return VALID
+
+        try:
+            return VALID if self.predicate(value) else self.failure
+        except TypeError:
+            # E.g. comparing a naive with an aware timestamp.
+            return self.failure
+
+
+class RecordChecker:
+    """
+    RecordChecker class.
+
+    All rules of a `column` configuration of a checker, compiled once and
+    reusable for any number of records.
+
+    Attributes:
+        kernels (tuple[Kernel]): The compiled rules, in configuration order.
+    """
+
+    def __init__(self, column: dict):
+        """
+        __init__ method.
+
+        Compiles the rules of a `column` configuration, the mapping of column
+            names to data types to rules used by `DataSource.checker`.
+
+        Args:
+            column (dict): The `column` configuration of a checker.
+
+        Raises:
+            ValueError: If a data type or a rule has no kernel.
+        """
+        kernels: list = []
+
+        for column_name, data_type_list in column.items():
+            for data_type, rules in data_type_list.items():
+                checker_class: Any = {
+                    'boolean': Boolean,
+                    'float': Float,
+                    'integer': Integer,
+                    'string': String,
+                    'timestamp': Timestamp
+                }.get(data_type.lower()) or locate_type(data_type)
+                compilers: dict = KERNELS.get(checker_class, {})
+
+                for rule, params in rules.items():
+                    if rule not in compilers:
+                        raise ValueError(
+                            f"Rule '{rule}' of data type '{data_type}' has no "
+                            'kernel.'
+                        )
+
+                    kernels.append(Kernel(
+                        column_name,
+                        rule,
+                        params,
+                        object
+                        if (checker_class, rule) in UNTYPED_RULES
+                        else checker_class.data_type,
+                        self.compile(compilers[rule], params),
+                        INVALID_DATA_TYPE
+                        if checker_class is Boolean else INVALID_VALUE
+                    ))
+
+        self.kernels = tuple(kernels)
+
+    @staticmethod
+    def compile(
+        compile_rule: Callable[..., Callable[[Any], bool]], params: Any
+    ) -> Callable[[Any], bool]:
+        """
+        Compile method.
+
+        Compiles a rule with its parameters from the configuration, see
+            `rule_arguments`.
+
+        Args:
+            compile_rule (Callable[..., Callable[[Any], bool]]): Function
+                that compiles the rule.
+            params (Any): Keyword arguments (dict), positional arguments
+                (list), a single argument, or nothing.
+
+        Returns:
+            Callable[[Any], bool]: The predicate of the rule.
+        """
+        args, kwargs, _ = rule_arguments(params)
+
+        return compile_rule(*args, **kwargs)
+
+    def check(self, record: Mapping) -> int:
+        """
+        Check method.
+
+        Checks one record against every rule, stopping at the first failure.
+
+        Args:
+            record (Mapping): Column names mapped to values. A missing column
+                has an invalid data type.
+
+        Returns:
+            int: `VALID`, or the status code of the first failing rule.
+        """
+        for kernel in self.kernels:
+            status: int = kernel(record.get(kernel.column))
+
+            if status:
+                return status
+
+        return VALID
+
+    def check_batch(self, records: Iterable[Mapping]) -> np.ndarray:
+        """
+        check_batch method.
+
+        Checks a small batch of records.
+
+        Args:
+            records (Iterable[Mapping]): The records.
+
+        Returns:
+            np.ndarray: The int8 status code of every record.
+        """
+        return np.fromiter(map(self.check, records), dtype=np.int8)
+
+    def failures(self, record: Mapping) -> list[tuple[Kernel, int]]:
+        """
+        Failures method.
+
+        Explains why a record is not valid.
+
+        Args:
+            record (Mapping): Column names mapped to values.
+
+        Returns:
+            list[tuple[Kernel, int]]: Every failing rule with its status code.
+        """
+        return [
+            (kernel, status)
+            for kernel in self.kernels
+            if (status := kernel(record.get(kernel.column)))
+        ]
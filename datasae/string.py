@@ -6,12 +6,30 @@
 
 """String library."""
 
+from __future__ import annotations
 import re
+from typing import Callable
 
+import numpy as np
 import pandas as pd
 
-from .exception import InvalidDataTypeWarning, InvalidDataValueWarning
-from .utils import Basic, create_warning_data, WarningDataMessage
+from .utils import (
+    AhoCorasick,
+    Basic,
+    compile_regex,
+    create_warning_data,
+    summarize_values
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ModuleNotFoundError:  # pragma: no cover
+    pa = None  # pragma: no cover
+
+# Below this many patterns searching the text once per pattern is faster
+# than walking it through an Aho-Corasick automaton in Python.
+AHO_CORASICK_MIN_PATTERNS: int = 64
 
 
 class WarningDataDetailMessage:
@@ -23,6 +41,8 @@ class WarningDataDetailMessage:
 class String(Basic):
     """String class."""
 
+    data_type: type = str
+
     def __init__(self, dataFrame: pd.DataFrame):
         """
         __init__ method.
@@ -227,8 +247,7 @@ class String(Basic):
         valid = 0
         invalid = 0
         warning_data = {}
-        regexp = re.compile(r"{}".format(regex_data))
-        if regexp.search(compare_data):
+        if compile_regex(regex_data).search(compare_data):
             valid = 1
         else:
             invalid = 1
@@ -399,6 +418,115 @@ class String(Basic):
 
         return valid, invalid, warning_data
 
+    @staticmethod
+    def is_arrow(data: pd.Series) -> bool:
+        """
+        is_arrow method.
+
+        Check if a column holds its strings in an Arrow array, so the rules
+            can run Arrow compute kernels directly on it.
+
+        Args:
+            data (pd.Series): The column to be checked.
+
+        Returns:
+            bool: True if the column is Arrow-backed string data.
+        """
+        if pa is None:
+            return False  # pragma: no cover
+
+        if isinstance(data.dtype, pd.ArrowDtype):
+            return pa.types.is_string(
+                data.dtype.pyarrow_dtype
+            ) or pa.types.is_large_string(data.dtype.pyarrow_dtype)
+
+        return isinstance(
+            data.dtype, pd.StringDtype
+        ) and data.dtype.storage.startswith('pyarrow')
+
+    @staticmethod
+    def dtype_type_mask(data: pd.Series) -> bool | np.ndarray | None:
+        """
+        dtype_type_mask method.
+
+        Decides from the dtype which values of a column are strings.
+
+        Args:
+            data (pd.Series): The column to be checked.
+
+        Returns:
+            bool | np.ndarray | None: True if every value is a string, False if
+                none is, a boolean mask if only missing values are not, or
+                None if the values have to be inspected.
+        """
+        if isinstance(data.dtype, pd.StringDtype) or String.is_arrow(data):
+            return data.notna().to_numpy()
+        elif data.dtype.kind in 'biufcmM':
+            return False
+
+        return None
+
+    def evaluate(
+        self,
+        column: str,
+        condition: Callable[[pd.Series], np.ndarray],
+        detail_message: str,
+        arrow_condition: Callable = None
+    ) -> dict:
+        """
+        Evaluate method.
+
+        Applies a vectorized string condition to every string value of a
+            column and builds the data quality result. Arrow-backed columns
+            are evaluated with Arrow compute kernels when `arrow_condition` is
+            given, other columns with the pandas `.str` accessor.
+
+        Args:
+            column (str): The name of the column in the DataFrame to check.
+            condition (Callable[[pd.Series], np.ndarray]): Function that
+                receives the string values as an object Series and returns a
+                boolean mask, True where the value is valid.
+            detail_message (str): Warning detail message for invalid values.
+            arrow_condition (Callable, optional): Function that receives the
+                column as a pyarrow array and returns a pyarrow boolean array.
+                Defaults to None.
+
+        Returns:
+            dict: A dictionary containing the result of the data quality check,
+                including the number of valid and invalid values,
+                and any warning messages.
+        """
+        data: pd.Series = self.dataFrame[column]
+        type_mask: np.ndarray = self.type_mask(column)
+        value_mask: np.ndarray = np.zeros(len(data), dtype=bool)
+
+        if arrow_condition is not None and self.is_arrow(data):
+            value_mask[:] = pc.fill_null(
+                arrow_condition(
+                    self.cache(column, 'arrow', lambda: pa.array(data.array))
+                ),
+                False
+            ).to_numpy(zero_copy_only=False)
+        elif type_mask.any():
+            value_mask[type_mask] = np.asarray(
+                condition(self.cache(
+                    column,
+                    'values',
+                    lambda: pd.Series(
+                        data.to_numpy()[type_mask], dtype=object
+                    )
+                )),
+                dtype=bool
+            )
+
+        return self.mask_response(
+            data,
+            type_mask,
+            value_mask,
+            detail_message,
+            WarningDataDetailMessage.STRING_DATA_TYPE
+        )
+
     def exact(self, str_exact: str, column: str) -> dict:
         """
         Exact method.
@@ -414,33 +542,12 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = self.check_exact(
-                    str_exact, str_data
-                )
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda str_data: str_data == str_exact,
+            f"Value should be exact to {str_exact}",
+            lambda str_data: pc.equal(str_data, str_exact)
+        )
 
     def is_in_contain(self, str_is_in_contain: list, column: str) -> dict:
         """
@@ -457,35 +564,25 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_is_in_contain(str_is_in_contain, str_data)
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        patterns: list = list(str_is_in_contain)
+
+        if len(patterns) > AHO_CORASICK_MIN_PATTERNS:
+            contains: Callable[[str], bool] = AhoCorasick(patterns).search
+        else:
+            def contains(str_data: str) -> bool:
+                return any(pattern in str_data for pattern in patterns)
+
+        def condition(str_data: pd.Series) -> np.ndarray:
+            codes, uniques = pd.factorize(str_data)
+            return np.fromiter(
+                map(contains, uniques), dtype=bool, count=len(uniques)
+            )[codes]
+
+        return self.evaluate(
+            column,
+            condition,
+            f"Value should be contain to {summarize_values(str_is_in_contain)}"
+        )
 
     def is_in_exact(self, str_is_in_exact: list, column: str) -> dict:
         """
@@ -502,35 +599,21 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_is_in_exact(str_data, str_is_in_exact)
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
+        return self.evaluate(
+            column,
+            lambda str_data: str_data.isin(str_is_in_exact),
+            f"Value should be in {', '.join(map(str, str_is_in_exact))}",
+            lambda str_data: pc.is_in(
+                str_data,
+                value_set=pa.array(
+                    [
+                        value for value in str_is_in_exact
+                        if isinstance(value, str)
+                    ],
+                    type=pa.string()
                 )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+            )
+        )
 
     def contain(self, str_contain: str, column: str) -> dict:
         """
@@ -547,33 +630,12 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = self.check_contain(
-                    str_contain, str_data
-                )
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda str_data: str_data.str.contains(str_contain, regex=False),
+            f"Value should be contain to {str_contain}",
+            lambda str_data: pc.match_substring(str_data, str_contain)
+        )
 
     def not_contain(self, str_not_contain: str, column: str):
         """
@@ -590,33 +652,16 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = self.check_not_contain(
-                    str_not_contain, str_data
-                )
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda str_data: ~str_data.str.contains(
+                str_not_contain, regex=False
+            ),
+            f"Value should be not contain to {str_not_contain}",
+            lambda str_data: pc.invert(
+                pc.match_substring(str_data, str_not_contain)
+            )
+        )
 
     def regex_contain(self, regex_data: str, column: str) -> dict:
         """
@@ -633,35 +678,15 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_regex_contain(regex_data, str_data)
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        regexp: re.Pattern = compile_regex(regex_data)
+
+        # Python regular expressions are used for Arrow-backed columns too,
+        # since Arrow's RE2 syntax does not match the re module's.
+        return self.evaluate(
+            column,
+            lambda str_data: str_data.str.contains(regexp),
+            f"Value should be contain to {regex_data}"
+        )
 
     def special_char_contain(self, char: str, column: str) -> dict:
         """
@@ -678,35 +703,24 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_special_char_contain(char, str_data)
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        punctuation = """[!"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"""
+
+        if char not in punctuation:
+            # Strings are neither valid nor invalid for a non special char,
+            # only values with an invalid data type are counted.
+            result: dict = self.evaluate(
+                column,
+                lambda str_data: np.ones(len(str_data), dtype=bool),
+                ""
+            )
+            return self.response(0, result['invalid'], result['warning'])
+
+        return self.evaluate(
+            column,
+            lambda str_data: str_data.str.contains(char, regex=False),
+            f"Value should be contain to {char}",
+            lambda str_data: pc.match_substring(str_data, char)
+        )
 
     def is_uppercase(self, column: str) -> dict:
         """
@@ -722,33 +736,12 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = self.check_is_uppercase(
-                    str_data
-                )
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda str_data: str_data.str.isupper(),
+            "Value should uppercase",
+            pc.utf8_is_upper
+        )
 
     def is_lowercase(self, column: str) -> dict:
         """
@@ -764,33 +757,12 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                valid_row, invalid_row, warning_data = self.check_is_lowercase(
-                    str_data
-                )
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda str_data: str_data.str.islower(),
+            "Value should lowercase",
+            pc.utf8_is_lower
+        )
 
     def is_capitalize_first_word(self, column: str) -> dict:
         """
@@ -806,35 +778,16 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_is_capitalize_first_word(str_data)
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
+        return self.evaluate(
+            column,
+            lambda str_data: str_data.str.strip().str[:1].str.isupper(),
+            "Value should capitalize first word",
+            lambda str_data: pc.utf8_is_upper(
+                pc.utf8_slice_codeunits(
+                    pc.utf8_trim_whitespace(str_data), 0, 1
                 )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+            )
+        )
 
     def is_capitalize_all_word(self, column: str) -> dict:
         """
@@ -850,32 +803,9 @@ class String(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, str_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(str_data, (str)) is False:
-                    raise InvalidDataTypeWarning(warning)
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_is_capitalize_all_word(str_data)
-                valid += valid_row
-                invalid += invalid_row
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    str_data,
-                    WarningDataDetailMessage.STRING_DATA_TYPE,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda str_data: str_data.str.istitle(),
+            "Value should capitalize all word",
+            pc.utf8_is_title
+        )
@@ -6,12 +6,14 @@
 
 """Timestamp Library."""
 
-from datetime import datetime
+from __future__ import annotations
+from datetime import date, datetime, tzinfo
+from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 
-from .exception import InvalidDataTypeWarning, InvalidDataValueWarning
-from .utils import Basic, create_warning_data, WarningDataMessage
+from .utils import Basic, create_warning_data, isin, summarize_values
 
 
 class WarningDataDetailMessage:
@@ -23,6 +25,8 @@ class WarningDataDetailMessage:
 class Timestamp(Basic):
     """Timestamp class."""
 
+    data_type: type = datetime
+
     def __init__(self, dataFrame: pd.DataFrame):
         """
         __init__ method.
@@ -313,6 +317,173 @@ class Timestamp(Basic):
 
         return valid, invalid, warning_data
 
+    @staticmethod
+    def dtype_type_mask(data: pd.Series) -> bool | np.ndarray | None:
+        """
+        dtype_type_mask method.
+
+        Decides from the dtype which values of a column are timestamps.
+
+        Args:
+            data (pd.Series): The column to be checked.
+
+        Returns:
+            bool | np.ndarray | None: True if every value is a timestamp,
+                False if none is, a boolean mask if only missing values are
+                not, or None if the values have to be inspected.
+        """
+        if pd.api.types.is_datetime64_any_dtype(data.dtype):
+            return True
+        elif data.dtype.kind in 'biufcm':
+            return False
+
+        return None
+
+    @staticmethod
+    def to_timestamp(value: Any) -> Any:
+        """
+        to_timestamp method.
+
+        Converts a rule's value once into a pd.Timestamp, whatever the dtype
+            of the column, so a string or date rule value, e.g. 2024-06-01
+            from a YAML file, compares the same against a datetime64 column
+            and an object column holding the same datetimes.
+
+        Args:
+            value (Any): A timestamp, or a list of timestamps.
+
+        Returns:
+            Any: A pd.Timestamp for a str, date or np.datetime64 value that
+                pandas can parse, or a list of converted values for a list.
+                Any other value is returned unchanged and compared as is.
+        """
+        if isinstance(value, (list, tuple, set)):
+            return [Timestamp.to_timestamp(item) for item in value]
+
+        if isinstance(value, (str, date, np.datetime64)):
+            try:
+                timestamp: pd.Timestamp = pd.Timestamp(value)
+            except ValueError:
+                return value
+
+            if timestamp is not pd.NaT:
+                return timestamp
+
+        return value
+
+    @staticmethod
+    def to_datetime64(value: Any, tz: tzinfo = None) -> Any:
+        """
+        to_datetime64 method.
+
+        Converts a rule's value, already converted with `to_timestamp`, into
+            the representation used by a datetime64 column, UTC for a
+            timezone-aware column.
+
+        Args:
+            value (Any): A timestamp, or a list of timestamps.
+            tz (tzinfo, optional): The timezone of the column.
+                Defaults to None.
+
+        Returns:
+            Any: A np.datetime64 value, or an array of them for a list. None
+                if a single value can not be compared natively, e.g. it is
+                not a timestamp or its timezone awareness differs from the
+                column's.
+        """
+        if isinstance(value, list):
+            return np.array(
+                [
+                    timestamp for timestamp in (
+                        Timestamp.to_datetime64(timestamp_data, tz)
+                        for timestamp_data in value
+                    )
+                    if timestamp is not None
+                ],
+                dtype='datetime64[ns]'
+            )
+
+        if not isinstance(value, pd.Timestamp) or (
+            value.tzinfo is None
+        ) != (tz is None):
+            return None
+
+        if tz:
+            value = value.tz_convert(None)
+
+        return value.to_datetime64()
+
+    def evaluate(
+        self,
+        column: str,
+        condition: Callable[..., np.ndarray],
+        detail_message: str,
+        *values: Any
+    ) -> dict:
+        """
+        Evaluate method.
+
+        Applies a vectorized condition to every timestamp of a column and
+            builds the data quality result. `values` are converted once with
+            `to_timestamp` for every column. A datetime64 column is then
+            compared natively against them converted with `to_datetime64`,
+            other columns are compared value by value as Python objects.
+
+        Args:
+            column (str): The name of the column in the DataFrame to check.
+            condition (Callable[..., np.ndarray]): Function that receives the
+                timestamps followed by `values` and returns a boolean mask,
+                True where the timestamp is valid.
+            detail_message (str): Warning detail message for invalid values.
+            *values (Any): The rule's values, e.g. a limit or a list.
+
+        Returns:
+            dict: A dictionary containing the result of the data quality check,
+                including the number of valid and invalid values,
+                and any warning messages.
+        """
+        data: pd.Series = self.dataFrame[column]
+        type_mask: np.ndarray = self.type_mask(column)
+        value_mask: np.ndarray = np.zeros(len(data), dtype=bool)
+        datetime64_values: list = None
+        values = tuple(self.to_timestamp(value) for value in values)
+
+        if pd.api.types.is_datetime64_any_dtype(data.dtype):
+            datetime64_values = [
+                self.to_datetime64(value, data.dt.tz) for value in values
+            ]
+
+        if datetime64_values and all(
+            value is not None for value in datetime64_values
+        ):
+            value_mask[:] = condition(
+                self.cache(
+                    column,
+                    'datetime64',
+                    lambda: (
+                        data.dt.tz_convert(None) if data.dt.tz else data
+                    ).to_numpy()
+                ),
+                *datetime64_values
+            )
+        elif type_mask.any():
+            value_mask[type_mask] = condition(
+                self.cache(
+                    column,
+                    'values',
+                    lambda: data.to_numpy(dtype=object)[type_mask]
+                ),
+                *values
+            )
+
+        return self.mask_response(
+            data,
+            type_mask,
+            value_mask,
+            detail_message,
+            WarningDataDetailMessage.timestamp_data_type
+        )
+
     def equal_to(self, value: datetime, column: str) -> dict:
         """
         equal_to method.
@@ -329,36 +500,12 @@ class Timestamp(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, timestamp_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(timestamp_data, (datetime)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_equal(
-                    timestamp_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    timestamp_data,
-                    WarningDataDetailMessage.timestamp_data_type,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda timestamp_data, value: timestamp_data == value,
+            f"Value should be equal to {value}",
+            value
+        )
 
     def less_than(self, value: datetime, column: str) -> dict:
         """
@@ -376,36 +523,12 @@ class Timestamp(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, timestamp_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(timestamp_data, (datetime)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_less_than(
-                    timestamp_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    timestamp_data,
-                    WarningDataDetailMessage.timestamp_data_type,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda timestamp_data, value: timestamp_data < value,
+            f"Value should be less than {value}",
+            value
+        )
 
     def less_than_equal(self, value: datetime, column: str) -> dict:
         """
@@ -423,38 +546,12 @@ class Timestamp(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, timestamp_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(timestamp_data, (datetime)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_less_than_equal(timestamp_data, value)
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    timestamp_data,
-                    WarningDataDetailMessage.timestamp_data_type,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda timestamp_data, value: timestamp_data <= value,
+            f"Value should be less than equal {value}",
+            value
+        )
 
     def greater_than(self, value: datetime, column: str) -> dict:
         """
@@ -472,38 +569,12 @@ class Timestamp(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, timestamp_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(timestamp_data, (datetime)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_greater_than(timestamp_data, value)
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    timestamp_data,
-                    WarningDataDetailMessage.timestamp_data_type,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda timestamp_data, value: timestamp_data > value,
+            f"Value should be greater than {value}",
+            value
+        )
 
     def greater_than_equal(self, value: datetime, column: str) -> dict:
         """
@@ -521,38 +592,12 @@ class Timestamp(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, timestamp_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(timestamp_data, (datetime)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                (
-                    valid_row,
-                    invalid_row,
-                    warning_data,
-                ) = self.check_greater_than_equal(timestamp_data, value)
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    timestamp_data,
-                    WarningDataDetailMessage.timestamp_data_type,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda timestamp_data, value: timestamp_data >= value,
+            f"Value should be greater than equal {value}",
+            value
+        )
 
     def in_range(
         self, lower_limit: datetime, upper_limit: datetime, column: str
@@ -575,36 +620,16 @@ class Timestamp(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, timestamp_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(timestamp_data, (datetime)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_in_range(
-                    timestamp_data, lower_limit, upper_limit
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    timestamp_data,
-                    WarningDataDetailMessage.timestamp_data_type,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda timestamp_data, lower_limit, upper_limit: (
+                timestamp_data >= lower_limit
+            ) & (timestamp_data <= upper_limit),
+            "Value should be in the range of "
+            f"{lower_limit} and {upper_limit}",
+            lower_limit,
+            upper_limit
+        )
 
     def is_in(self, value: list, column: str) -> dict:
         """
@@ -622,36 +647,12 @@ class Timestamp(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, timestamp_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(timestamp_data, (datetime)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_is_in(
-                    timestamp_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    timestamp_data,
-                    WarningDataDetailMessage.timestamp_data_type,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            isin,
+            f"Value should be in {summarize_values(value)}",
+            value
+        )
 
     def not_in(self, value: list, column: str) -> dict:
         """
@@ -669,33 +670,9 @@ class Timestamp(Basic):
                 including the number of valid and invalid values,
                 and any warning messages.
         """
-        valid = 0
-        invalid = 0
-        warning = {}
-
-        for index, timestamp_data in enumerate(self.dataFrame[column]):
-            try:
-                if isinstance(timestamp_data, (datetime)) is False:
-                    raise InvalidDataTypeWarning(warning)
-
-                valid_row, invalid_row, warning_data = self.check_not_in(
-                    timestamp_data, value
-                )
-                valid += valid_row
-                invalid += invalid_row
-
-                if warning_data != {}:
-                    warning[index] = InvalidDataValueWarning(
-                        warning_data
-                    ).message
-            except InvalidDataTypeWarning:
-                invalid += 1
-                warning_data = create_warning_data(
-                    timestamp_data,
-                    WarningDataDetailMessage.timestamp_data_type,
-                    WarningDataMessage.INVALID_DATA_TYPE,
-                )
-                warning[index] = InvalidDataTypeWarning(warning_data).message
-
-        result = self.response(valid, invalid, warning)
-        return result
+        return self.evaluate(
+            column,
+            lambda timestamp_data, value: ~isin(timestamp_data, value),
+            f"Value should be not in {summarize_values(value)}",
+            value
+        )
@@ -6,11 +6,164 @@
 
 """Utility library."""
 
-from typing import Any
+from __future__ import annotations
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import islice
+from pydoc import locate
+import re
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+# Configuration keys that limit the warnings of a rule, see `limit_warnings`.
+# They can be set per rule, per checker or per data source.
+WARNING_OPTIONS: tuple = (
+    'max_warnings', 'sample_warnings', 'group_warnings', 'message_codes'
+)
 
 
 class Basic:
-    """Basic class."""
+    """
+    Basic class.
+
+    Attributes:
+        data_type (type): The Python type every value of a checked column is
+            expected to have.
+    """
+
+    data_type: type = object
+
+    @staticmethod
+    def dtype_type_mask(data: pd.Series) -> bool | np.ndarray | None:
+        """
+        dtype_type_mask method.
+
+        Decides the data type validity of a column from its dtype alone.
+            Checker classes override this for the dtypes they know.
+
+        Args:
+            data (pd.Series): The column to be checked.
+
+        Returns:
+            bool | np.ndarray | None: True if the dtype guarantees every value
+                has the expected data type, False if it guarantees none has,
+                a boolean mask if only missing values are invalid, or None if
+                the values have to be inspected.
+        """
+        return None
+
+    def cache(self, column: str, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Cache method.
+
+        Computes a piece of state of a column once and shares it with every
+            rule run on the column inside `shared_state`, e.g. its type mask
+            or its typed values. Outside of it, e.g. for a rule called
+            directly, the state is computed for the rule alone, so it never
+            outlives a change of the data.
+
+        Args:
+            column (str): The name of the column in the DataFrame.
+            key (str): The name of the state.
+            func (Callable[[], Any]): Function that computes the state.
+
+        Returns:
+            Any: The state of the column.
+        """
+        cache: dict = self.__dict__.get('_cache', {}).get(column)
+
+        if cache is None:
+            return func()
+
+        if key not in cache:
+            cache[key] = func()
+
+        return cache[key]
+
+    @contextmanager
+    def shared_state(self, column: str) -> Iterator[None]:
+        """
+        shared_state method.
+
+        Shares the state of a column, see `cache`, between the rules run on
+            it inside the context, and releases it on leaving. The data must
+            not be modified inside the context.
+
+        Args:
+            column (str): The name of the column in the DataFrame.
+
+        Yields:
+            None: The rules of the column can be run.
+        """
+        self.__dict__.setdefault('_cache', {})[column] = {}
+
+        try:
+            yield
+        finally:
+            self.clear_cache(column)
+
+    def clear_cache(self, column: str):
+        """
+        clear_cache method.
+
+        Releases the shared state of a column once its rules are evaluated.
+
+        Args:
+            column (str): The name of the column in the DataFrame.
+        """
+        self.__dict__.get('_cache', {}).pop(column, None)
+
+    def type_mask(self, column: str) -> np.ndarray:
+        """
+        type_mask method.
+
+        Marks which values of a column have the expected data type. The mask
+            is cached, see `cache`, so it is computed once per column for
+            all of the rules run on it together. When the dtype
+            decides the answer the mask is a read-only broadcast array that
+            costs O(1) to build.
+
+        Args:
+            column (str): The name of the column in the DataFrame to check.
+
+        Returns:
+            np.ndarray: Boolean mask, True where the value has the expected
+                data type.
+        """
+        def func() -> np.ndarray:
+            data: pd.Series = self.dataFrame[column]
+            type_mask: bool | np.ndarray = self.dtype_type_mask(data)
+
+            if type_mask is None:
+                type_mask = np.fromiter(
+                    (isinstance(value, self.data_type) for value in data),
+                    dtype=bool,
+                    count=len(data)
+                )
+            elif isinstance(type_mask, bool):
+                type_mask = np.broadcast_to(type_mask, len(data))
+
+            return type_mask
+
+        return self.cache(column, 'type_mask', func)
+
+    def is_typed(self, column: str) -> bool:
+        """
+        is_typed method.
+
+        Check in O(1) if the dtype of a column guarantees every value has the
+            expected data type.
+
+        Args:
+            column (str): The name of the column in the DataFrame to check.
+
+        Returns:
+            bool: True if no value can have an invalid data type.
+        """
+        return self.dtype_type_mask(self.dataFrame[column]) is True
 
     def response(
         self,
@@ -44,6 +197,61 @@ class Basic:
         }
         return result
 
+    def mask_response(
+        self,
+        data: pd.Series,
+        type_mask: np.ndarray,
+        value_mask: np.ndarray,
+        detail_message: str,
+        data_type_detail_message: str
+    ) -> dict:
+        """
+        mask_response method.
+
+        Builds the same result as `response` from boolean masks computed over
+            a whole column, so the rule never has to visit valid rows in
+            Python. Inside `shared_state` the warnings are kept as a
+            `WarningTable`, until the warning options are applied, see
+            `apply_warning_options`; otherwise they are a builtin dict.
+
+        Args:
+            data (pd.Series): The column that has been checked.
+            type_mask (np.ndarray): Boolean mask, True where the value has the
+                expected data type.
+            value_mask (np.ndarray): Boolean mask, True where the value passes
+                the rule. Only meaningful where `type_mask` is True.
+            detail_message (str): Warning detail message for invalid values.
+            data_type_detail_message (str): Warning detail message for values
+                with an invalid data type.
+
+        Returns:
+            dict: A dictionary containing the calculated score,
+                number of valid inputs, number of invalid inputs,
+                and any warning messages.
+        """
+        valid_mask: np.ndarray = type_mask & value_mask
+        valid: int = int(np.count_nonzero(valid_mask))
+        invalid_index: np.ndarray = np.flatnonzero(~valid_mask)
+        warning: WarningTable = WarningTable(
+            invalid_index,
+            data.iloc[invalid_index],
+            # 0 for an invalid value, 1 for an invalid data type.
+            (~type_mask[invalid_index]).astype(np.int8),
+            [
+                (WarningDataMessage.INVALID_VALUE, detail_message),
+                (
+                    WarningDataMessage.INVALID_DATA_TYPE,
+                    data_type_detail_message
+                )
+            ]
+        )
+
+        return self.response(
+            valid,
+            len(invalid_index),
+            warning if self.__dict__.get('_cache') else warning.to_dict()
+        )
+
 
 class WarningDataMessage:
     """WarningDataMessage class."""
@@ -74,3 +282,889 @@ def create_warning_data(
         'value': value,
         'detail_message': detail_message
     }
+
+
+class WarningTable(Mapping):
+    """
+    WarningTable class.
+
+    Read-only mapping of row index to warning data, as found in the `warning`
+    of a result, backed by columnar arrays instead of one dict per invalid
+    row: the row indexes, the invalid values, and per row a code into a small
+    table of (message, detail message) pairs. The warning data dicts are
+    only created, all at once, when a warning is looked up or serialized.
+    Every message is rendered once per rule and shared by reference by all
+    of its warnings. It only lives between a rule run inside
+    `Basic.shared_state` and `apply_warning_options`; every result handed
+    out carries the materialized dict instead.
+
+    Attributes:
+        index (np.ndarray): Sorted int64 row indexes of the invalid values.
+        values (pd.Series): The invalid values, in the order of `index`.
+        codes (np.ndarray): Position in `messages` of every row's messages.
+        messages (list[tuple[str, str]]): The (message, detail message)
+            pairs of the rule.
+        message_codes (bool): Emit a `message_code`, the position in
+            `messages`, instead of the message texts in the warning data.
+    """
+
+    def __init__(
+        self,
+        index: np.ndarray,
+        values: pd.Series,
+        codes: np.ndarray,
+        messages: list[tuple[str, str]],
+        message_codes: bool = False
+    ):
+        """
+        __init__ method.
+
+        Initializes an instance of the WarningTable class.
+
+        Args:
+            index (np.ndarray): Sorted int64 row indexes of the invalid
+                values.
+            values (pd.Series): The invalid values, in the order of `index`.
+            codes (np.ndarray): Position in `messages` of every row's
+                messages.
+            messages (list[tuple[str, str]]): The (message, detail message)
+                pairs of the rule.
+            message_codes (bool, optional): Emit a `message_code` instead of
+                the message texts in the warning data. Defaults to False.
+        """
+        self.index = index
+        self.values = values
+        self.codes = codes
+        self.messages = messages
+        self.message_codes = message_codes
+        self.__dict: dict = None
+
+    @classmethod
+    def from_dict(cls, warning: Mapping) -> WarningTable:
+        """
+        from_dict method.
+
+        Builds a table from a legacy warning dict.
+
+        Args:
+            warning (Mapping): Row index mapped to its warning data.
+
+        Returns:
+            WarningTable: The table of the warnings.
+        """
+        if isinstance(warning, WarningTable):
+            return warning
+
+        index: list = sorted(warning)
+        messages: dict = {}
+        codes: list = [
+            messages.setdefault(
+                (warning[key]['message'], warning[key]['detail_message']),
+                len(messages)
+            )
+            for key in index
+        ]
+
+        return cls(
+            np.array(index, dtype=np.int64),
+            pd.Series([warning[key]['value'] for key in index], dtype=object),
+            np.array(codes, dtype=np.int64),
+            list(messages)
+        )
+
+    @classmethod
+    def concat(cls, tables: list[WarningTable]) -> WarningTable:
+        """
+        Concat method.
+
+        Concatenates tables of warnings of consecutive rows, e.g. of the
+            chunks of a column, see `ChunkedResult`. The messages of all of
+            them are merged into one list.
+
+        Args:
+            tables (list[WarningTable]): The tables, in row order, with
+                their row indexes already shifted to the whole column.
+
+        Returns:
+            WarningTable: One table with all of the warnings.
+        """
+        messages: dict = {}
+        parts: list[tuple[WarningTable, np.ndarray]] = []
+
+        for table in tables:
+            lookup: np.ndarray = np.array([
+                messages.setdefault(message, len(messages))
+                for message in table.messages
+            ], dtype=np.int64)
+
+            if len(table):
+                parts.append((table, lookup[table.codes]))
+
+        if not parts:
+            return cls(
+                np.array([], dtype=np.int64),
+                pd.Series([], dtype=object),
+                np.array([], dtype=np.int64),
+                list(messages)
+            )
+
+        return cls(
+            np.concatenate([table.index for table, _ in parts]),
+            pd.concat([table.values for table, _ in parts], ignore_index=True),
+            np.concatenate([codes for _, codes in parts]),
+            list(messages)
+        )
+
+    def warning_data(self, value: Any, code: int) -> dict:
+        """
+        warning_data method.
+
+        Creates the warning data of one invalid value.
+
+        Args:
+            value (Any): The invalid value.
+            code (int): Position of its messages in `messages`.
+
+        Returns:
+            dict: The warning data.
+        """
+        if self.message_codes:
+            return {'message_code': code, 'value': value}
+
+        message, detail_message = self.messages[code]
+
+        return create_warning_data(value, detail_message, message)
+
+    def to_dict(self) -> dict:
+        """
+        to_dict method.
+
+        Materializes the legacy warning dict, once.
+
+        Returns:
+            dict: Row index mapped to its warning data.
+        """
+        if self.__dict is None:
+            self.__dict = {
+                index: self.warning_data(value, code)
+                for index, value, code in zip(
+                    self.index.tolist(),
+                    self.values.tolist(),
+                    self.codes.tolist()
+                )
+            }
+
+        return self.__dict
+
+    def take(self, positions: np.ndarray) -> WarningTable:
+        """
+        Take method.
+
+        Selects some warnings of the table without materializing them.
+
+        Args:
+            positions (np.ndarray): Sorted positions of the warnings to keep.
+
+        Returns:
+            WarningTable: A table with the selected warnings.
+        """
+        return WarningTable(
+            self.index[positions],
+            self.values.iloc[positions],
+            self.codes[positions],
+            self.messages,
+            self.message_codes
+        )
+
+    def group(self) -> list[dict]:
+        """
+        Group method.
+
+        Groups the warnings by message, detail message and value. A group is
+            the warning data with the `count` of its rows and the `rows`
+            themselves as run-length encoded [first, last] ranges, in the
+            order of their first row.
+
+        Returns:
+            list[dict]: The groups of warnings.
+        """
+        try:
+            value_codes: np.ndarray = pd.factorize(
+                self.values, use_na_sentinel=False
+            )[0]
+        except TypeError:
+            # Unhashable values, e.g. lists, are grouped by representation.
+            value_codes: np.ndarray = pd.factorize(
+                self.values.map(repr), use_na_sentinel=False
+            )[0]
+
+        keys: np.ndarray = value_codes.astype(np.int64) * len(
+            self.messages
+        ) + self.codes
+        order: np.ndarray = np.argsort(keys, kind='stable')
+        bounds: np.ndarray = np.flatnonzero(np.diff(keys[order])) + 1
+        groups: list = []
+
+        for positions in np.split(order, bounds) if len(order) else []:
+            rows: np.ndarray = self.index[positions]
+            breaks: np.ndarray = np.flatnonzero(np.diff(rows) != 1)
+            groups.append({
+                **self.warning_data(
+                    self.values.iloc[positions[:1]].tolist()[0],
+                    int(self.codes[positions[0]])
+                ),
+                'count': len(rows),
+                'rows': np.stack([
+                    rows[np.r_[0, breaks + 1]], rows[np.r_[breaks, -1]]
+                ], axis=1).tolist()
+            })
+
+        return sorted(groups, key=lambda group: group['rows'][0][0])
+
+    def __getitem__(self, key: int) -> dict:
+        """
+        __getitem__ method.
+
+        Args:
+            key (int): The row index.
+
+        Returns:
+            dict: The warning data of the row.
+        """
+        return self.to_dict()[key]
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the row indexes without materializing the warnings.
+
+        Returns:
+            Iterator[int]: The row indexes.
+        """
+        return iter(self.index.tolist())
+
+    def __len__(self) -> int:
+        """
+        __len__ method.
+
+        Returns:
+            int: The number of warnings.
+        """
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        """
+        __repr__ method.
+
+        Returns:
+            str: The representation of the materialized warning dict.
+        """
+        return repr(self.to_dict())
+
+
+def check_max_warnings(max_warnings: Any) -> int:
+    """
+    Validate the `max_warnings` warning option.
+
+    Args:
+        max_warnings (Any): The maximum number of warnings to keep.
+
+    Raises:
+        ValueError: If it is not a non-negative integer.
+
+    Returns:
+        int: The maximum number of warnings to keep.
+    """
+    if isinstance(max_warnings, bool) or not isinstance(
+        max_warnings, (int, np.integer)
+    ) or max_warnings < 0:
+        raise ValueError(
+            'max_warnings must be a non-negative integer, not '
+            f'{max_warnings!r}'
+        )
+
+    return int(max_warnings)
+
+
+def limit_warnings(
+    result: dict, max_warnings: int, sample_warnings: bool = False
+) -> dict:
+    """
+    Keep at most `max_warnings` warnings of a result.
+
+    The first warnings are kept, or a uniform random sample of them when
+    `sample_warnings` is set. `valid`, `invalid` and `score` stay exact and
+    the number of dropped warnings is added as `warning_truncated`, to the
+    ones already dropped, see `ChunkedResult`. Grouped warnings, see
+    `group_warning_data`, are limited by group.
+
+    Args:
+        result (dict): The result of a rule.
+        max_warnings (int): The maximum number of warnings to keep.
+        sample_warnings (bool, optional): Keep a random sample instead of the
+            first warnings. Defaults to False.
+
+    Raises:
+        ValueError: If `max_warnings` is not a non-negative integer.
+
+    Returns:
+        dict: The result with its warnings limited.
+    """
+    max_warnings = check_max_warnings(max_warnings)
+    warning: Mapping | list = result['warning']
+    warning_truncated: int = max(len(warning) - max_warnings, 0)
+
+    if warning_truncated:
+        positions: np.ndarray = np.sort(
+            np.random.default_rng().choice(
+                len(warning), max_warnings, replace=False
+            )
+        ) if sample_warnings else np.arange(max_warnings)
+
+        if isinstance(warning, WarningTable):
+            warning = warning.take(positions)
+        elif isinstance(warning, list):
+            warning = [warning[position] for position in positions.tolist()]
+        else:
+            keys: list = list(warning)
+            warning = {
+                keys[position]: warning[keys[position]]
+                for position in positions.tolist()
+            }
+
+    return {
+        **result,
+        'warning': warning,
+        'warning_truncated': result.get(
+            'warning_truncated', 0
+        ) + warning_truncated
+    }
+
+
+def group_warning_data(result: dict) -> dict:
+    """
+    Group the warnings of a result by distinct offending value.
+
+    The `warning` of the result becomes the list of groups made by
+    `WarningTable.group`, so a value repeated on many rows is reported once
+    with its row count and row ranges.
+
+    Args:
+        result (dict): The result of a rule.
+
+    Returns:
+        dict: The result with its warnings grouped.
+    """
+    return {
+        **result,
+        'warning': WarningTable.from_dict(result['warning']).group()
+    }
+
+
+def code_warning_messages(result: dict) -> dict:
+    """
+    Replace the message texts of the warnings of a result by codes.
+
+    Every warning, or group of warnings, gets a `message_code` instead of
+    its `message` and `detail_message`, and the texts are kept once in the
+    `warning_messages` lookup table of the result, at the position of their
+    code.
+
+    Args:
+        result (dict): The result of a rule.
+
+    Returns:
+        dict: The result with its warning messages coded.
+    """
+    warning: Mapping | list = result['warning']
+
+    if isinstance(warning, list):
+        messages: dict = {}
+        warning = [
+            {
+                'message_code': messages.setdefault(
+                    (group['message'], group['detail_message']),
+                    len(messages)
+                ),
+                **{
+                    key: value
+                    for key, value in group.items()
+                    if key not in ('message', 'detail_message')
+                }
+            }
+            for group in warning
+        ]
+        messages: list = list(messages)
+    else:
+        table: WarningTable = WarningTable.from_dict(warning)
+        messages: list = table.messages
+        warning = WarningTable(
+            table.index, table.values, table.codes, messages, True
+        )
+
+    return {
+        **result,
+        'warning': warning,
+        'warning_messages': [
+            {'message': message, 'detail_message': detail_message}
+            for message, detail_message in messages
+        ]
+    }
+
+
+class ChunkedResult:
+    """
+    ChunkedResult class.
+
+    The result of a rule merged over the chunks of a column, as if the rule
+    ran on the whole column at once: `valid` and `invalid` are summed and the
+    row indexes of the warnings are shifted by the rows of the chunks before.
+    The warnings of the chunks are collected in a list and concatenated
+    once, when the result is read.
+
+    Memory: with `max_warnings`, the first warnings are collected until
+    there are that many, and the warnings of later chunks are only counted
+    as `warning_truncated`. With `sample_warnings`, fewer than twice
+    `max_warnings` warnings are kept between chunks, from which a uniform
+    random sample of all of them is drawn. Otherwise, and with
+    `group_warnings`, which needs every warning, all of the warnings are
+    kept.
+
+    Attributes:
+        max_warnings (int): The maximum number of warnings to keep.
+        sample_warnings (bool): Keep a random sample instead of the first
+            warnings.
+        group_warnings (bool): Keep every warning to group them.
+        valid (int): The number of valid values so far.
+        invalid (int): The number of invalid values so far.
+        rows (int): The number of rows so far.
+    """
+
+    def __init__(
+        self,
+        max_warnings: int = None,
+        sample_warnings: bool = False,
+        group_warnings: bool = False
+    ):
+        """
+        __init__ method.
+
+        Initializes an empty result.
+
+        Args:
+            max_warnings (int, optional): The maximum number of warnings to
+                keep. Defaults to None, which keeps all of them.
+            sample_warnings (bool, optional): Keep a random sample instead of
+                the first warnings. Defaults to False.
+            group_warnings (bool, optional): Keep every warning to group
+                them. Defaults to False.
+
+        Raises:
+            ValueError: If `max_warnings` is not a non-negative integer.
+        """
+        if max_warnings is not None:
+            max_warnings = check_max_warnings(max_warnings)
+
+        self.max_warnings = max_warnings
+        self.sample_warnings = sample_warnings
+        self.group_warnings = group_warnings
+        self.valid = 0
+        self.invalid = 0
+        self.rows = 0
+        self.__limit: int = None if max_warnings is None or (
+            group_warnings
+        ) else max_warnings
+        self.__sampled: bool = bool(sample_warnings) and (
+            self.__limit is not None
+        )
+        self.__tables: list[WarningTable] = []
+        self.__priorities: list[np.ndarray] = []
+        self.__kept: int = 0
+        self.__truncated: int = 0
+        self.__rng: np.random.Generator = np.random.default_rng()
+
+    def add(self, result: dict, rows: int):
+        """
+        Add method.
+
+        Merges the result of the rule on the next chunk.
+
+        Args:
+            result (dict): The result of the rule on the chunk, before the
+                warning options.
+            rows (int): The number of rows of the chunk.
+        """
+        warning: Mapping = result['warning']
+        count: int = len(warning)
+
+        if self.__limit is not None and not self.__sampled:
+            count = min(count, self.__limit - self.__kept)
+
+        if count:
+            table: WarningTable = WarningTable.from_dict(warning)
+
+            if count < len(table):
+                table = table.take(np.arange(count))
+
+            self.__tables.append(WarningTable(
+                table.index + self.rows,
+                table.values,
+                table.codes,
+                table.messages
+            ))
+            self.__kept += count
+
+            if self.__sampled:
+                self.__priorities.append(self.__rng.random(count))
+
+        self.valid += result['valid']
+        self.invalid += result['invalid']
+        self.rows += rows
+        self.__truncated += len(warning) - count
+
+        if self.__sampled and self.__kept >= 2 * max(self.__limit, 1):
+            self.__merge()
+
+    def __merge(self):
+        """
+        __merge method.
+
+        Concatenates the warnings collected so far into one table, and keeps
+            a uniform random sample of `max_warnings` of them when sampling:
+            the warnings with the smallest random priorities.
+        """
+        warning: WarningTable = WarningTable.concat(self.__tables)
+
+        if self.__sampled and len(warning) > self.__limit:
+            priorities: np.ndarray = np.concatenate(self.__priorities)
+            positions: np.ndarray = np.sort(np.argpartition(
+                priorities, self.__limit
+            )[:self.__limit])
+            self.__priorities = [priorities[positions]]
+            self.__truncated += len(warning) - self.__limit
+            warning = warning.take(positions)
+
+        self.__tables = [warning]
+        self.__kept = len(warning)
+
+    def __call__(self) -> dict:
+        """
+        __call__ method.
+
+        Returns:
+            dict: The merged result, before the warning options, see
+                `apply_warning_options`.
+        """
+        self.__merge()
+        result: dict = {
+            'score': self.valid / (self.valid + self.invalid)
+            if self.valid + self.invalid else 0,
+            'valid': self.valid,
+            'invalid': self.invalid,
+            'warning': self.__tables[0]
+        }
+
+        if self.__truncated:
+            result['warning_truncated'] = self.__truncated
+
+        return result
+
+
+def rule_arguments(params: Any) -> tuple[tuple, dict, dict]:
+    """
+    Normalize the parameters of a rule from a configuration file.
+
+    Args:
+        params (Any): Keyword arguments (dict), positional arguments (list),
+            a single argument, or nothing. Keyword arguments may also hold
+            the `WARNING_OPTIONS` of this rule.
+
+    Returns:
+        tuple[tuple, dict, dict]: The positional arguments, the keyword
+            arguments and the warning options of the rule.
+    """
+    if isinstance(params, dict):
+        return (), {
+            key: value
+            for key, value in params.items()
+            if key not in WARNING_OPTIONS
+        }, {
+            key: value
+            for key, value in params.items()
+            if key in WARNING_OPTIONS
+        }
+
+    return tuple(
+        params
+        if isinstance(params, list)
+        else ([params] if params else [])
+    ), {}, {}
+
+
+def apply_warning_options(
+    result: dict,
+    max_warnings: int = None,
+    sample_warnings: bool = False,
+    group_warnings: bool = False,
+    message_codes: bool = False
+) -> dict:
+    """
+    Apply the warning options to the result of a rule.
+
+    Args:
+        result (dict): The result of the rule.
+        max_warnings (int, optional): The maximum number of warnings to keep,
+            see `limit_warnings`. Defaults to None, which keeps all of them.
+        sample_warnings (bool, optional): Keep a random sample instead of the
+            first warnings. Defaults to False.
+        group_warnings (bool, optional): Group the warnings by distinct
+            offending value, see `group_warning_data`. Defaults to False.
+        message_codes (bool, optional): Replace the message texts of the
+            warnings by codes, see `code_warning_messages`. Defaults to False.
+
+    Raises:
+        ValueError: If `max_warnings` is not a non-negative integer.
+
+    Returns:
+        dict: The result of the rule, whose `warning` is a builtin dict, or
+            a list of groups, so it can be serialized like any other data.
+    """
+    if max_warnings is not None:
+        max_warnings = check_max_warnings(max_warnings)
+
+    if group_warnings:
+        result = group_warning_data(result)
+
+    if max_warnings is not None:
+        result = limit_warnings(result, max_warnings, sample_warnings)
+
+    if message_codes:
+        result = code_warning_messages(result)
+
+    if isinstance(result, dict) and isinstance(
+        result.get('warning'), WarningTable
+    ):
+        result = {**result, 'warning': result['warning'].to_dict()}
+
+    return result
+
+
+@lru_cache(maxsize=256)
+def compile_regex(pattern: str) -> re.Pattern:
+    """
+    Compile a regular expression once per process.
+
+    Every rule that takes a pattern shares this bounded LRU cache, so a
+    pattern used by many rows, columns or data sources is compiled only once.
+    Hits and misses can be inspected with `compile_regex.cache_info()`. A
+    number, e.g. `regex: 123` in a YAML file, is the pattern of its digits.
+
+    Args:
+        pattern (str): The regular expression.
+
+    Raises:
+        ValueError: If the pattern is neither a string, a compiled pattern
+            nor a number.
+
+    Returns:
+        re.Pattern: The compiled regular expression.
+    """
+    if isinstance(pattern, (int, float)):
+        pattern = str(pattern)
+    elif not isinstance(pattern, (str, re.Pattern)):
+        raise ValueError(
+            'The regular expression must be a string, not '
+            f'{type(pattern).__name__}: {pattern!r}'
+        )
+
+    return re.compile(pattern)
+
+
+TYPES: dict[str, Any] = {}
+
+
+def register_type(name: str, value: Any = None) -> Any:
+    """
+    Register a class under the name used for it in configuration files.
+
+    Registered names resolve without importing anything, see `locate_type`.
+    Without a value it returns a class decorator, e.g.
+    `@register_type('my_package.MyChecker')`.
+
+    Args:
+        name (str): The name of the class in configuration files, usually
+            its full path.
+        value (Any, optional): The class. Defaults to None.
+
+    Returns:
+        Any: The class, or a decorator that registers a class.
+    """
+    if value is None:
+        return partial(register_type, name)
+
+    TYPES[name] = value
+
+    return value
+
+
+def locate_type(name: str) -> Any:
+    """
+    Resolve the full path of a class once per process.
+
+    A class that is not registered is located with `pydoc.locate`, which
+    imports its module, and registered on success, so every data source and
+    checker that uses the same name shares one lookup.
+
+    Args:
+        name (str): The full path of the class, e.g. `datasae.string.String`.
+
+    Returns:
+        Any: The class, or None if it can not be located.
+    """
+    value: Any = TYPES.get(name)
+
+    if value is None:
+        value = locate(name)
+
+        if value is not None:
+            TYPES[name] = value
+
+    return value
+
+
+def isin(data: np.ndarray, value: list) -> np.ndarray:
+    """
+    Check the membership of every value of an array in a list at once.
+
+    The list is turned into a lookup structure once: a sorted array searched
+    with binary search when both sides are numbers or datetimes, otherwise
+    a hash table. Either way a column is checked in O((n + m) log m) instead
+    of the O(n * m) of testing `x in value` row by row.
+
+    Args:
+        data (np.ndarray): The values to be checked.
+        value (list): The list of values to check against.
+
+    Returns:
+        np.ndarray: Boolean mask, True where the value is in the list.
+    """
+    lookup: np.ndarray = np.asarray(value)
+
+    if data.dtype.kind in 'biufM' and lookup.dtype.kind in (
+        'M' if data.dtype.kind == 'M' else 'biuf'
+    ):
+        if not lookup.size:
+            return np.zeros(len(data), dtype=bool)
+
+        lookup = np.unique(lookup)
+        index: np.ndarray = np.searchsorted(lookup, data).clip(
+            max=lookup.size - 1
+        )
+        return lookup[index] == data
+
+    return pd.Series(data, dtype=object).isin(value).to_numpy()
+
+
+def summarize_values(value: list, limit: int = 10) -> str:
+    """
+    Format a list of values for a warning detail message.
+
+    Short lists are formatted like `str(value)`, long ones keep only their
+    first `limit` values so a reference list of thousands of values does not
+    end up in every warning.
+
+    Args:
+        value (list): The list of values, or any sized iterable.
+        limit (int, optional): The number of values to show. Defaults to 10.
+
+    Returns:
+        str: The formatted list.
+    """
+    if len(value) <= limit:
+        return str(value)
+
+    return '[{}, ... and {} more]'.format(
+        ', '.join(map(repr, islice(value, limit))), len(value) - limit
+    )
+
+
+class AhoCorasick:
+    """
+    AhoCorasick class.
+
+    Multi-substring matcher that finds out in one pass over a text whether
+    any of many patterns occurs in it, instead of searching the text once per
+    pattern. The automaton is a trie of the patterns with failure links, so
+    the cost of a search depends on the length of the text only.
+    """
+
+    def __init__(self, patterns: list):
+        """
+        __init__ method.
+
+        Builds the automaton of the patterns.
+
+        Args:
+            patterns (list): The substrings to search for.
+        """
+        self.goto: list = [{}]
+        self.fail: list = [0]
+        self.output: list = [False]
+
+        for pattern in patterns:
+            node: int = 0
+
+            for char in pattern:
+                if char not in self.goto[node]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(False)
+                    self.goto[node][char] = len(self.goto) - 1
+
+                node = self.goto[node][char]
+
+            self.output[node] = True
+
+        queue: list = list(self.goto[0].values())
+
+        for node in queue:
+            for char, child in self.goto[node].items():
+                fail: int = self.fail[node]
+
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+
+                self.fail[child] = self.goto[fail].get(char, 0)
+
+                self.output[child] |= self.output[self.fail[child]]
+                queue.append(child)
+
+    def search(self, text: str) -> bool:
+        """
+        Search method.
+
+        Check if any of the patterns occurs in a text.
+
+        Args:
+            text (str): The text to be searched.
+
+        Returns:
+            bool: True if at least one pattern is a substring of the text.
+        """
+        goto: list = self.goto
+        fail: list = self.fail
+        output: list = self.output
+        node: int = 0
+
+        if output[0]:
+            return True
+
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+
+            node = goto[node].get(char, 0)
+
+            if output[node]:
+                return True
+
+        return False
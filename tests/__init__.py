@@ -44,6 +44,12 @@ class TestMain(TestCase):
             0
         )
 
+        # Concurrent
+        self.assertEqual(
+            cli_runner.invoke(cli, ['--jobs', '2', *command]).exit_code,
+            0
+        )
+
         # Json Display
         self.assertEqual(
             cli_runner.invoke(
@@ -150,3 +150,38 @@ class BooleanTest(unittest.TestCase):
             }
 
         self.assertDictEqual(actual_result, excepted_result, MESSAGE)
+
+    def test_check_methods(self):
+        """test_check_methods method."""
+        self.assertEqual(Boolean.check_bool(True), (1, 0, {}))
+        self.assertEqual(Boolean.check_bool(1), (0, 0, {}))
+        self.assertEqual(Boolean.check_is_in("Ya", ["Ya"]), (1, 0, {}))
+        self.assertEqual(Boolean.check_is_in("No", ["Ya"]), (0, 0, {}))
+
+    def test_dtype(self):
+        """test_dtype method."""
+        actual_result = Boolean(
+            pd.DataFrame({"columm": pd.array([True, None], dtype="boolean")})
+        ).is_bool("columm")
+
+        self.assertEqual(actual_result["valid"], 1, MESSAGE)
+        self.assertEqual(actual_result["invalid"], 1, MESSAGE)
+        self.assertIs(actual_result["warning"][1]["value"], pd.NA, MESSAGE)
+
+        actual_result = Boolean(
+            pd.DataFrame({"columm": [True, False, True]})
+        ).is_in([1], "columm")
+        excepted_result = {
+            "score": 0.6666666666666666,
+            "valid": 2,
+            "invalid": 1,
+            "warning": {
+                1: create_warning_data(
+                    False,
+                    WarningDataDetailMessage.DEFINED_DATA_TYPE,
+                    WarningDataMessage.INVALID_DATA_TYPE,
+                ),
+            },
+        }
+
+        self.assertDictEqual(actual_result, excepted_result, MESSAGE)
@@ -8,13 +8,18 @@
 
 from os import path
 from string import ascii_lowercase, ascii_uppercase
+from tempfile import TemporaryDirectory
 import unittest
+from unittest.mock import patch
 
 from pandas import DataFrame
 from pandas.testing import assert_frame_equal
+import yaml
 
 from datasae.converter import Config, FileType
 
+from .. import MESSAGE
+
 PATH: str = path.join('tests', 'data')
 PATH_CONFIG_JSON: str = path.join(PATH, 'config.json')
 PATH_CONFIG_YAML: str = path.join(PATH, 'config.yaml')
@@ -31,6 +36,41 @@ class CaseInsensitiveEnumTest(unittest.TestCase):
         self.assertIs(FileType('.JSON'), FileType.JSON)
 
 
+class ConfigTest(unittest.TestCase):
+    """ConfigTest."""
+
+    def test_config_cache(self):
+        """test_config_cache."""
+        with TemporaryDirectory() as directory:
+            file_path: str = path.join(directory, 'config.yaml')
+
+            with open(file_path, 'w') as file:
+                file.write('source:\n  type: local\n')
+
+            with patch(
+                'datasae.converter.yaml.load', wraps=yaml.load
+            ) as load:
+                config: dict = Config.config(file_path)
+                config['source']['type'] = 'sql'
+
+                self.assertEqual(
+                    Config.config(file_path),
+                    {'source': {'type': 'local'}},
+                    MESSAGE
+                )
+                self.assertEqual(load.call_count, 1, MESSAGE)
+
+                with open(file_path, 'w') as file:
+                    file.write('source:\n  type: gsheet\n')
+
+                self.assertEqual(
+                    Config.config(file_path),
+                    {'source': {'type': 'gsheet'}},
+                    MESSAGE
+                )
+                self.assertEqual(load.call_count, 2, MESSAGE)
+
+
 class DataFrameTestCase(unittest.TestCase):
     """DataFrameTestCase."""
 
@@ -6,17 +6,76 @@
 
 """test_checker."""
 
+from __future__ import annotations
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import Future, ThreadPoolExecutor
 import csv
+from dataclasses import dataclass, FrozenInstanceError, replace
 import json
+from multiprocessing.shared_memory import SharedMemory
 from os import path
+import pickle
+from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
+import pandas as pd
+import yaml
+
+from datasae.converter import (
+    accepts_projection,
+    CheckerPlan,
+    check_shared_column,
+    ColumnPlan,
+    ColumnPool,
+    Config,
+    DataSource,
+    LoadCache,
+    Plan,
+    RulePlan,
+    share_column,
+    SourcePlan
+)
+from datasae.converter.local import Local
+from datasae.converter.s3 import S3
+from datasae.exception import DataSourceError
+from datasae.integer import Integer
+from datasae.string import String
+from datasae.utils import apply_warning_options, Basic
+
 from .. import CONFIG_JSON, CONFIG_YAML, DataFrameTestCase, PATH
 from ..test_gsheet import MockCreds
 from ..test_s3 import MockResponse
 from ..test_sql import MockEngine, SqlTest
 
 
+class CustomChecker:
+    """Checker class that does not inherit from Basic."""
+
+    def __init__(self, dataFrame):
+        """__init__ method."""
+        self.dataFrame = dataFrame
+
+    def count(self, value, column):
+        """Count method."""
+        return int((self.dataFrame[column] == value).sum())
+
+
+@dataclass(repr=False)
+class PendingSource(DataSource):
+    """Data source whose asynchronous loads never complete."""
+
+    cancelled: list = None
+
+    async def aload(self, *args, **kwargs):
+        """Aload method."""
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            PendingSource.cancelled.append(self.name)
+            raise
+
+
 class CheckerTest(DataFrameTestCase):
     """CheckerTest."""
 
@@ -61,4 +120,731 @@ class CheckerTest(DataFrameTestCase):
             CHECKER: dict[str, list[dict]] = json.loads(file.read())
 
         for config in (CONFIG_JSON, CONFIG_YAML):
-            self.assertDictEqual(CHECKER, config.checker)
+            checker: dict[str, list[dict]] = config.checker
+
+            self.assertDictEqual(CHECKER, checker)
+            self.assertDictEqual(CHECKER, json.loads(json.dumps(checker)))
+            self.assertDictEqual(
+                yaml.safe_load(yaml.safe_dump(checker)), checker
+            )
+
+    def test_custom_checker(self):
+        """test_custom_checker."""
+        with patch.object(Config, 'config', return_value={
+            'test_local': {
+                'type': 'local',
+                'checker': [{
+                    'file_path': path.join(PATH, 'data.csv'),
+                    'column': {
+                        'alphabet': {
+                            __name__ + '.CustomChecker': {'count': ['a']},
+                            'string': {'is_lowercase': None}
+                        }
+                    }
+                }]
+            }
+        }):
+            column: dict = Config('config.json').checker['test_local'][0][
+                'column'
+            ]['alphabet']
+
+        self.assertDictEqual(
+            column[__name__ + '.CustomChecker'],
+            {'count': {'params': ['a'], 'result': 1}}
+        )
+        self.assertEqual(
+            column['string']['is_lowercase']['result']['valid'], 26
+        )
+
+    def test_plan(self):
+        """test_plan."""
+        with patch.object(Config, 'config', return_value={
+            'test_local': {
+                'type': 'local',
+                'checker': [{
+                    'file_path': path.join(PATH, 'data.csv'),
+                    'column': {
+                        'alphabet': {
+                            'string': {
+                                'is_lowercase': None,
+                                'exact': {'str_exact': 'a', 'max_warnings': 1}
+                            }
+                        }
+                    }
+                }]
+            }
+        }) as config:
+            checker_list: list[dict] = Config(
+                'config.json'
+            )('test_local').checker
+            plan: Plan = Config('config.json').compile()
+            call_count: int = config.call_count
+            results: list[dict] = [plan(), plan()]
+
+        self.assertEqual(config.call_count, call_count)
+
+        column: ColumnPlan = plan.sources['test_local'].checkers[0].columns[0]
+        rule: RulePlan = column.rules[1]
+
+        self.assertIs(column.checker_class, String)
+        self.assertEqual(rule.kwargs, {'str_exact': 'a'})
+        self.assertEqual(rule.warning_options['max_warnings'], 1)
+        self.assertEqual(
+            rule(String(pd.read_csv(path.join(PATH, 'data.csv'))), 'alphabet'),
+            checker_list[0]['column']['alphabet']['string']['exact']
+        )
+
+        for result in results:
+            self.assertEqual(result['test_local'], checker_list)
+
+        with self.assertRaises(FrozenInstanceError):
+            rule.name = 'is_uppercase'
+
+        with self.assertRaises(TypeError):
+            rule.kwargs['str_exact'] = 'b'
+
+    def test_column_plan(self):
+        """test_column_plan."""
+        data = pd.DataFrame({'columm': [1, '2', 3]})
+        rules = {
+            'equal_to': 1,
+            'in_range': {'lower_limit': 0, 'upper_limit': 2},
+            'is_in': [[1, 3]],
+            'length': {'value': 1, 'max_warnings': 0}
+        }
+        column_plan = ColumnPlan.compile(
+            'columm', 'integer', rules, {'max_warnings': 1}
+        )
+        clear_cache = Basic.clear_cache
+
+        with patch.object(
+            Integer, 'dtype_type_mask', wraps=Integer.dtype_type_mask
+        ) as dtype_type_mask, patch.object(
+            Basic, 'clear_cache', autospec=True, side_effect=clear_cache
+        ) as mock_clear_cache:
+            actual_result = column_plan(data)
+
+        dtype_type_mask.assert_called_once()
+        mock_clear_cache.assert_called_once()
+        self.assertDictEqual(mock_clear_cache.call_args.args[0]._cache, {})
+        self.assertDictEqual(
+            actual_result,
+            {
+                'equal_to': {
+                    'params': 1,
+                    'result': apply_warning_options(
+                        Integer(data).equal_to(1, 'columm'), max_warnings=1
+                    )
+                },
+                'in_range': {
+                    'params': rules['in_range'],
+                    'result': apply_warning_options(
+                        Integer(data).in_range(0, 2, 'columm'),
+                        max_warnings=1
+                    )
+                },
+                'is_in': {
+                    'params': [[1, 3]],
+                    'result': apply_warning_options(
+                        Integer(data).is_in([1, 3], 'columm'), max_warnings=1
+                    )
+                },
+                'length': {
+                    'params': rules['length'],
+                    'result': apply_warning_options(
+                        Integer(data).length(1, 'columm'), max_warnings=0
+                    )
+                }
+            }
+        )
+        self.assertEqual(
+            actual_result['length']['result']['warning_truncated'], 1
+        )
+
+    def test_load_cache(self):
+        """test_load_cache."""
+        checker: dict = {
+            'file_path': path.join(PATH, 'data.csv'),
+            'column': {'alphabet': {'string': {'is_lowercase': None}}}
+        }
+        config: dict = {
+            name: {'type': 'local', 'checker': [checker, checker]}
+            for name in ('test_local', 'test_local_copy')
+        }
+
+        with patch.object(Config, 'config', return_value=config), patch(
+            'pandas.read_csv', wraps=pd.read_csv
+        ) as read_csv:
+            plan: Plan = Config('config.json').compile()
+            result: dict = plan()
+            self.assertEqual(read_csv.call_count, 1)
+            self.assertEqual(result['test_local'], result['test_local_copy'])
+
+            plan(max_loads=0)
+            self.assertEqual(read_csv.call_count, 5)
+
+            Config('config.json')('test_local').checker
+            self.assertEqual(read_csv.call_count, 6)
+
+        loads: LoadCache = LoadCache(1)
+        data_source: DataSource = plan.sources['test_local'].data_source
+
+        for file_path in ('data.csv', 'data.json', 'data.csv'):
+            loads(data_source, {'file_path': path.join(PATH, file_path)})
+            self.assertEqual(len(loads), 1)
+
+        loads = LoadCache(1)
+
+        with patch('pandas.read_csv', wraps=pd.read_csv) as read_csv:
+            for file_path in ('data.csv', 'data.csv', 'data.json'):
+                asyncio.run(loads.aload(
+                    data_source, {'file_path': path.join(PATH, file_path)}
+                ))
+                self.assertEqual(len(loads), 1)
+
+            self.assertEqual(read_csv.call_count, 1)
+
+        csv_loader: dict = {'file_path': path.join(PATH, 'data.csv')}
+        json_loader: dict = {'file_path': path.join(PATH, 'data.json')}
+        key: str = LoadCache.key(
+            data_source,
+            plan.sources['test_local'].checkers[0].arguments(data_source)
+        )
+
+        self.assertEqual(plan.load_counts, {key: 4})
+        self.assertEqual(plan.sources['test_local'].load_counts, {key: 2})
+        self.assertEqual(
+            SourcePlan(data_source, (
+                replace(checker, chunksize=5)
+                for checker in plan.sources['test_local'].checkers
+            )).load_counts,
+            {}
+        )
+
+        for load in (
+            lambda loads, loader: loads(data_source, loader),
+            lambda loads, loader: asyncio.run(
+                loads.aload(data_source, loader)
+            )
+        ):
+            loads = LoadCache(uses={
+                LoadCache.key(data_source, csv_loader): 2
+            })
+
+            with patch('pandas.read_csv', wraps=pd.read_csv) as read_csv:
+                load(loads, csv_loader)
+                self.assertEqual(len(loads), 1)
+                load(loads, json_loader)
+                self.assertEqual(len(loads), 1)
+                load(loads, csv_loader)
+                self.assertEqual(len(loads), 0)
+                load(loads, csv_loader)
+                self.assertEqual(len(loads), 0)
+
+            self.assertEqual(read_csv.call_count, 2)
+
+    def test_projection(self):
+        """test_projection."""
+        config: dict = {
+            'test_local': {
+                'type': 'local',
+                'checker': [
+                    {
+                        'file_path': path.join(PATH, 'data.csv'),
+                        'column': {
+                            column: {'string': {'is_lowercase': None}}
+                        }
+                    }
+                    for column in ('alphabet', 'ALPHABET')
+                ]
+            }
+        }
+
+        with patch.object(Config, 'config', return_value=config), patch(
+            'pandas.read_csv', wraps=pd.read_csv
+        ) as read_csv:
+            checker_list: list = Config('config.json')('test_local').checker
+
+        usecols = read_csv.call_args.kwargs['usecols']
+
+        self.assertEqual(read_csv.call_count, 1)
+        self.assertTrue(usecols('alphabet') and usecols('ALPHABET'))
+        self.assertFalse(usecols('Unnamed: 0'))
+        self.assertEqual(
+            [
+                checker['column'][column]['string']['is_lowercase']['result'][
+                    'valid'
+                ]
+                for checker, column in zip(
+                    checker_list, ('alphabet', 'ALPHABET')
+                )
+            ],
+            [26, 0]
+        )
+
+        class Custom(DataSource):
+            def __call__(self, file_path):
+                return pd.read_csv(file_path)
+
+        class Forwarding(DataSource):
+            def __call__(self, file_path, **kwargs):
+                return pd.read_csv(file_path, **kwargs)
+
+        self.assertTrue(accepts_projection(Local))
+        self.assertTrue(accepts_projection(S3))
+        self.assertFalse(accepts_projection(Custom))
+        self.assertFalse(accepts_projection(Forwarding))
+
+        for data_source_class in (Custom, Forwarding):
+            self.assertEqual(
+                CheckerPlan.compile(config['test_local']['checker'][0], {})(
+                    data_source_class('custom', 'config.json')
+                ),
+                checker_list[0]
+            )
+
+    def test_max_workers(self):
+        """test_max_workers."""
+        checker: dict = {
+            'file_path': path.join(PATH, 'data.csv'),
+            'column': {'alphabet': {'string': {'is_lowercase': None}}}
+        }
+        config: dict = {
+            'test_local': {'type': 'local', 'checker': [checker] * 3},
+            'test_missing': {
+                'type': 'local',
+                'checker': [{**checker, 'file_path': 'missing.csv'}]
+            },
+            'test_json': {
+                'type': 'local',
+                'checker': [{
+                    **checker, 'file_path': path.join(PATH, 'data.json')
+                }]
+            }
+        }
+
+        with patch.object(Config, 'config', return_value=config):
+            for max_workers in (None, 4):
+                with self.assertRaises(FileNotFoundError):
+                    Config('config.json').check(max_workers)
+
+            config['test_missing_copy'] = config['test_missing']
+
+            with self.assertRaises(DataSourceError) as context:
+                Config('config.json').check(4)
+
+            self.assertEqual(list(context.exception.errors), [
+                'test_missing', 'test_missing_copy'
+            ])
+            self.assertIsInstance(
+                context.exception.__cause__, FileNotFoundError
+            )
+            self.assertEqual(
+                list(context.exception.results), ['test_local', 'test_json']
+            )
+            self.assertEqual(
+                context.exception.results['test_local'],
+                Config('config.json')('test_local').check(4)
+            )
+
+            del config['test_missing'], config['test_missing_copy']
+
+            self.assertEqual(
+                Config('config.json').check(4), Config('config.json').checker
+            )
+
+    def test_max_processes(self):
+        """test_max_processes."""
+        data: pd.DataFrame = pd.DataFrame({
+            'integer': [1, 5, 10, 20],
+            'string': ['a', 'B', None, 'c'],
+            'mixed': ['a', 1, 2.5, None],
+            'timestamp': pd.to_datetime(
+                ['2023-01-01', '2023-06-01', None, '2024-01-01']
+            )
+        })
+
+        for column in data:
+            column_plan: ColumnPlan = pickle.loads(pickle.dumps(
+                ColumnPlan.compile(
+                    column, 'string', {'is_lowercase': None}, {}
+                )
+            ))
+            shared = share_column(data[column])
+
+            if column == 'mixed':
+                self.assertIsNone(shared)
+                continue
+
+            try:
+                self.assertEqual(
+                    check_shared_column(
+                        column_plan, shared[0].name, shared[1]
+                    ),
+                    column_plan(data)
+                )
+            finally:
+                shared[0].close()
+                shared[0].unlink()
+
+        columns: tuple[ColumnPlan] = (
+            ColumnPlan.compile('integer', 'integer', {'less_than': 5}, {}),
+            ColumnPlan.compile('integer', 'float', {'greater_than': 1.5}, {}),
+            ColumnPlan.compile('string', 'string', {'is_lowercase': None}, {}),
+            ColumnPlan.compile('mixed', 'string', {'is_lowercase': None}, {}),
+            ColumnPlan.compile(
+                'timestamp', 'timestamp', {'less_than': '2023-06-01'}, {}
+            ),
+            ColumnPlan.compile(
+                'string', __name__ + '.CustomChecker', {'count': ['a']}, {}
+            )
+        )
+        expected: list[dict] = [
+            column_plan(data) for column_plan in columns
+        ]
+
+        with ColumnPool(2, min_rows=0) as pool:
+            self.assertEqual(pool(columns, data), expected)
+
+        with ColumnPool(2) as pool:
+            with patch('datasae.converter.share_column') as mock_share:
+                self.assertEqual(pool(columns, data), expected)
+
+            mock_share.assert_not_called()
+
+        futures: list[Future] = []
+        unlinked: list[bool] = []
+        unlink = SharedMemory.unlink
+
+        def submit_future(*args):
+            futures.append(submit(*args))
+            return futures[-1]
+
+        def unlink_done(memory):
+            unlinked.append(all(future.done() for future in futures))
+            unlink(memory)
+
+        with ColumnPool(2, min_rows=0) as pool:
+            submit = pool.executor.submit
+
+            with patch.object(
+                pool.executor, 'submit', side_effect=submit_future
+            ), patch.object(
+                SharedMemory, 'unlink', autospec=True, side_effect=unlink_done
+            ):
+                with self.assertRaises(KeyError):
+                    pool((
+                        ColumnPlan.compile(
+                            'missing',
+                            __name__ + '.CustomChecker',
+                            {'count': ['a']},
+                            {}
+                        ),
+                    ) + columns, data)
+
+        self.assertTrue(futures)
+        self.assertTrue(unlinked)
+        self.assertNotIn(False, unlinked)
+
+        self.assertEqual(
+            CONFIG_JSON('test_local').check(
+                max_processes=2, process_min_rows=0
+            ),
+            CONFIG_JSON('test_local').checker
+        )
+
+    def test_acheck(self):
+        """test_acheck."""
+        checker: dict = {
+            'file_path': path.join(PATH, 'data.csv'),
+            'column': {'alphabet': {'string': {'is_lowercase': None}}}
+        }
+        config: dict = {
+            'test_local': {'type': 'local', 'checker': [checker] * 3},
+            'test_missing': {
+                'type': 'local',
+                'checker': [
+                    checker, {**checker, 'file_path': 'missing.csv'}
+                ]
+            },
+            'test_json': {
+                'type': 'local',
+                'checker': [{
+                    **checker, 'file_path': path.join(PATH, 'data.json')
+                }]
+            },
+            'test_empty': {'type': 'local'}
+        }
+
+        async def as_completed(
+            data_source: Config | DataSource
+        ) -> tuple[list, Exception]:
+            items: list = []
+
+            try:
+                async for item in data_source.acheck_as_completed():
+                    items.append(item)
+            except Exception as error:
+                return items, error
+
+            return items, None
+
+        with patch.object(Config, 'config', return_value=config):
+            with self.assertRaises(FileNotFoundError):
+                asyncio.run(Config('config.json').acheck())
+
+            items, error = asyncio.run(as_completed(Config('config.json')))
+
+            self.assertEqual(
+                sorted((name, index) for name, index, _ in items),
+                [
+                    ('test_json', 0),
+                    ('test_local', 0),
+                    ('test_local', 1),
+                    ('test_local', 2),
+                    ('test_missing', 0)
+                ]
+            )
+            self.assertIsInstance(error, FileNotFoundError)
+
+            config['test_missing_copy'] = config['test_missing']
+
+            with self.assertRaises(DataSourceError) as context:
+                asyncio.run(Config('config.json').acheck())
+
+            self.assertEqual(
+                list(context.exception.errors),
+                ['test_missing', 'test_missing_copy']
+            )
+            self.assertIsInstance(
+                context.exception.__cause__, FileNotFoundError
+            )
+            self.assertEqual(
+                list(context.exception.results),
+                ['test_local', 'test_json', 'test_empty']
+            )
+            self.assertEqual(
+                context.exception.results['test_local'],
+                Config('config.json')('test_local').checker
+            )
+
+            items, error = asyncio.run(as_completed(Config('config.json')))
+
+            self.assertEqual(len(items), 6)
+            self.assertIsInstance(error, DataSourceError)
+
+            del config['test_missing_copy']
+
+            with self.assertRaises(FileNotFoundError):
+                asyncio.run(Config('config.json')('test_missing').acheck())
+
+            items, error = asyncio.run(
+                as_completed(Config('config.json')('test_missing'))
+            )
+
+            self.assertEqual([index for index, _ in items], [0])
+            self.assertIsInstance(error, FileNotFoundError)
+
+            del config['test_missing']
+
+            with patch(
+                'pandas.read_csv', wraps=pd.read_csv
+            ) as read_csv:
+                self.assertEqual(
+                    asyncio.run(Config('config.json').acheck()),
+                    Config('config.json').checker
+                )
+                self.assertEqual(read_csv.call_count, 2)
+
+            items, error = asyncio.run(
+                as_completed(Config('config.json')('test_local'))
+            )
+
+            self.assertEqual(
+                sorted(index for index, _ in items), [0, 1, 2]
+            )
+            self.assertIsNone(error)
+
+            with ThreadPoolExecutor(2) as executor:
+                self.assertEqual(
+                    asyncio.run(Config('config.json')('test_local').acheck(
+                        executor, max_processes=2, process_min_rows=0
+                    )),
+                    Config('config.json')('test_local').checker
+                )
+
+            config['test_pending'] = {
+                'type': __name__ + '.PendingSource',
+                'checker': [checker] * 2
+            }
+            PendingSource.cancelled = []
+
+            async def first() -> tuple:
+                items: AsyncIterator = Config(
+                    'config.json'
+                ).acheck_as_completed()
+
+                try:
+                    return await items.__anext__()
+                finally:
+                    await items.aclose()
+
+            name, index = asyncio.run(first())[:2]
+
+            self.assertIn(name, ('test_local', 'test_json'))
+            self.assertEqual(index, 0)
+            self.assertEqual(PendingSource.cancelled, ['test_pending'])
+
+    def test_chunks(self):
+        """test_chunks."""
+        column: dict = {
+            'alphabet': {
+                'string': {
+                    'is_lowercase': None,
+                    'is_uppercase': None,
+                    'exact': {'str_exact': 'a', 'max_warnings': 3}
+                }
+            },
+            'ALPHABET': {
+                'string': {
+                    'is_lowercase': {'group_warnings': True},
+                    'exact': {
+                        'str_exact': 'A',
+                        'message_codes': True,
+                        'max_warnings': 4
+                    }
+                },
+                'integer': {'less_than': 5}
+            }
+        }
+
+        with TemporaryDirectory() as directory:
+            file_path: str = path.join(directory, 'data.json')
+            pd.read_csv(
+                path.join(PATH, 'data.csv'), index_col=0
+            ).to_json(file_path, orient='records', lines=True)
+            checkers: list[dict] = [
+                {'file_path': path.join(PATH, file_name), 'column': column}
+                for file_name in ('data.csv', 'data.parquet', 'data.xlsx')
+            ] + [{'file_path': file_path, 'lines': True, 'column': column}]
+            config: dict = {
+                'test_local': {'type': 'local', 'checker': checkers},
+                'test_chunks': {
+                    'type': 'local',
+                    'checker': [
+                        {**checker, 'chunksize': 5} for checker in checkers
+                    ]
+                }
+            }
+
+            with patch.object(Config, 'config', return_value=config):
+                result: dict = Config('config.json').checker
+
+                with patch(
+                    'datasae.converter.local.read_csv', wraps=pd.read_csv
+                ) as read_csv_chunks, patch(
+                    'pandas.read_csv', wraps=pd.read_csv
+                ) as read_csv:
+                    self.assertEqual(
+                        asyncio.run(Config('config.json').acheck()), result
+                    )
+
+                self.assertEqual(read_csv.call_count, 1)
+                self.assertEqual(
+                    read_csv_chunks.call_args.kwargs['chunksize'], 5
+                )
+
+        self.assertEqual(
+            [
+                {
+                    key: value
+                    for key, value in checker.items()
+                    if key != 'chunksize'
+                }
+                for checker in result['test_chunks']
+            ],
+            result['test_local']
+        )
+        self.assertEqual(yaml.safe_load(yaml.safe_dump(result)), result)
+        self.assertIsInstance(json.dumps(result), str)
+
+        with patch.object(Config, 'config', return_value={
+            'test_local': {
+                'type': 'local',
+                'checker': [{
+                    'file_path': path.join(PATH, 'data.csv'),
+                    'chunksize': 5,
+                    'column': {
+                        'alphabet': {
+                            'string': {
+                                'is_uppercase': {
+                                    'max_warnings': 5,
+                                    'sample_warnings': True
+                                }
+                            }
+                        }
+                    }
+                }]
+            }
+        }):
+            result = Config('config.json').checker['test_local'][0][
+                'column'
+            ]['alphabet']['string']['is_uppercase']['result']
+
+            self.assertEqual(result['invalid'], 26)
+            self.assertEqual(result['warning_truncated'], 21)
+            self.assertEqual(len(result['warning']), 5)
+            self.assertLessEqual(set(result['warning']), set(range(26)))
+
+        with self.assertRaises(ValueError):
+            CheckerPlan.compile({
+                'file_path': path.join(PATH, 'data.csv'),
+                'chunksize': 5,
+                'column': {'alphabet': {__name__ + '.CustomChecker': {
+                    'count': ['a']
+                }}}
+            }, {})
+
+    def test_warning_options(self):
+        """test_warning_options."""
+        rules = {
+            'is_uppercase': None,
+            'exact': {'str_exact': 'A', 'max_warnings': 1}
+        }
+
+        with patch.object(Config, 'config', return_value={
+            'test_local': {
+                'type': 'local',
+                'max_warnings': 5,
+                'checker': [
+                    {
+                        'file_path': path.join(PATH, 'data.csv'),
+                        'column': {'alphabet': {'string': dict(rules)}}
+                    },
+                    {
+                        'file_path': path.join(PATH, 'data.csv'),
+                        'max_warnings': 10,
+                        'sample_warnings': True,
+                        'column': {'alphabet': {'string': dict(rules)}}
+                    }
+                ]
+            }
+        }):
+            checker_list: list = Config('config.json')('test_local').checker
+
+        for checker, max_warnings in zip(checker_list, (5, 10)):
+            result: dict = checker['column']['alphabet']['string']
+            self.assertEqual(
+                len(result['is_uppercase']['result']['warning']),
+                max_warnings
+            )
+            self.assertEqual(
+                result['is_uppercase']['result']['warning_truncated'],
+                26 - max_warnings
+            )
+            self.assertEqual(
+                result['exact']['result']['warning_truncated'], 25
+            )
+            self.assertDictEqual(
+                result['exact']['params'], rules['exact']
+            )
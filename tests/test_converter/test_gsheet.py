@@ -89,3 +89,7 @@ class GSheetTest(DataFrameTestCase):
 
         self.assertEqual(self.DATA, self.gsheet('Sheet1'))
         self.assertEqual(self.DATA, self.gsheet('Sheet1', 'gsheet_id'))
+        self.assertEqual(
+            self.DATA[['ALPHABET']],
+            self.gsheet('Sheet1', projection=['ALPHABET', 'missing'])
+        )
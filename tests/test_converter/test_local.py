@@ -41,6 +41,26 @@ class LocalTest(DataFrameTestCase):
             self.assertEqual(local.name, self.NAME)
             self.assertEqual(local.file_path, path_file)
 
+    def test_projection(self):
+        """test_projection."""
+        for file_path in ('data.csv', 'data.parquet', 'data.xlsx'):
+            self.assertEqual(
+                self.DATA[['alphabet']],
+                self.local(
+                    path.join(PATH, file_path), projection=['alphabet']
+                ),
+                file_path
+            )
+
+        self.assertEqual(
+            self.DATA,
+            self.local(
+                path.join(PATH, 'data.parquet'),
+                projection=['alphabet'],
+                columns=['alphabet', 'ALPHABET']
+            )
+        )
+
     def test_convert(self):
         """test_convert."""
         self.assertEqual(
@@ -7,6 +7,7 @@
 """test_sql."""
 
 from __future__ import annotations
+import asyncio
 from dataclasses import dataclass
 from os import path
 from unittest.mock import patch
@@ -32,6 +33,32 @@ class MockEngine:
     url: str | URL
 
 
+@dataclass
+class MockAsyncEngine:
+    """MockAsyncEngine."""
+
+    disposed: bool = False
+
+    def connect(self):
+        """Connect method."""
+        return self
+
+    async def __aenter__(self):
+        """__aenter__ method."""
+        return self
+
+    async def __aexit__(self, *args):
+        """__aexit__ method."""
+
+    async def run_sync(self, function, *args, **kwargs):
+        """Run_sync method."""
+        return function(self, *args, **kwargs)
+
+    async def dispose(self):
+        """Dispose method."""
+        self.disposed = True
+
+
 class SqlTest(DataFrameTestCase):
     """SqlTest."""
 
@@ -109,3 +136,120 @@ class SqlTest(DataFrameTestCase):
                     self.DATA,
                     converter(path.join(PATH, 'query.sql'))
                 )
+                converter(
+                    'select 1 column_name;',
+                    projection=['column_name', 'Another Column']
+                )
+                self.assertEqual(
+                    mock_read_sql_query.call_args.args[0],
+                    'SELECT column_name, {0}Another Column{1} FROM '
+                    '(\nselect 1 column_name\n) AS projection'.format(
+                        *('``' if 'mysql' in drivername else '""')
+                    )
+                )
+
+    def test_select(self):
+        """test_select."""
+        converter: Sql = CONFIG_JSON('test_postgresql')
+
+        for query in (
+            'select 1 column_name -- the only column',
+            '-- the only column\nSELECT 1 column_name;',
+            '/* the only column */ select 1 column_name ; '
+        ):
+            self.assertEqual(
+                converter.select(query, ['column_name']),
+                'SELECT column_name FROM (\n{}\n) AS projection'.format(
+                    query.strip().rstrip(';')
+                )
+            )
+
+        for query in (
+            'WITH cte AS (SELECT 1 column_name) SELECT * FROM cte',
+            '-- the only column\nwith cte as (select 1 column_name)\n'
+            'select * from cte',
+            'EXEC get_columns',
+            'SHOW TABLES',
+            'select 1 column_name; -- the only column',
+            'select 1 column_name; select 2 column_name',
+            'selected_columns'
+        ):
+            self.assertEqual(
+                converter.select(query, ['column_name']), query
+            )
+
+        self.assertEqual(
+            converter.select('select 1 column_name;'), 'select 1 column_name;'
+        )
+
+    @patch('pandas.read_sql_query')
+    def test_aload(self, mock_read_sql_query):
+        """test_aload."""
+        mock_read_sql_query.return_value = self.DATA.copy()
+
+        self.assertEqual(
+            self.DATA,
+            asyncio.run(CONFIG_JSON('test_postgresql').aload(
+                path.join(PATH, 'query.sql')
+            ))
+        )
+
+        converter: Sql = Sql(
+            'test_asyncpg',
+            PATH_CONFIG_JSON,
+            'postgresql+asyncpg',
+            'postgres',
+            'testpassword',
+            'localhost',
+            5432,
+            'postgres'
+        )
+
+        engine: MockAsyncEngine = MockAsyncEngine()
+
+        with patch(
+            'datasae.converter.sql.create_async_engine', return_value=engine
+        ) as mock_create_async_engine, patch(
+            'datasae.converter.sql.read_sql_query',
+            return_value=self.DATA.copy()
+        ) as mock_async_read_sql_query:
+            self.assertEqual(
+                self.DATA,
+                asyncio.run(converter.aload(
+                    'select 1 column_name;', projection=['column_name']
+                ))
+            )
+
+        self.assertEqual(
+            mock_create_async_engine.call_args.args[0].drivername,
+            'postgresql+asyncpg'
+        )
+        self.assertEqual(
+            mock_async_read_sql_query.call_args.args,
+            (
+                'SELECT column_name FROM (\nselect 1 column_name\n) '
+                'AS projection',
+                engine
+            )
+        )
+        self.assertTrue(engine.disposed)
+
+    def test_chunks(self):
+        """test_chunks."""
+        converter: Sql = Sql(
+            'test_sqlite', PATH_CONFIG_JSON, 'sqlite', None, None, None, None,
+            ':memory:'
+        )
+
+        self.assertEqual(
+            [
+                chunk.to_dict('records')
+                for chunk in converter.chunks(
+                    2,
+                    'select 1 a, 2 b union all select 3, 4 '
+                    'union all select 5, 6;',
+                    projection=['b']
+                )
+            ],
+            [[{'b': 2}, {'b': 4}], [{'b': 6}]]
+        )
@@ -9,8 +9,11 @@
 import unittest
 
 from datasae.exception import (
+    DataSourceError,
     EmptyDataFrame,
     ColumnNotExist,
+    InvalidDataTypeWarning,
+    InvalidDataValueWarning,
     InvalidDateFormatWarning
 )
 
@@ -29,3 +32,9 @@ class ExceptionTest(unittest.TestCase):
             InvalidDateFormatWarning('warning').message,
             'warning'
         )
+        self.assertEqual(InvalidDataTypeWarning('warning').message, 'warning')
+        self.assertEqual(InvalidDataValueWarning('warning').message, 'warning')
+        self.assertEqual(
+            DataSourceError({'source': KeyError('column')}, {}).message,
+            "Checking failed for data source 'source' (KeyError('column'))."
+        )
@@ -7,6 +7,7 @@
 """test_float."""
 
 import unittest
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -308,3 +309,92 @@ class FloatTest(unittest.TestCase):
         }
 
         self.assertDictEqual(actual_result, excepted_result, MESSAGE)
+
+    def test_check_methods(self):
+        """test_check_methods."""
+        self.assertEqual(Float.check_equal(1., 1.), (1, 0, {}))
+        self.assertEqual(
+            Float.check_equal(.5, 1.),
+            (0, 1, create_warning_data(.5, 'Value should be equal to 1.0'))
+        )
+        self.assertEqual(Float.check_less_than(.5, 1.), (1, 0, {}))
+        self.assertEqual(Float.check_less_than(1., 1.)[:2], (0, 1))
+        self.assertEqual(Float.check_less_than_equal(1., 1.), (1, 0, {}))
+        self.assertEqual(Float.check_less_than_equal(2., 1.)[:2], (0, 1))
+        self.assertEqual(Float.check_greater_than(2., 1.), (1, 0, {}))
+        self.assertEqual(Float.check_greater_than(1., 1.)[:2], (0, 1))
+        self.assertEqual(Float.check_greater_than_equal(1., 1.), (1, 0, {}))
+        self.assertEqual(Float.check_greater_than_equal(.5, 1.)[:2], (0, 1))
+        self.assertEqual(Float.check_in_range(.5, 0., 1.), (1, 0, {}))
+        self.assertEqual(Float.check_in_range(2., 0., 1.)[:2], (0, 1))
+        self.assertEqual(Float.check_is_in(.5, [.5]), (1, 0, {}))
+        self.assertEqual(Float.check_is_in(1., [.5])[:2], (0, 1))
+        self.assertEqual(Float.check_not_in(1., [.5]), (1, 0, {}))
+        self.assertEqual(Float.check_not_in(.5, [.5])[:2], (0, 1))
+        self.assertEqual(Float.check_not_in(np.nan, [.5])[:2], (0, 1))
+
+    def test_nan(self):
+        """test_nan."""
+        dummy = pd.DataFrame({'columm': [.5, np.nan]})
+
+        for actual_result in (
+            Float(dummy).equal_to(.5, 'columm'),
+            Float(dummy).in_range(0., 1., 'columm'),
+            Float(dummy).is_in([.5, np.nan], 'columm'),
+            Float(dummy).not_in([1.], 'columm')
+        ):
+            self.assertEqual(actual_result['valid'], 1, MESSAGE)
+            self.assertEqual(actual_result['invalid'], 1, MESSAGE)
+            self.assertEqual(
+                actual_result['warning'][1]['message'],
+                WarningDataMessage.INVALID_VALUE,
+                MESSAGE
+            )
+
+    def test_equal_to_tolerance(self):
+        """test_equal_to_tolerance."""
+        dummy = pd.DataFrame({'columm': [.1 + .2, .31, np.inf]})
+
+        actual_result = Float(dummy).equal_to(.3, 'columm', tolerance=1e-9)
+        excepted_result = {
+            'score': .3333333333333333,
+            'valid': 1,
+            'invalid': 2,
+            'warning': {
+                1: create_warning_data(
+                    .31, 'Value should be equal to 0.3 with tolerance 1e-09'
+                ),
+                2: create_warning_data(
+                    np.inf, 'Value should be equal to 0.3 with tolerance 1e-09'
+                )
+            }
+        }
+
+        self.assertDictEqual(actual_result, excepted_result, MESSAGE)
+        self.assertEqual(
+            Float(dummy).equal_to(np.inf, 'columm', tolerance=1.)['valid'],
+            1,
+            MESSAGE
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertEqual(
+                Float(dummy).equal_to(np.inf, 'columm')['valid'], 1, MESSAGE
+            )
+
+    def test_dtype(self):
+        """test_dtype."""
+        actual_result = Float(
+            pd.DataFrame({'columm': pd.array([.5, None], dtype='Float64')})
+        ).less_than(1., 'columm')
+
+        self.assertEqual(actual_result['valid'], 1, MESSAGE)
+        self.assertIs(actual_result['warning'][1]['value'], pd.NA, MESSAGE)
+        self.assertEqual(
+            Float(pd.DataFrame({'columm': [1, 2]})).less_than(
+                1., 'columm'
+            )['invalid'],
+            2,
+            MESSAGE
+        )
@@ -462,3 +462,159 @@ class IntegerTest(unittest.TestCase):
         }
 
         self.assertDictEqual(actual_result, excepted_result, MESSAGE)
+
+    def test_check_methods(self):
+        """test_check_methods."""
+        self.assertEqual(Integer.check_equal(11, 11), (1, 0, {}))
+        self.assertEqual(
+            Integer.check_equal(44, 11),
+            (0, 1, create_warning_data(44, "Value should be equal to 11")),
+        )
+        self.assertEqual(Integer.check_less_than(1, 2), (1, 0, {}))
+        self.assertEqual(Integer.check_less_than(2, 2)[:2], (0, 1))
+        self.assertEqual(Integer.check_less_than_equal(2, 2), (1, 0, {}))
+        self.assertEqual(Integer.check_less_than_equal(3, 2)[:2], (0, 1))
+        self.assertEqual(Integer.check_greater_than(3, 2), (1, 0, {}))
+        self.assertEqual(Integer.check_greater_than(2, 2)[:2], (0, 1))
+        self.assertEqual(Integer.check_greater_than_equal(2, 2), (1, 0, {}))
+        self.assertEqual(Integer.check_greater_than_equal(1, 2)[:2], (0, 1))
+        self.assertEqual(Integer.check_in_range(2, 1, 3), (1, 0, {}))
+        self.assertEqual(Integer.check_in_range(4, 1, 3)[:2], (0, 1))
+        self.assertEqual(Integer.check_is_in(2, [1, 2]), (1, 0, {}))
+        self.assertEqual(Integer.check_is_in(3, [1, 2])[:2], (0, 1))
+        self.assertEqual(Integer.check_not_in(3, [1, 2]), (1, 0, {}))
+        self.assertEqual(Integer.check_not_in(2, [1, 2])[:2], (0, 1))
+        self.assertEqual(Integer.check_length(12, 2), (1, 0, {}))
+        self.assertEqual(Integer.check_length(-1, 1)[:2], (0, 1))
+
+    def test_dtype(self):
+        """test_dtype."""
+        actual_result = Integer(
+            pd.DataFrame({"columm": pd.array([11, None], dtype="Int64")})
+        ).equal_to(11, "columm")
+
+        self.assertEqual(actual_result["valid"], 1, MESSAGE)
+        self.assertEqual(actual_result["invalid"], 1, MESSAGE)
+        self.assertIs(actual_result["warning"][1]["value"], pd.NA, MESSAGE)
+        self.assertDictEqual(
+            Integer(
+                pd.DataFrame({"columm": [11.0, 2.0]})
+            ).equal_to(11, "columm"),
+            {
+                "score": 0.0,
+                "valid": 0,
+                "invalid": 2,
+                "warning": {
+                    index: create_warning_data(
+                        value,
+                        WarningDataDetailMessage.INTEGER_DATA_TYPE,
+                        WarningDataMessage.INVALID_DATA_TYPE,
+                    )
+                    for index, value in enumerate([11.0, 2.0])
+                },
+            },
+            MESSAGE,
+        )
+
+    def test_bool_large_value(self):
+        """test_bool_large_value."""
+        for dtype in (bool, "boolean", object):
+            integer = Integer(
+                pd.DataFrame({"columm": pd.array([True, False], dtype=dtype)})
+            )
+
+            for method, args, valid in (
+                ("equal_to", (2**70,), 0),
+                ("less_than", (2**70,), 2),
+                ("less_than_equal", (-(2**70),), 0),
+                ("greater_than", (-(2**70),), 2),
+                ("greater_than_equal", (2**70,), 0),
+                ("in_range", (-(2**70), 2**70), 2),
+                ("is_in", ([1, 2**70],), 1),
+            ):
+                actual_result = getattr(integer, method)(*args, "columm")
+                self.assertEqual(actual_result["valid"], valid, MESSAGE)
+                self.assertEqual(
+                    actual_result["invalid"], 2 - valid, MESSAGE
+                )
+
+    def test_is_in_large_list(self):
+        """test_is_in_large_list."""
+        dummy = pd.DataFrame({"columm": [3, 4, 100000]})
+
+        actual_result = Integer(dummy).is_in(range(0, 50000, 2), "columm")
+        excepted_result = {
+            "score": 0.0,
+            "valid": 0,
+            "invalid": 3,
+            "warning": {
+                index: create_warning_data(
+                    value,
+                    "Value should be in [0, 2, 4, 6, 8, 10, 12, 14, 16, 18, "
+                    "... and 24990 more]",
+                )
+                for index, value in enumerate([3, 4, 100000])
+            },
+        }
+        excepted_result["warning"].pop(1)
+        excepted_result.update(score=1 / 3, valid=1, invalid=2)
+
+        self.assertDictEqual(actual_result, excepted_result, MESSAGE)
+        self.assertEqual(
+            Integer(dummy).not_in([], "columm")["valid"], 3, MESSAGE
+        )
+
+    def test_digit_count(self):
+        """test_digit_count."""
+        integer_data = [0, 9, -9, 10, -10, 2**63 - 1, -(2**63), 1]
+
+        for dtype in (np.int64, object):
+            self.assertListEqual(
+                Integer.digit_count(
+                    np.array(integer_data, dtype=dtype)
+                ).tolist(),
+                [1, 1, 2, 2, 3, 19, 20, 1],
+                MESSAGE,
+            )
+
+        self.assertListEqual(
+            Integer.digit_count(
+                np.array([True, False, 10, -1], dtype=object)
+            ).tolist(),
+            [4, 5, 2, 2],
+            MESSAGE,
+        )
+        self.assertListEqual(
+            Integer.digit_count(np.array([True, False])).tolist(),
+            [4, 5],
+            MESSAGE,
+        )
+        self.assertEqual(
+            Integer(pd.DataFrame({"columm": [True, False, 1]})).length(
+                4, "columm"
+            )["valid"],
+            1,
+            MESSAGE,
+        )
+
+        self.assertListEqual(
+            Integer.digit_count(
+                np.array([0, 10**19, 2**64 - 1], dtype=np.uint64)
+            ).tolist(),
+            [1, 20, 20],
+            MESSAGE,
+        )
+        self.assertListEqual(
+            Integer.digit_count(
+                np.array([2**70, -(2**70)], dtype=object)
+            ).tolist(),
+            [22, 23],
+            MESSAGE,
+        )
+        self.assertEqual(
+            Integer(
+                pd.DataFrame({"columm": pd.array([10, None], dtype="UInt8")})
+            ).length(2, "columm")["valid"],
+            1,
+            MESSAGE,
+        )
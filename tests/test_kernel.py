@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+# Copyright (C) Free Software Foundation, Inc. All rights reserved.
+# Licensed under the AGPL-3.0-only License. See LICENSE in the project root
+# for license information.
+
+"""test_kernel."""
+
+from datetime import datetime
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from datasae.boolean import Boolean
+from datasae.float import Float
+from datasae.integer import Integer
+from datasae.kernel import (
+    INVALID_DATA_TYPE,
+    INVALID_VALUE,
+    RecordChecker,
+    VALID
+)
+from datasae.string import String
+from datasae.timestamp import Timestamp
+from datasae.utils import rule_arguments, WarningDataMessage
+
+from . import MESSAGE
+
+
+class RecordCheckerTest(unittest.TestCase):
+    """RecordCheckerTest."""
+
+    STATUS: dict = {
+        WarningDataMessage.INVALID_VALUE: INVALID_VALUE,
+        WarningDataMessage.INVALID_DATA_TYPE: INVALID_DATA_TYPE
+    }
+
+    def assertKernel(
+        self, checker_class: type, values: list, rules: dict
+    ):
+        """Assert the kernels agree with the vectorized rules."""
+        data = pd.DataFrame({'column': values})
+
+        for rule, params in rules.items():
+            args, kwargs, _ = rule_arguments(params)
+            result = getattr(checker_class(data), rule)(
+                *args, column='column', **kwargs
+            )
+            expected = [
+                self.STATUS[result['warning'][index]['message']]
+                if index in result['warning'] else VALID
+                for index in range(len(values))
+            ]
+            record_checker = RecordChecker(
+                {'column': {checker_class.__name__: {rule: params}}}
+            )
+
+            self.assertEqual(
+                [
+                    record_checker.check({'column': value})
+                    for value in data['column'].tolist()
+                ],
+                expected,
+                f'{MESSAGE} ({checker_class.__name__}.{rule})'
+            )
+
+    def test_integer(self):
+        """test_integer."""
+        self.assertKernel(
+            Integer,
+            [0, 5, -5, 10, 123, -12, 1.5, 'a', None, True],
+            {
+                'equal_to': 5,
+                'less_than': 5,
+                'less_than_equal': 5,
+                'greater_than': 5,
+                'greater_than_equal': 5,
+                'in_range': {'lower_limit': -5, 'upper_limit': 10},
+                'is_in': [[0, 5, 123]],
+                'not_in': [[0, 5, 123]],
+                'length': 1,
+            }
+        )
+        self.assertKernel(Integer, [0, 7, -7, 10, -10, 99], {'length': 2})
+        self.assertKernel(Integer, [0, -1, 1], {'length': [0]})
+        self.assertKernel(
+            Integer, [True, False, 1], {'length': 4, 'equal_to': 1}
+        )
+
+    def test_float(self):
+        """test_float."""
+        self.assertKernel(
+            Float,
+            [0.5, 1.0, 1.05, -2.5, float('nan'), 3, 'a'],
+            {
+                'equal_to': 1.0,
+                'less_than': 1.0,
+                'less_than_equal': 1.0,
+                'greater_than': 1.0,
+                'greater_than_equal': 1.0,
+                'in_range': [-2.5, 1.0],
+                'is_in': [[0.5, 1.0]],
+                'not_in': [[0.5, 1.0]]
+            }
+        )
+        self.assertKernel(
+            Float,
+            [1.0, 1.05, 1.5],
+            {'equal_to': {'value': 1.0, 'tolerance': 0.1}}
+        )
+
+    def test_string(self):
+        """test_string."""
+        self.assertKernel(
+            String,
+            ['Hello World', 'hello world', 'HELLO', 'a-b', ' Hi', 1, None],
+            {
+                'exact': 'HELLO',
+                'is_in_contain': [['World', 'LL']],
+                'is_in_exact': [['HELLO', 'a-b']],
+                'contain': 'ell',
+                'not_contain': 'ell',
+                'regex_contain': '^[a-z ]+$',
+                'special_char_contain': '-',
+                'is_uppercase': None,
+                'is_lowercase': None,
+                'is_capitalize_first_word': None,
+                'is_capitalize_all_word': None
+            }
+        )
+        self.assertKernel(
+            String, ['a-b', 'ab', 1], {'special_char_contain': 'a'}
+        )
+        self.assertKernel(
+            String,
+            ['kw1x', 'kw99', 'none'],
+            {'is_in_contain': [[f'kw{index}x' for index in range(100)]]}
+        )
+
+    def test_timestamp(self):
+        """test_timestamp."""
+        self.assertKernel(
+            Timestamp,
+            [
+                datetime(2023, 1, 1),
+                datetime(2023, 6, 1),
+                datetime(2024, 1, 1),
+                'a'
+            ],
+            {
+                'equal_to': datetime(2023, 6, 1),
+                'less_than': datetime(2023, 6, 1),
+                'greater_than_equal': datetime(2023, 6, 1),
+                'in_range': [datetime(2023, 1, 1), datetime(2023, 12, 31)],
+                'is_in': [[datetime(2023, 1, 1), datetime(2024, 1, 1)]],
+                'not_in': [[datetime(2023, 1, 1), datetime(2024, 1, 1)]]
+            }
+        )
+        self.assertKernel(
+            Timestamp,
+            pd.to_datetime(['2023-01-01', '2023-06-01', '2024-01-01', None]),
+            {
+                'equal_to': '2023-06-01',
+                'less_than_equal': '2023-06-01',
+                'greater_than': '2023-06-01',
+                'in_range': ['2023-01-01', '2023-12-31'],
+                'is_in': [['2023-01-01', '2024-01-01']],
+                'not_in': [['2023-01-01', '2024-01-01']]
+            }
+        )
+
+        record_checker = RecordChecker(
+            {'column': {'timestamp': {'less_than': '2023-06-01'}}}
+        )
+
+        self.assertEqual(
+            record_checker.check(
+                {'column': pd.Timestamp('2023-01-01', tz='UTC')}
+            ),
+            INVALID_VALUE,
+            MESSAGE
+        )
+
+    def test_boolean(self):
+        """test_boolean."""
+        self.assertKernel(
+            Boolean,
+            [True, False, 1, 'a', None],
+            {'is_bool': None, 'is_in': [[True]]}
+        )
+
+    def test_record_checker(self):
+        """test_record_checker."""
+        record_checker = RecordChecker({
+            'a': {'integer': {'less_than': {'value': 10, 'max_warnings': 1}}},
+            'b': {
+                'datasae.string.String': {'contain': 'x', 'is_lowercase': None}
+            }
+        })
+        records = [
+            {'a': 1, 'b': 'x'},
+            {'a': 11, 'b': 'x'},
+            {'a': 1, 'b': 'X'},
+            {'b': 'x'}
+        ]
+
+        self.assertEqual(
+            [kernel.rule for kernel in record_checker.kernels],
+            ['less_than', 'contain', 'is_lowercase'],
+            MESSAGE
+        )
+        self.assertEqual(
+            record_checker.check_batch(records).tolist(),
+            [VALID, INVALID_VALUE, INVALID_VALUE, INVALID_DATA_TYPE],
+            MESSAGE
+        )
+        self.assertEqual(
+            record_checker.check_batch(records).dtype, np.int8, MESSAGE
+        )
+        self.assertEqual(record_checker.failures(records[0]), [], MESSAGE)
+        self.assertEqual(
+            [
+                (kernel.column, kernel.rule, status)
+                for kernel, status in record_checker.failures(
+                    {'a': 'z', 'b': 'X'}
+                )
+            ],
+            [
+                ('a', 'less_than', INVALID_DATA_TYPE),
+                ('b', 'contain', INVALID_VALUE),
+                ('b', 'is_lowercase', INVALID_VALUE)
+            ],
+            MESSAGE
+        )
+
+        with self.assertRaises(ValueError):
+            RecordChecker({'a': {'integer': {'unknown': None}}})
+
+        with self.assertRaises(ValueError):
+            RecordChecker({'a': {'datasae.utils.Basic': {'equal_to': 1}}})
@@ -9,10 +9,15 @@
 import unittest
 
 import pandas as pd
+import pyarrow as pa
 
 from . import MESSAGE
 from datasae.string import String, WarningDataDetailMessage
-from datasae.utils import create_warning_data, WarningDataMessage
+from datasae.utils import (
+    compile_regex,
+    create_warning_data,
+    WarningDataMessage
+)
 
 
 class StringTest(unittest.TestCase):
@@ -666,3 +671,156 @@ class StringTest(unittest.TestCase):
         }
 
         self.assertDictEqual(actual_result, expected_result, MESSAGE)
+
+    def test_check_methods(self):
+        """test_check_methods."""
+        self.assertEqual(String.check_exact("a", "a"), (1, 0, {}))
+        self.assertEqual(
+            String.check_exact("a", "b"),
+            (0, 1, create_warning_data("b", "Value should be exact to a")),
+        )
+        self.assertEqual(
+            String.check_is_in_contain(["a", "c"], "ab"), (1, 0, {})
+        )
+        self.assertEqual(String.check_is_in_contain(["c"], "ab")[:2], (0, 1))
+        self.assertEqual(String.check_is_in_exact("a", ["a"]), (1, 0, {}))
+        self.assertEqual(String.check_is_in_exact("b", ["a"])[:2], (0, 1))
+        self.assertEqual(String.check_contain("a", "ab"), (1, 0, {}))
+        self.assertEqual(String.check_contain("c", "ab")[:2], (0, 1))
+        self.assertEqual(String.check_not_contain("c", "ab"), (1, 0, {}))
+        self.assertEqual(String.check_not_contain("a", "ab")[:2], (0, 1))
+        self.assertEqual(
+            String.check_special_char_contain(".", "a.b"), (1, 0, {})
+        )
+        self.assertEqual(
+            String.check_special_char_contain(".", "ab")[:2], (0, 1)
+        )
+        self.assertEqual(
+            String.check_special_char_contain("a", "a"), (0, 0, {})
+        )
+        self.assertEqual(String.check_is_uppercase("AB"), (1, 0, {}))
+        self.assertEqual(String.check_is_uppercase("Ab")[:2], (0, 1))
+        self.assertEqual(String.check_is_lowercase("ab"), (1, 0, {}))
+        self.assertEqual(String.check_is_lowercase("Ab")[:2], (0, 1))
+        self.assertEqual(
+            String.check_is_capitalize_first_word(" Ab"), (1, 0, {})
+        )
+        self.assertEqual(
+            String.check_is_capitalize_first_word("ab")[:2], (0, 1)
+        )
+        self.assertEqual(
+            String.check_is_capitalize_all_word("Ab Cd"), (1, 0, {})
+        )
+        self.assertEqual(
+            String.check_is_capitalize_all_word("Ab cd")[:2], (0, 1)
+        )
+
+    def test_arrow(self):
+        """test_arrow."""
+        values = ["Python", "python", "PYTHON", " Py Thon", "", None]
+
+        for dtype in (
+            "string[pyarrow]",
+            pd.ArrowDtype(pa.string()),
+            pd.ArrowDtype(pa.large_string()),
+        ):
+            arrow_string = String(
+                pd.DataFrame({"column": pd.Series(values, dtype=dtype)})
+            )
+            object_string = String(
+                pd.DataFrame({"column": pd.Series(values, dtype=object)})
+            )
+
+            for method, args in (
+                ("exact", ("Python",)),
+                ("is_in_exact", (["Python", "PYTHON", 1],)),
+                ("contain", ("yth",)),
+                ("not_contain", ("yth",)),
+                ("special_char_contain", (" ",)),
+                ("special_char_contain", ("-",)),
+                ("is_uppercase", ()),
+                ("is_lowercase", ()),
+                ("is_capitalize_first_word", ()),
+                ("is_capitalize_all_word", ()),
+            ):
+                arrow_result = getattr(arrow_string, method)(*args, "column")
+                object_result = getattr(object_string, method)(
+                    *args, "column"
+                )
+                object_result["warning"][5]["value"] = pd.NA
+
+                self.assertDictEqual(arrow_result, object_result, MESSAGE)
+
+    def test_non_string_dtype(self):
+        """test_non_string_dtype."""
+        actual_result = String(pd.DataFrame({"column": [1, 2]})).exact(
+            "1", "column"
+        )
+
+        self.assertEqual(actual_result["invalid"], 2, MESSAGE)
+        self.assertEqual(
+            actual_result["warning"][0]["message"],
+            WarningDataMessage.INVALID_DATA_TYPE,
+            MESSAGE,
+        )
+
+    def test_regex_cache(self):
+        """test_regex_cache."""
+        self.assertEqual(
+            String.check_regex_contain("^[a-z]+$", "abc"), (1, 0, {})
+        )
+        self.assertEqual(
+            String.check_regex_contain("^[a-z]+$", "Abc"),
+            (
+                0,
+                1,
+                create_warning_data(
+                    "Abc", "Value should be contain to ^[a-z]+$"
+                ),
+            ),
+        )
+
+        compile_regex.cache_clear()
+        dummy = pd.DataFrame(
+            {"column": pd.Series(["abc", "Abc", None], dtype="string")}
+        )
+
+        for _ in range(3):
+            actual_result = String(dummy).regex_contain("^[a-z]+$", "column")
+
+        self.assertEqual(actual_result["valid"], 1, MESSAGE)
+        self.assertEqual(actual_result["invalid"], 2, MESSAGE)
+        self.assertEqual(compile_regex.cache_info().misses, 1, MESSAGE)
+        self.assertEqual(compile_regex.cache_info().hits, 2, MESSAGE)
+
+        self.assertEqual(
+            String(pd.DataFrame({"column": ["123", "124"]})).regex_contain(
+                123, "column"
+            )["valid"],
+            1,
+            MESSAGE,
+        )
+
+        with self.assertRaises(ValueError):
+            String(dummy).regex_contain(None, "column")
+
+    def test_is_in_contain_automaton(self):
+        """test_is_in_contain_automaton."""
+        patterns = [f"kw{index}x" for index in range(100)] + ["as"]
+        dummy = pd.DataFrame(
+            {"column": ["Masa", "a kw42x b", "kw4y", "Laptop", "Laptop", 10]}
+        )
+
+        actual_result = String(dummy).is_in_contain(patterns, "column")
+
+        self.assertEqual(actual_result["valid"], 2, MESSAGE)
+        self.assertEqual(actual_result["invalid"], 4, MESSAGE)
+        self.assertListEqual(
+            list(actual_result["warning"]), [2, 3, 4, 5], MESSAGE
+        )
+        self.assertTrue(
+            actual_result["warning"][2]["detail_message"].endswith(
+                "... and 91 more]"
+            ),
+            MESSAGE,
+        )
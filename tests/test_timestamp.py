@@ -6,9 +6,10 @@
 
 """test_timestamp."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from datasae.timestamp import Timestamp, WarningDataDetailMessage
@@ -529,3 +530,173 @@ class TimestampTest(unittest.TestCase):
         }
 
         self.assertDictEqual(actual_result, excepted_result, MESSAGE)
+
+    def test_check_methods(self):
+        """test_check_methods."""
+        timestamp = datetime(2023, 1, 2)
+        before = timestamp - timedelta(days=1)
+        after = timestamp + timedelta(days=1)
+
+        self.assertEqual(
+            Timestamp.check_equal(timestamp, timestamp), (1, 0, {})
+        )
+        self.assertEqual(
+            Timestamp.check_equal(before, timestamp),
+            (
+                0,
+                1,
+                create_warning_data(
+                    before, f"Value should be equal to {timestamp}"
+                ),
+            ),
+        )
+        self.assertEqual(
+            Timestamp.check_less_than(before, timestamp), (1, 0, {})
+        )
+        self.assertEqual(
+            Timestamp.check_less_than(timestamp, timestamp)[:2], (0, 1)
+        )
+        self.assertEqual(
+            Timestamp.check_less_than_equal(timestamp, timestamp), (1, 0, {})
+        )
+        self.assertEqual(
+            Timestamp.check_less_than_equal(after, timestamp)[:2], (0, 1)
+        )
+        self.assertEqual(
+            Timestamp.check_greater_than(after, timestamp), (1, 0, {})
+        )
+        self.assertEqual(
+            Timestamp.check_greater_than(timestamp, timestamp)[:2], (0, 1)
+        )
+        self.assertEqual(
+            Timestamp.check_greater_than_equal(timestamp, timestamp),
+            (1, 0, {}),
+        )
+        self.assertEqual(
+            Timestamp.check_greater_than_equal(before, timestamp)[:2], (0, 1)
+        )
+        self.assertEqual(
+            Timestamp.check_in_range(timestamp, before, after), (1, 0, {})
+        )
+        self.assertEqual(
+            Timestamp.check_in_range(after, before, timestamp)[:2], (0, 1)
+        )
+        self.assertEqual(
+            Timestamp.check_is_in(timestamp, [timestamp]), (1, 0, {})
+        )
+        self.assertEqual(
+            Timestamp.check_is_in(before, [timestamp])[:2], (0, 1)
+        )
+        self.assertEqual(
+            Timestamp.check_not_in(before, [timestamp]), (1, 0, {})
+        )
+        self.assertEqual(
+            Timestamp.check_not_in(timestamp, [timestamp])[:2], (0, 1)
+        )
+
+    def test_datetime64(self):
+        """test_datetime64."""
+        timestamps = [datetime(2023, 1, day) for day in range(1, 6)]
+        naive = pd.Series(timestamps + [None], dtype="datetime64[s]")
+
+        for data, to_timestamp in (
+            (naive, pd.Timestamp),
+            (
+                naive.dt.tz_localize("Asia/Jakarta"),
+                lambda timestamp: pd.Timestamp(timestamp).tz_localize(
+                    "Asia/Jakarta"
+                ),
+            ),
+        ):
+            datetime64_timestamp = Timestamp(pd.DataFrame({"columm": data}))
+            object_timestamp = Timestamp(
+                pd.DataFrame({"columm": data.astype(object)})
+            )
+
+            for method, args in (
+                ("equal_to", (to_timestamp(timestamps[1]),)),
+                ("less_than", (to_timestamp(timestamps[1]),)),
+                ("less_than_equal", (to_timestamp(timestamps[1]),)),
+                ("greater_than", (to_timestamp(timestamps[1]),)),
+                ("greater_than_equal", (to_timestamp(timestamps[1]),)),
+                (
+                    "in_range",
+                    (to_timestamp(timestamps[1]), to_timestamp(timestamps[3])),
+                ),
+                ("is_in", ([to_timestamp(timestamps[1]), "unknown"],)),
+                ("not_in", ([to_timestamp(timestamps[1])],)),
+            ):
+                self.assertDictEqual(
+                    getattr(datetime64_timestamp, method)(*args, "columm"),
+                    getattr(object_timestamp, method)(*args, "columm"),
+                    MESSAGE,
+                )
+
+        # A value with another timezone awareness is compared as object.
+        self.assertEqual(
+            Timestamp(pd.DataFrame({"columm": naive})).equal_to(
+                pd.Timestamp(timestamps[0], tz="UTC"), "columm"
+            )["invalid"],
+            6,
+            MESSAGE,
+        )
+        with self.assertRaises(TypeError):
+            Timestamp(pd.DataFrame({"columm": naive})).less_than(
+                pd.Timestamp(timestamps[0], tz="UTC"), "columm"
+            )
+        self.assertEqual(
+            Timestamp(pd.DataFrame({"columm": naive})).equal_to(
+                object(), "columm"
+            )["invalid"],
+            6,
+            MESSAGE,
+        )
+        self.assertEqual(
+            Timestamp(pd.DataFrame({"columm": [1, 2]})).equal_to(
+                timestamps[0], "columm"
+            )["warning"][0]["message"],
+            WarningDataMessage.INVALID_DATA_TYPE,
+            MESSAGE,
+        )
+
+    def test_rule_value_conversion(self):
+        """test_rule_value_conversion."""
+        timestamps = [datetime(2023, 1, day) for day in range(1, 6)]
+        naive = pd.Series(timestamps, dtype="datetime64[s]")
+
+        for value, valid in (
+            ("2023-01-02", 1),
+            (date(2023, 1, 2), 1),
+            (np.datetime64("2023-01-02"), 1),
+            ("unknown", 0),
+            (np.datetime64("NaT"), 0),
+        ):
+            results = [
+                Timestamp(pd.DataFrame({"columm": data})).equal_to(
+                    value, "columm"
+                )
+                for data in (naive, naive.astype(object))
+            ]
+
+            self.assertDictEqual(results[0], results[1], MESSAGE)
+            self.assertEqual(results[0]["valid"], valid, MESSAGE)
+
+        for data in (naive, naive.astype(object)):
+            timestamp = Timestamp(pd.DataFrame({"columm": data}))
+
+            self.assertEqual(
+                timestamp.in_range(
+                    date(2023, 1, 2), "2023-01-04", "columm"
+                )["valid"],
+                3,
+                MESSAGE,
+            )
+            self.assertEqual(
+                timestamp.is_in(["2023-01-02", date(2023, 1, 3)], "columm")[
+                    "valid"
+                ],
+                2,
+                MESSAGE,
+            )
+            with self.assertRaises(TypeError):
+                timestamp.less_than("unknown", "columm")
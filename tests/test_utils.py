@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+
+# Copyright (C) Free Software Foundation, Inc. All rights reserved.
+# Licensed under the AGPL-3.0-only License. See LICENSE in the project root
+# for license information.
+
+"""test_utils."""
+
+import json
+from pydoc import locate
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from datasae.boolean import Boolean
+from datasae.integer import Integer, WarningDataDetailMessage
+from datasae.utils import (
+    AhoCorasick,
+    apply_warning_options,
+    Basic,
+    check_max_warnings,
+    ChunkedResult,
+    code_warning_messages,
+    group_warning_data,
+    create_warning_data,
+    isin,
+    limit_warnings,
+    locate_type,
+    register_type,
+    summarize_values,
+    TYPES,
+    WarningDataMessage,
+    WarningTable
+)
+
+from . import MESSAGE
+
+
+class BasicTest(unittest.TestCase):
+    """BasicTest."""
+
+    def test_type_mask(self):
+        """test_type_mask."""
+        basic = Basic()
+        basic.dataFrame = pd.DataFrame({'columm': [1, 'a', None]})
+
+        self.assertListEqual(
+            basic.type_mask('columm').tolist(), [True, True, True], MESSAGE
+        )
+        self.assertFalse(basic.is_typed('columm'), MESSAGE)
+
+    def test_type_mask_cache(self):
+        """test_type_mask_cache."""
+        integer = Integer(pd.DataFrame({'columm': [1, '2', 3]}))
+
+        with integer.shared_state('columm'):
+            type_mask = integer.type_mask('columm')
+
+            self.assertListEqual(
+                type_mask.tolist(), [True, False, True], MESSAGE
+            )
+            integer.less_than(3, 'columm')
+            integer.in_range(0, 5, 'columm')
+            self.assertIs(integer.type_mask('columm'), type_mask, MESSAGE)
+
+        self.assertDictEqual(integer.__dict__['_cache'], {}, MESSAGE)
+        self.assertIsNot(integer.type_mask('columm'), type_mask, MESSAGE)
+
+    def test_type_mask_data_change(self):
+        """test_type_mask_data_change."""
+        integer = Integer(pd.DataFrame({'columm': [1, '2', 3]}))
+
+        self.assertEqual(integer.less_than(3, 'columm')['valid'], 1, MESSAGE)
+
+        integer.dataFrame = pd.DataFrame({'columm': [1, 2, 3, 'x']})
+        self.assertEqual(integer.less_than(3, 'columm')['valid'], 2, MESSAGE)
+        self.assertEqual(integer.is_in([3], 'columm')['valid'], 1, MESSAGE)
+
+        integer.dataFrame.loc[3, 'columm'] = 0
+        self.assertEqual(integer.less_than(3, 'columm')['valid'], 3, MESSAGE)
+        self.assertNotIn('_cache', integer.__dict__, MESSAGE)
+
+    def test_type_mask_dtype(self):
+        """test_type_mask_dtype."""
+        integer = Integer(pd.DataFrame({'columm': np.arange(5)}))
+        type_mask = integer.type_mask('columm')
+
+        self.assertTrue(integer.is_typed('columm'), MESSAGE)
+        self.assertEqual(type_mask.strides, (0,), MESSAGE)
+        self.assertFalse(type_mask.flags.writeable, MESSAGE)
+        self.assertTrue(type_mask.all(), MESSAGE)
+
+        boolean = Boolean(pd.DataFrame({'columm': [1, 0]}))
+
+        self.assertFalse(boolean.type_mask('columm').any(), MESSAGE)
+        self.assertEqual(boolean.is_bool('columm')['valid'], 0, MESSAGE)
+
+
+class MembershipTest(unittest.TestCase):
+    """MembershipTest."""
+
+    def test_isin(self):
+        """test_isin."""
+        for data, value in [
+            (np.array([1, 2, 3]), [3, 1.0, True]),
+            (np.array([1.5, np.nan, 2.]), [2, 1.5]),
+            (np.array([True, False]), [1]),
+            (np.array([1, '2'], dtype=object), ['1', 2, '2']),
+            (np.array(['2020-01-01'], dtype='datetime64[s]'), [0]),
+            (np.array([5, 6]), [])
+        ]:
+            self.assertListEqual(
+                isin(data, value).tolist(),
+                [item in value for item in data.tolist()],
+                MESSAGE
+            )
+
+    def test_summarize_values(self):
+        """test_summarize_values."""
+        self.assertEqual(summarize_values([1., 2.]), '[1.0, 2.0]', MESSAGE)
+        self.assertEqual(
+            summarize_values(['a', 'b', 'c'], limit=2),
+            "['a', 'b', ... and 1 more]",
+            MESSAGE
+        )
+
+
+class AhoCorasickTest(unittest.TestCase):
+    """AhoCorasickTest."""
+
+    def test_search(self):
+        """test_search."""
+        patterns = ['he', 'she', 'his', 'hers', 'ushe', 'shx']
+        aho_corasick = AhoCorasick(patterns)
+
+        for text in ['ushers', 'ahishe', 'hxe', 'ushx', 'uhs', '', 'h']:
+            self.assertEqual(
+                aho_corasick.search(text),
+                any(pattern in text for pattern in patterns),
+                MESSAGE
+            )
+
+        self.assertTrue(AhoCorasick(['a', '']).search('b'), MESSAGE)
+        self.assertFalse(AhoCorasick([]).search('b'), MESSAGE)
+
+
+class LocateTypeTest(unittest.TestCase):
+    """LocateTypeTest."""
+
+    def test_locate_type(self):
+        """test_locate_type."""
+        TYPES.pop('datasae.boolean.Boolean', None)
+
+        with patch('datasae.utils.locate', wraps=locate) as mock_locate:
+            self.assertIs(locate_type('datasae.boolean.Boolean'), Boolean)
+            self.assertIs(locate_type('datasae.boolean.Boolean'), Boolean)
+            self.assertIsNone(locate_type('datasae.boolean.Unknown'))
+            self.assertIsNone(locate_type('datasae.boolean.Unknown'))
+            self.assertEqual(mock_locate.call_count, 3, MESSAGE)
+
+    def test_register_type(self):
+        """test_register_type."""
+        @register_type('custom.Checker')
+        class Checker(Basic):
+            pass
+
+        with patch('datasae.utils.locate') as mock_locate:
+            self.assertIs(locate_type('custom.Checker'), Checker)
+            self.assertIs(
+                register_type('custom.Integer', Integer), Integer
+            )
+            self.assertIs(locate_type('custom.Integer'), Integer)
+            mock_locate.assert_not_called()
+
+        TYPES.pop('custom.Checker')
+        TYPES.pop('custom.Integer')
+
+
+def less_than(values: list) -> dict:
+    """Run `Integer.less_than` inside `shared_state`, as a plan does."""
+    integer = Integer(pd.DataFrame({'columm': values}))
+
+    with integer.shared_state('columm'):
+        return integer.less_than(2, 'columm')
+
+
+class WarningTableTest(unittest.TestCase):
+    """WarningTableTest."""
+
+    def test_warning_table(self):
+        """test_warning_table."""
+        warning = less_than([1, '2', 3])['warning']
+        excepted_result = {
+            1: create_warning_data(
+                '2',
+                WarningDataDetailMessage.INTEGER_DATA_TYPE,
+                WarningDataMessage.INVALID_DATA_TYPE
+            ),
+            2: create_warning_data(3, 'Value should be less than 2')
+        }
+
+        self.assertIsInstance(warning, WarningTable, MESSAGE)
+        self.assertListEqual(list(warning), [1, 2], MESSAGE)
+        self.assertEqual(len(warning), 2, MESSAGE)
+        self.assertIsNone(warning._WarningTable__dict, MESSAGE)
+        self.assertEqual(warning, excepted_result, MESSAGE)
+        self.assertIs(warning.to_dict(), warning.to_dict(), MESSAGE)
+        self.assertEqual(repr(warning), repr(excepted_result), MESSAGE)
+        self.assertNotIn(0, warning, MESSAGE)
+
+    def test_direct_result(self):
+        """test_direct_result."""
+        result = Integer(
+            pd.DataFrame({'columm': [1, '2', 3]})
+        ).less_than(2, 'columm')
+        excepted_result = {
+            'score': 1 / 3,
+            'valid': 1,
+            'invalid': 2,
+            'warning': {
+                1: create_warning_data(
+                    '2',
+                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
+                    WarningDataMessage.INVALID_DATA_TYPE
+                ),
+                2: create_warning_data(3, 'Value should be less than 2')
+            }
+        }
+
+        self.assertIs(type(result['warning']), dict, MESSAGE)
+        self.assertDictEqual(
+            yaml.safe_load(yaml.safe_dump(result)), excepted_result, MESSAGE
+        )
+        self.assertDictEqual(
+            json.loads(json.dumps(result)),
+            {
+                **excepted_result,
+                'warning': {
+                    str(key): value
+                    for key, value in excepted_result['warning'].items()
+                }
+            },
+            MESSAGE
+        )
+
+    def test_limit_warnings(self):
+        """test_limit_warnings."""
+        result = less_than([5, '2', 3, 4, 1])
+
+        actual_result = limit_warnings(result, 2)
+        self.assertEqual(actual_result['invalid'], 4, MESSAGE)
+        self.assertEqual(actual_result['score'], result['score'], MESSAGE)
+        self.assertEqual(actual_result['warning_truncated'], 2, MESSAGE)
+        self.assertListEqual(list(actual_result['warning']), [0, 1], MESSAGE)
+        self.assertEqual(
+            actual_result['warning'][1], result['warning'][1], MESSAGE
+        )
+
+        for warning in (result['warning'], result['warning'].to_dict()):
+            actual_result = limit_warnings(
+                {**result, 'warning': warning}, 3, sample_warnings=True
+            )
+            self.assertEqual(actual_result['warning_truncated'], 1, MESSAGE)
+            self.assertEqual(len(actual_result['warning']), 3, MESSAGE)
+            self.assertLessEqual(
+                set(actual_result['warning']), {0, 1, 2, 3}, MESSAGE
+            )
+
+        self.assertEqual(
+            limit_warnings(result, 10)['warning'], result['warning'], MESSAGE
+        )
+        self.assertEqual(
+            limit_warnings(result, 10)['warning_truncated'], 0, MESSAGE
+        )
+
+    def test_check_max_warnings(self):
+        """test_check_max_warnings."""
+        result = less_than([5, 1])
+
+        self.assertEqual(check_max_warnings(np.int64(3)), 3, MESSAGE)
+        self.assertEqual(
+            limit_warnings(result, 0)['warning_truncated'], 1, MESSAGE
+        )
+
+        for max_warnings in (-1, 1.5, '10', True, [1]):
+            with self.assertRaises(ValueError, msg=MESSAGE):
+                limit_warnings(result, max_warnings)
+
+            with self.assertRaises(ValueError, msg=MESSAGE):
+                apply_warning_options(
+                    result, max_warnings=max_warnings, group_warnings=True
+                )
+
+            with self.assertRaises(ValueError, msg=MESSAGE):
+                ChunkedResult(max_warnings)
+
+    def test_apply_warning_options(self):
+        """test_apply_warning_options."""
+        result = Integer(
+            pd.DataFrame({'columm': [5, '2', 3, 4, 1]})
+        ).less_than(2, 'columm')
+
+        self.assertNotIn(
+            'warning_truncated', apply_warning_options(result), MESSAGE
+        )
+        self.assertIs(
+            type(apply_warning_options(result)['warning']), dict, MESSAGE
+        )
+        self.assertEqual(
+            apply_warning_options(result)['warning'],
+            result['warning'],
+            MESSAGE
+        )
+        self.assertEqual(
+            apply_warning_options(result, max_warnings=1)[
+                'warning_truncated'
+            ],
+            3,
+            MESSAGE
+        )
+        self.assertEqual(
+            apply_warning_options(5, max_warnings=None), 5, MESSAGE
+        )
+
+    def test_group_warning_data(self):
+        """test_group_warning_data."""
+        result = less_than([5, 5, 5, 1, 5, 'x', 'x', 7, 5])
+        excepted_result = [
+            {
+                **create_warning_data(5, 'Value should be less than 2'),
+                'count': 5,
+                'rows': [[0, 2], [4, 4], [8, 8]]
+            },
+            {
+                **create_warning_data(
+                    'x',
+                    WarningDataDetailMessage.INTEGER_DATA_TYPE,
+                    WarningDataMessage.INVALID_DATA_TYPE
+                ),
+                'count': 2,
+                'rows': [[5, 6]]
+            },
+            {
+                **create_warning_data(7, 'Value should be less than 2'),
+                'count': 1,
+                'rows': [[7, 7]]
+            }
+        ]
+
+        for warning in (result['warning'], result['warning'].to_dict()):
+            actual_result = group_warning_data({**result, 'warning': warning})
+            self.assertEqual(actual_result['invalid'], 8, MESSAGE)
+            self.assertListEqual(
+                actual_result['warning'], excepted_result, MESSAGE
+            )
+
+        self.assertDictEqual(
+            apply_warning_options(
+                less_than([5, 5, 'x']),
+                group_warnings=True,
+                max_warnings=1
+            ),
+            {
+                'score': 0.,
+                'valid': 0,
+                'invalid': 3,
+                'warning': [{
+                    **create_warning_data(5, 'Value should be less than 2'),
+                    'count': 2,
+                    'rows': [[0, 1]]
+                }],
+                'warning_truncated': 1
+            },
+            MESSAGE
+        )
+        self.assertListEqual(
+            limit_warnings(
+                group_warning_data(result), 2
+            )['warning'],
+            excepted_result[:2],
+            MESSAGE
+        )
+        self.assertListEqual(
+            WarningTable.from_dict({
+                1: create_warning_data([1], 'detail'),
+                2: create_warning_data([1], 'detail')
+            }).group(),
+            [{**create_warning_data([1], 'detail'), 'count': 2, 'rows': [
+                [1, 2]
+            ]}],
+            MESSAGE
+        )
+
+    def test_code_warning_messages(self):
+        """test_code_warning_messages."""
+        result = less_than([5, 'x', 5, 1])
+        warning_messages = [
+            {
+                'message': WarningDataMessage.INVALID_VALUE,
+                'detail_message': 'Value should be less than 2'
+            },
+            {
+                'message': WarningDataMessage.INVALID_DATA_TYPE,
+                'detail_message': WarningDataDetailMessage.INTEGER_DATA_TYPE
+            }
+        ]
+
+        self.assertIs(
+            result['warning'][0]['detail_message'],
+            result['warning'][2]['detail_message'],
+            MESSAGE
+        )
+
+        for warning in (result['warning'], result['warning'].to_dict()):
+            actual_result = code_warning_messages(
+                {**result, 'warning': warning}
+            )
+            self.assertEqual(
+                actual_result['warning'],
+                {
+                    0: {'message_code': 0, 'value': 5},
+                    1: {'message_code': 1, 'value': 'x'},
+                    2: {'message_code': 0, 'value': 5}
+                },
+                MESSAGE
+            )
+            self.assertListEqual(
+                actual_result['warning_messages'], warning_messages, MESSAGE
+            )
+
+        actual_result = apply_warning_options(
+            less_than([5, 'x', 5]),
+            group_warnings=True,
+            message_codes=True
+        )
+        self.assertListEqual(
+            actual_result['warning'],
+            [
+                {'message_code': 0, 'value': 5, 'count': 2, 'rows': [
+                    [0, 0], [2, 2]
+                ]},
+                {'message_code': 1, 'value': 'x', 'count': 1, 'rows': [
+                    [1, 1]
+                ]}
+            ],
+            MESSAGE
+        )
+        self.assertListEqual(
+            actual_result['warning_messages'], warning_messages, MESSAGE
+        )
+        self.assertListEqual(
+            WarningTable.from_dict({}).group(),
+            [],
+            MESSAGE
+        )
+
+    def test_chunked_result(self):
+        """test_chunked_result."""
+        values = [5, 'x', 5, 1, 'y', 7, 0]
+        result = less_than(values)
+
+        for options, expected in (
+            ({}, result),
+            ({'max_warnings': 2}, limit_warnings(result, 2)),
+            (
+                {'max_warnings': 2, 'group_warnings': True},
+                limit_warnings(group_warning_data(result), 2)
+            )
+        ):
+            chunked_result = ChunkedResult(**options)
+
+            for start in range(0, len(values), 3):
+                chunk = less_than(values[start:start + 3])
+                chunked_result.add(
+                    {**chunk, 'warning': chunk['warning'].to_dict()}
+                    if start else chunk,
+                    len(values[start:start + 3])
+                )
+
+            actual_result = chunked_result()
+
+            if options.get('group_warnings'):
+                actual_result = limit_warnings(
+                    group_warning_data(actual_result), 2
+                )
+            elif options:
+                actual_result = limit_warnings(actual_result, 2)
+
+            self.assertEqual(chunked_result.rows, len(values), MESSAGE)
+            self.assertEqual(actual_result, expected, MESSAGE)
+
+        chunked_result = ChunkedResult(3, sample_warnings=True)
+
+        for start in range(0, len(values), 2):
+            chunked_result.add(
+                less_than(values[start:start + 2]),
+                len(values[start:start + 2])
+            )
+
+        actual_result = limit_warnings(chunked_result(), 3, True)
+        self.assertEqual(actual_result['invalid'], 5, MESSAGE)
+        self.assertEqual(actual_result['warning_truncated'], 2, MESSAGE)
+        self.assertLessEqual(
+            set(actual_result['warning']), {0, 1, 2, 4, 5}, MESSAGE
+        )
+        self.assertEqual(
+            ChunkedResult()(),
+            {'score': 0, 'valid': 0, 'invalid': 0, 'warning': {}},
+            MESSAGE
+        )
+
+        chunk = less_than([5, 1])
+
+        for max_warnings in (0, 3):
+            chunked_result = ChunkedResult(max_warnings, sample_warnings=True)
+
+            for _ in range(20):
+                chunked_result.add(chunk, 2)
+
+            actual_result = chunked_result()
+            self.assertEqual(actual_result['invalid'], 20, MESSAGE)
+            self.assertEqual(
+                actual_result['warning_truncated'], 20 - max_warnings, MESSAGE
+            )
+            self.assertEqual(
+                len(actual_result['warning']), max_warnings, MESSAGE
+            )
+            self.assertLessEqual(
+                set(actual_result['warning']), set(range(0, 40, 2)), MESSAGE
+            )
+
+        chunked_result = ChunkedResult(3)
+
+        with patch.object(
+            WarningTable, 'from_dict', wraps=WarningTable.from_dict
+        ) as from_dict:
+            for _ in range(20):
+                chunked_result.add(chunk, 2)
+
+        self.assertEqual(from_dict.call_count, 3, MESSAGE)
+        self.assertListEqual(
+            list(chunked_result()['warning']), [0, 2, 4], MESSAGE
+        )
+        self.assertEqual(
+            chunked_result()['warning_truncated'], 17, MESSAGE
+        )